@@ -1,8 +1,9 @@
 from .default import DefaultSettings
-from .utils import get_settings
+from .utils import get_settings, reload_settings
 
 
 __all__ = [
     'DefaultSettings',
     'get_settings',
+    'reload_settings',
 ]
@@ -67,6 +67,113 @@ class DefaultSettings(BaseSettings):
         env='YANDEX_CONTEST_API_URL',
     )
     YANDEX_API_KEY: str = Field('', env='YANDEX_API_KEY')
+    YANDEX_API_MAX_CONNECTIONS: int = Field(
+        20, env='YANDEX_API_MAX_CONNECTIONS'
+    )
+    YANDEX_API_MAX_KEEPALIVE_CONNECTIONS: int = Field(
+        10, env='YANDEX_API_MAX_KEEPALIVE_CONNECTIONS'
+    )
+    YANDEX_API_KEEPALIVE_EXPIRY: float = Field(
+        30.0, env='YANDEX_API_KEEPALIVE_EXPIRY'
+    )
+    YANDEX_API_HTTP2: bool = Field(False, env='YANDEX_API_HTTP2')
+    # requests per second for one token, 0 - no limit
+    YANDEX_API_RATE_LIMIT: float = Field(20.0, env='YANDEX_API_RATE_LIMIT')
+    YANDEX_API_RATE_BURST: int = Field(20, env='YANDEX_API_RATE_BURST')
+    YANDEX_API_MAX_CONCURRENCY: int = Field(
+        10, env='YANDEX_API_MAX_CONCURRENCY'
+    )
+    # retries on 429 and 5xx responses
+    YANDEX_API_RETRY_COUNT: int = Field(3, env='YANDEX_API_RETRY_COUNT')
+    YANDEX_API_BACKOFF_BASE: float = Field(0.5, env='YANDEX_API_BACKOFF_BASE')
+    YANDEX_API_BACKOFF_MAX: float = Field(30.0, env='YANDEX_API_BACKOFF_MAX')
+    # pages of submissions list fetched concurrently, 1 - one by one
+    YANDEX_SUBMISSIONS_PAGES_FAN_OUT: int = Field(
+        4, env='YANDEX_SUBMISSIONS_PAGES_FAN_OUT'
+    )
+    YANDEX_SUBMISSIONS_BATCH_SIZE: int = Field(
+        100, env='YANDEX_SUBMISSIONS_BATCH_SIZE'
+    )
+    YANDEX_SUBMISSIONS_BATCH_CONCURRENCY: int = Field(
+        4, env='YANDEX_SUBMISSIONS_BATCH_CONCURRENCY'
+    )
+    # seconds, batches are shrunk if requests are slower
+    YANDEX_SUBMISSIONS_BATCH_TARGET_LATENCY: float = Field(
+        10.0, env='YANDEX_SUBMISSIONS_BATCH_TARGET_LATENCY'
+    )
+    # seconds, no new batches of submissions of contest are requested
+    # after it, the rest is fetched on the next sync
+    YANDEX_SUBMISSIONS_FETCH_BUDGET: int = Field(
+        300, env='YANDEX_SUBMISSIONS_FETCH_BUDGET'
+    )
+
+    # seconds, contest participants index is refreshed after it
+    CONTEST_PARTICIPANTS_TTL: int = Field(3600, env='CONTEST_PARTICIPANTS_TTL')
+
+    # process new submissions of contest by bulk statements
+    # in one transaction instead of a transaction per submission
+    UPDATE_RESULTS_BULK_INGESTION: bool = Field(
+        True, env='UPDATE_RESULTS_BULK_INGESTION'
+    )
+    # seconds, levels of all students are evaluated once in it,
+    # otherwise only students with changed scores, 0 - every run
+    UPDATE_RESULTS_FULL_RECOMPUTE_INTERVAL: int = Field(
+        86400, env='UPDATE_RESULTS_FULL_RECOMPUTE_INTERVAL'
+    )
+    # seconds, submission without verdict is checked again after it,
+    # the interval doubles with every check up to the max one
+    NO_VERDICT_CHECK_INTERVAL: int = Field(
+        600, env='NO_VERDICT_CHECK_INTERVAL'
+    )
+    NO_VERDICT_CHECK_MAX_INTERVAL: int = Field(
+        86400, env='NO_VERDICT_CHECK_MAX_INTERVAL'
+    )
+    # scheduler only enqueues contest syncs and course results
+    # into celery workers instead of processing them itself
+    UPDATE_RESULTS_FAN_OUT: bool = Field(False, env='UPDATE_RESULTS_FAN_OUT')
+    # courses and contests of courses processed at once
+    # by update_results job, 1 - one by one
+    UPDATE_RESULTS_CONCURRENCY: int = Field(
+        1, env='UPDATE_RESULTS_CONCURRENCY'
+    )
+
+    # seconds, contests are polled every CONTEST_POLL_MIN_INTERVAL around
+    # deadline and at most CONTEST_POLL_IDLE_INTERVAL by submission rate
+    CONTEST_POLL_MIN_INTERVAL: int = Field(60, env='CONTEST_POLL_MIN_INTERVAL')
+    CONTEST_POLL_IDLE_INTERVAL: int = Field(
+        3600, env='CONTEST_POLL_IDLE_INTERVAL'
+    )
+    # seconds, for contests with no submissions long after deadline
+    CONTEST_POLL_DORMANT_INTERVAL: int = Field(
+        86400, env='CONTEST_POLL_DORMANT_INTERVAL'
+    )
+    # seconds before and after deadline when contest is polled most often
+    CONTEST_POLL_DEADLINE_WINDOW: int = Field(
+        86400, env='CONTEST_POLL_DEADLINE_WINDOW'
+    )
+    # seconds after deadline when contest with no submissions is dormant
+    CONTEST_POLL_DORMANT_AFTER: int = Field(
+        14 * 86400, env='CONTEST_POLL_DORMANT_AFTER'
+    )
+    # seconds, half-life of submissions rate of contest
+    CONTEST_POLL_RATE_HALF_LIFE: int = Field(
+        3600, env='CONTEST_POLL_RATE_HALF_LIFE'
+    )
+    # seconds, sync_contests job stops syncing new contests after it
+    CONTEST_SYNC_TIME_BUDGET: int = Field(50, env='CONTEST_SYNC_TIME_BUDGET')
+    # seconds, claim of contest sync by celery task expires after it
+    CONTEST_SYNC_CLAIM_TTL: int = Field(900, env='CONTEST_SYNC_CLAIM_TTL')
+    # seconds, /results/by-course sends celery task if results are
+    # not got in it, 0 - always send
+    RESULTS_BY_COURSE_TIME_BUDGET: float = Field(
+        1.0, env='RESULTS_BY_COURSE_TIME_BUDGET'
+    )
+    # batches of more students are streamed as NDJSON
+    RESULTS_BATCH_STREAM_THRESHOLD: int = Field(
+        100, env='RESULTS_BATCH_STREAM_THRESHOLD'
+    )
+    # seconds, the longest wait of task result by long poll or stream
+    TASK_RESULT_MAX_WAIT: int = Field(60, env='TASK_RESULT_MAX_WAIT')
 
     TG_HELPER_BOT_TOKEN: str = Field(
         '1234567890:ABCDEFGHIJKLMNOPQRSTUVWXYZabcdefghijklmnopqrstuvwxyz1234',
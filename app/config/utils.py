@@ -1,10 +1,18 @@
+from functools import lru_cache
 from os import environ
 
 from .default import DefaultSettings
 from .production import ProductionSettings
 
 
+@lru_cache
 def get_settings() -> DefaultSettings:  # pragma: no cover
+    """
+    Get settings of the process.
+
+    Settings are read from environment and .env file once and cached,
+    use reload_settings to read them again.
+    """
     env = environ.get('ENV', 'local')
     if env == 'local':
         return DefaultSettings()
@@ -14,3 +22,13 @@ def get_settings() -> DefaultSettings:  # pragma: no cover
     # space for other settings
     # ...
     return DefaultSettings()  # fallback to default
+
+
+def reload_settings() -> DefaultSettings:
+    """
+    Read settings again, e.g. after environment is changed.
+
+    Modules which keep settings got at import are not affected.
+    """
+    get_settings.cache_clear()
+    return get_settings()
@@ -17,8 +17,11 @@ from uvicorn.protocols import utils
 from app import logger_config
 from app.config import DefaultSettings, get_settings
 from app.database.admin.creator import get_sqladmin
+from app.database.connection import SessionManager
 from app.endpoints import list_of_routes
 from app.limiter import limiter
+from app.utils import celery_task as celery_task_utils
+from app.utils import yandex_request
 
 
 def _get_log_data_from_headers(
@@ -173,6 +176,14 @@ def get_app(set_up_logger: bool = True) -> FastAPI:
 
     _ = get_sqladmin(application)
 
+    application.add_event_handler(
+        'shutdown', yandex_request.close_yandex_client
+    )
+    application.add_event_handler('shutdown', SessionManager().dispose)
+    application.add_event_handler(
+        'shutdown', celery_task_utils.close_redis_client
+    )
+
     application.state.limiter = limiter
     application.add_exception_handler(
         slowapi_errors.RateLimitExceeded,
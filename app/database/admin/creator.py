@@ -9,8 +9,6 @@ from .security import SqlAdminAuthBackend
 
 
 def get_sqladmin(app: FastAPI) -> Admin:
-    SessionManager().refresh()
-
     admin = Admin(
         app,
         SessionManager().async_engine,
@@ -7,6 +7,8 @@ tablename_to_model = {
     'contest': models.Contest,
     'contest_group': models.ContestGroup,
     'contest_levels': models.ContestLevels,
+    'contest_participant': models.ContestParticipant,
+    'contest_sync_state': models.ContestSyncState,
     'course': models.Course,
     'course_levels': models.CourseLevels,
     'department': models.Department,
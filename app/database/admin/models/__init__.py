@@ -3,6 +3,8 @@
 from .contest import ContestAdmin
 from .contest_group import ContestGroupAdmin
 from .contest_levels import ContestLevelsAdmin
+from .contest_participant import ContestParticipantAdmin
+from .contest_sync_state import ContestSyncStateAdmin
 from .course import CourseAdmin
 from .course_levels import CourseLevelsAdmin
 from .department import DepartmentAdmin
@@ -25,6 +27,8 @@ model_view_list = [
     ContestAdmin,
     ContestGroupAdmin,
     ContestLevelsAdmin,
+    ContestParticipantAdmin,
+    ContestSyncStateAdmin,
     CourseAdmin,
     CourseLevelsAdmin,
     DepartmentAdmin,
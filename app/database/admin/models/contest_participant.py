@@ -0,0 +1,19 @@
+# Code generated automatically.
+# pylint: disable=duplicate-code
+
+from sqladmin import ModelView
+
+from app.database import models
+from app.database.admin import models_forms
+
+
+class ContestParticipantAdmin(ModelView, model=models.ContestParticipant):
+    _column_list = ['id', 'contest_id', 'login', 'author_id']
+    column_list = ['id', 'contest_id', 'login', 'author_id']
+    form_excluded_columns = ['id', 'dt_created', 'dt_updated']
+    form_include_pk = True
+    name_plural = 'ContestParticipants'
+    column_default_sort = 'contest_id'
+
+    form_overrides = models_forms.get_form_overrides(['contest'])
+    form_args = models_forms.get_form_args(['contest'])
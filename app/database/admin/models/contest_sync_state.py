@@ -0,0 +1,37 @@
+# Code generated automatically.
+# pylint: disable=duplicate-code
+
+from sqladmin import ModelView
+
+from app.database import models
+from app.database.admin import models_forms
+
+
+class ContestSyncStateAdmin(ModelView, model=models.ContestSyncState):
+    _column_list = [
+        'id',
+        'contest_id',
+        'last_run_id',
+        'remote_count',
+        'synced_at',
+        'sync_duration',
+        'submissions_rate',
+        'next_sync_at',
+    ]
+    column_list = [
+        'id',
+        'contest_id',
+        'last_run_id',
+        'remote_count',
+        'synced_at',
+        'sync_duration',
+        'submissions_rate',
+        'next_sync_at',
+    ]
+    form_excluded_columns = ['id', 'dt_created', 'dt_updated']
+    form_include_pk = True
+    name_plural = 'ContestSyncStates'
+    column_default_sort = 'contest_id'
+
+    form_overrides = models_forms.get_form_overrides(['contest'])
+    form_args = models_forms.get_form_args(['contest'])
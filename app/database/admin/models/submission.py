@@ -23,6 +23,8 @@ class SubmissionAdmin(ModelView, model=models.Submission):
         'score_before_finish',
         'submission_link',
         'submission_time',
+        'verdict_checks_count',
+        'next_verdict_check_at',
     ]
     column_list = [
         'id',
@@ -39,6 +41,8 @@ class SubmissionAdmin(ModelView, model=models.Submission):
         'score_before_finish',
         'submission_link',
         'submission_time',
+        'verdict_checks_count',
+        'next_verdict_check_at',
     ]
     form_excluded_columns = ['id', 'dt_created', 'dt_updated']
     form_include_pk = True
@@ -1,9 +1,15 @@
+import asyncio
 import functools
+import os
 import typing as tp
 from contextlib import asynccontextmanager, contextmanager
 
 import sqlalchemy as sa
-from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine
+from sqlalchemy.ext.asyncio import (
+    AsyncEngine,
+    AsyncSession,
+    create_async_engine,
+)
 from sqlalchemy.orm import Session, sessionmaker
 
 from app.config import get_settings
@@ -22,42 +28,124 @@ class SessionManager:  # pragma: no cover
         'pool_timeout': 60,
     }
 
-    def __init__(self) -> None:
-        self.refresh()
-
     def __new__(cls) -> 'SessionManager':
         if not hasattr(cls, 'instance'):
             cls.instance = super(SessionManager, cls).__new__(cls)
-            cls.instance.engine = None  # type: ignore
-            cls.instance.async_engine = None  # type: ignore
+            cls.instance.pid = os.getpid()  # type: ignore
+            cls.instance.sync_engine = None  # type: ignore
+            # event loop -> engine, None is loop which is not started yet
+            cls.instance.async_engines = {}  # type: ignore
         return cls.instance  # noqa
 
+    @property
+    def engine(self) -> sa.engine.Engine:
+        """
+        Sync engine of the process, created once.
+        """
+        self._check_pid()
+        if self.sync_engine is None:  # type: ignore
+            self.sync_engine = sa.create_engine(
+                get_settings().database_uri_sync,
+                **self.ENGINE_KWARGS,
+            )
+        return self.sync_engine  # type: ignore
+
+    @property
+    def async_engine(self) -> AsyncEngine:
+        """
+        Async engine of the running event loop, created once.
+
+        Connections of asyncpg can be used only in the loop they are
+        opened in, so every loop has its own engine. Engine created
+        out of a loop, e.g. for sqladmin, is taken by the first loop
+        which uses it. Engines of closed loops, e.g. left by celery
+        tasks run by async_to_sync, are dropped.
+        """
+        self._check_pid()
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            loop = None
+        engines: dict[
+            asyncio.AbstractEventLoop | None, AsyncEngine
+        ] = self.async_engines  # type: ignore
+        for closed_loop in [
+            item for item in engines if item is not None and item.is_closed()
+        ]:
+            # connections of closed loop can not be closed anymore
+            engines.pop(closed_loop).sync_engine.dispose(close=False)
+        if loop not in engines:
+            engines[loop] = (
+                engines.pop(None)
+                if None in engines
+                else create_async_engine(
+                    get_settings().database_uri,
+                    future=True,
+                    pool_pre_ping=True,
+                    **self.ENGINE_KWARGS,
+                )
+            )
+        return engines[loop]
+
+    def _check_pid(self) -> None:
+        # pools must not be shared with the parent process after fork
+        if self.pid != os.getpid():  # type: ignore
+            self.refresh()
+            self.pid = os.getpid()
+
     def get_session_maker(self) -> sessionmaker:
-        return sessionmaker(bind=self.engine)  # type: ignore
+        return sessionmaker(bind=self.engine)
 
     def get_async_session_maker(self) -> sessionmaker:
         return sessionmaker(
-            self.async_engine,  # type: ignore
+            self.async_engine,
             class_=AsyncSession,
             expire_on_commit=False,
         )
 
     def refresh(self) -> None:
-        settings = get_settings()
-        if self.engine:  # type: ignore
-            self.engine.dispose()  # type: ignore
-        if self.async_engine:  # type: ignore
-            self.async_engine.dispose()  # type: ignore
-        self.engine = sa.create_engine(
-            settings.database_uri_sync,
-            **self.ENGINE_KWARGS,
-        )
-        self.async_engine = create_async_engine(
-            settings.database_uri,
-            future=True,
-            pool_pre_ping=True,
-            **self.ENGINE_KWARGS,
+        """
+        Drop engines, so new ones are created with current settings.
+
+        Connections of dropped engines are not closed, use dispose
+        to close them.
+        """
+        if self.sync_engine is not None:  # type: ignore
+            self.sync_engine.dispose(close=False)
+            self.sync_engine = None
+        for engine in self.async_engines.values():  # type: ignore
+            engine.sync_engine.dispose(close=False)
+        self.async_engines.clear()  # type: ignore
+
+    async def dispose(self) -> None:
+        """
+        Close connections of engines and drop them.
+
+        Only connections of the running loop can be closed, connections
+        of other loops are dropped.
+        """
+        engine = self.async_engines.pop(  # type: ignore
+            asyncio.get_running_loop(), None
         )
+        if engine is not None:
+            await engine.dispose()
+        if self.sync_engine is not None:  # type: ignore
+            self.sync_engine.dispose()
+            self.sync_engine = None
+        self.refresh()
+
+    def get_pool_status(self) -> dict[str, int]:
+        """
+        Get status of connection pool of the running event loop.
+        """
+        pool = self.async_engine.sync_engine.pool
+        return {
+            'size': pool.size(),  # type: ignore
+            'checked_in': pool.checkedin(),  # type: ignore
+            'checked_out': pool.checkedout(),  # type: ignore
+            'overflow': pool.overflow(),  # type: ignore
+            'engines': len(self.async_engines),  # type: ignore
+        }
 
     @contextmanager
     def create_session(self, **kwargs: tp.Any) -> Session:
@@ -83,10 +171,27 @@ class SessionManager:  # pragma: no cover
             finally:
                 await new_session.close()
 
+    @asynccontextmanager
+    async def create_read_only_async_session(
+        self, **kwargs: tp.Any
+    ) -> AsyncSession:
+        """
+        Create session in READ ONLY transaction, so any write fails
+        and the session can be served by a replica.
+        """
+        kwargs.setdefault('autoflush', False)
+        async with self.create_async_session(**kwargs) as new_session:
+            await new_session.execute(sa.text('SET TRANSACTION READ ONLY'))
+            yield new_session
+
     async def get_async_session(self) -> AsyncSession:
         async with self.create_async_session() as session:
             yield session
 
+    async def get_read_only_async_session(self) -> AsyncSession:
+        async with self.create_read_only_async_session() as session:
+            yield session
+
     def with_session(self, func: tp.Callable) -> tp.Callable:  # type: ignore
         @functools.wraps(func)
         async def wrapper(*args: tp.Any, **kwargs: tp.Any) -> tp.Any:
@@ -0,0 +1,72 @@
+"""contest participant
+
+Revision ID: 04e48e81fe02
+Revises: b5bcf29a1342
+Create Date: 2026-10-18 15:14:02.512844
+
+"""
+
+import sqlalchemy as sa
+from alembic import op
+from sqlalchemy.dialects import postgresql
+
+
+# revision identifiers, used by Alembic.
+revision = '04e48e81fe02'
+down_revision = 'b5bcf29a1342'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        'contest_participant',
+        sa.Column(
+            'id',
+            postgresql.UUID(as_uuid=True),
+            server_default=sa.text('gen_random_uuid()'),
+            nullable=False,
+        ),
+        sa.Column(
+            'dt_created',
+            sa.TIMESTAMP(timezone=True),
+            server_default=sa.text('CURRENT_TIMESTAMP'),
+            nullable=False,
+        ),
+        sa.Column(
+            'dt_updated',
+            sa.TIMESTAMP(timezone=True),
+            server_default=sa.text('CURRENT_TIMESTAMP'),
+            nullable=False,
+        ),
+        sa.Column('contest_id', postgresql.UUID(as_uuid=True), nullable=False),
+        sa.Column('login', sa.String(), nullable=False),
+        sa.Column('author_id', sa.Integer(), nullable=False),
+        sa.ForeignKeyConstraint(
+            ['contest_id'],
+            ['contest.id'],
+            name=op.f('fk__contest_participant__contest_id__contest'),
+            ondelete='CASCADE',
+        ),
+        sa.PrimaryKeyConstraint('id', name=op.f('pk__contest_participant')),
+        sa.UniqueConstraint(
+            'contest_id',
+            'login',
+            name=op.f('uq__contest_participant__contest_id_login'),
+        ),
+        sa.UniqueConstraint('id', name=op.f('uq__contest_participant__id')),
+    )
+    op.create_index(
+        op.f('ix__contest_participant__contest_id'),
+        'contest_participant',
+        ['contest_id'],
+        unique=False,
+    )
+
+
+def downgrade() -> None:
+    op.drop_index(
+        op.f('ix__contest_participant__contest_id'),
+        table_name='contest_participant',
+    )
+    op.drop_table('contest_participant')
@@ -0,0 +1,42 @@
+"""submission verdict checks
+
+Revision ID: 4f6b2a8c1d37
+Revises: d3a9f5e17c20
+Create Date: 2026-10-18 23:47:12.305114
+
+"""
+
+import sqlalchemy as sa
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision = '4f6b2a8c1d37'
+down_revision = 'd3a9f5e17c20'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.add_column(
+        'submission',
+        sa.Column(
+            'verdict_checks_count',
+            sa.Integer(),
+            server_default='0',
+            nullable=False,
+        ),
+    )
+    op.add_column(
+        'submission',
+        sa.Column(
+            'next_verdict_check_at',
+            sa.TIMESTAMP(timezone=True),
+            nullable=True,
+        ),
+    )
+
+
+def downgrade() -> None:
+    op.drop_column('submission', 'next_verdict_check_at')
+    op.drop_column('submission', 'verdict_checks_count')
@@ -0,0 +1,80 @@
+"""student levels uq
+
+Revision ID: 5e8d1b2c7a90
+Revises: 9c31f0a7d2e4
+Create Date: 2026-10-18 20:05:41.127390
+
+"""
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision = '5e8d1b2c7a90'
+down_revision = '9c31f0a7d2e4'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    # achieved levels of duplicates are merged into the kept row
+    op.execute(
+        'UPDATE student_course_levels AS l SET is_ok = m.is_ok '
+        'FROM ('
+        'SELECT student_id, course_level_id, bool_or(is_ok) AS is_ok '
+        'FROM student_course_levels '
+        'GROUP BY student_id, course_level_id '
+        'HAVING count(*) > 1'
+        ') AS m '
+        'WHERE l.student_id = m.student_id '
+        'AND l.course_level_id = m.course_level_id'
+    )
+    op.execute(
+        'UPDATE student_contest_levels AS l SET is_ok = m.is_ok '
+        'FROM ('
+        'SELECT student_id, contest_level_id, bool_or(is_ok) AS is_ok '
+        'FROM student_contest_levels '
+        'GROUP BY student_id, contest_level_id '
+        'HAVING count(*) > 1'
+        ') AS m '
+        'WHERE l.student_id = m.student_id '
+        'AND l.contest_level_id = m.contest_level_id'
+    )
+    # the oldest row of student and level is kept
+    op.execute(
+        'DELETE FROM student_course_levels AS a '
+        'USING student_course_levels AS b '
+        'WHERE a.student_id = b.student_id '
+        'AND a.course_level_id = b.course_level_id '
+        'AND (a.dt_created, a.id) > (b.dt_created, b.id)'
+    )
+    op.execute(
+        'DELETE FROM student_contest_levels AS a '
+        'USING student_contest_levels AS b '
+        'WHERE a.student_id = b.student_id '
+        'AND a.contest_level_id = b.contest_level_id '
+        'AND (a.dt_created, a.id) > (b.dt_created, b.id)'
+    )
+    op.create_unique_constraint(
+        op.f('uq__student_course_levels__student_id_course_level_id'),
+        'student_course_levels',
+        ['student_id', 'course_level_id'],
+    )
+    op.create_unique_constraint(
+        op.f('uq__student_contest_levels__student_id_contest_level_id'),
+        'student_contest_levels',
+        ['student_id', 'contest_level_id'],
+    )
+
+
+def downgrade() -> None:
+    op.drop_constraint(
+        op.f('uq__student_contest_levels__student_id_contest_level_id'),
+        'student_contest_levels',
+        type_='unique',
+    )
+    op.drop_constraint(
+        op.f('uq__student_course_levels__student_id_course_level_id'),
+        'student_course_levels',
+        type_='unique',
+    )
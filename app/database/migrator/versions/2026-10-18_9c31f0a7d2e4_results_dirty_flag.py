@@ -0,0 +1,33 @@
+"""results dirty flag
+
+Revision ID: 9c31f0a7d2e4
+Revises: 04e48e81fe02
+Create Date: 2026-10-18 18:42:10.318256
+
+"""
+
+import sqlalchemy as sa
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision = '9c31f0a7d2e4'
+down_revision = '04e48e81fe02'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.add_column(
+        'student_course',
+        sa.Column(
+            'is_results_dirty',
+            sa.Boolean(),
+            server_default='true',
+            nullable=False,
+        ),
+    )
+
+
+def downgrade() -> None:
+    op.drop_column('student_course', 'is_results_dirty')
@@ -0,0 +1,93 @@
+"""hot path indexes
+
+Revision ID: a61c3e9b5f24
+Revises: 4f6b2a8c1d37
+Create Date: 2026-10-18 23:48:12.603518
+
+"""
+
+import sqlalchemy as sa
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision = 'a61c3e9b5f24'
+down_revision = '4f6b2a8c1d37'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    # indexes are built without locking writes of sync jobs
+    with op.get_context().autocommit_block():
+        op.create_index(
+            op.f('ix__submission__contest_id_run_id'),
+            'submission',
+            ['contest_id', 'run_id'],
+            postgresql_concurrently=True,
+        )
+        op.create_index(
+            op.f('ix__submission__run_id'),
+            'submission',
+            ['run_id'],
+            postgresql_concurrently=True,
+        )
+        op.create_index(
+            op.f('ix__submission__next_verdict_check_at'),
+            'submission',
+            ['next_verdict_check_at'],
+            postgresql_where=sa.text("verdict = 'No report'"),
+            postgresql_concurrently=True,
+        )
+        op.create_index(
+            op.f('ix__student_task__student_id_task_id'),
+            'student_task',
+            ['student_id', 'task_id'],
+            postgresql_concurrently=True,
+        )
+        op.create_index(
+            op.f('ix__student_contest__student_id_contest_id'),
+            'student_contest',
+            ['student_id', 'contest_id'],
+            postgresql_concurrently=True,
+        )
+        op.create_index(
+            op.f('ix__student_course__student_id_course_id'),
+            'student_course',
+            ['student_id', 'course_id'],
+            postgresql_concurrently=True,
+        )
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.drop_index(
+            op.f('ix__student_course__student_id_course_id'),
+            table_name='student_course',
+            postgresql_concurrently=True,
+        )
+        op.drop_index(
+            op.f('ix__student_contest__student_id_contest_id'),
+            table_name='student_contest',
+            postgresql_concurrently=True,
+        )
+        op.drop_index(
+            op.f('ix__student_task__student_id_task_id'),
+            table_name='student_task',
+            postgresql_concurrently=True,
+        )
+        op.drop_index(
+            op.f('ix__submission__next_verdict_check_at'),
+            table_name='submission',
+            postgresql_concurrently=True,
+        )
+        op.drop_index(
+            op.f('ix__submission__run_id'),
+            table_name='submission',
+            postgresql_concurrently=True,
+        )
+        op.drop_index(
+            op.f('ix__submission__contest_id_run_id'),
+            table_name='submission',
+            postgresql_concurrently=True,
+        )
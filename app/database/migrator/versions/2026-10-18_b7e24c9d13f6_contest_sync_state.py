@@ -0,0 +1,71 @@
+"""contest sync state
+
+Revision ID: b7e24c9d13f6
+Revises: 5e8d1b2c7a90
+Create Date: 2026-10-18 21:12:37.604218
+
+"""
+
+import sqlalchemy as sa
+from alembic import op
+from sqlalchemy.dialects import postgresql
+
+
+# revision identifiers, used by Alembic.
+revision = 'b7e24c9d13f6'
+down_revision = '5e8d1b2c7a90'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        'contest_sync_state',
+        sa.Column(
+            'id',
+            postgresql.UUID(as_uuid=True),
+            server_default=sa.text('gen_random_uuid()'),
+            nullable=False,
+        ),
+        sa.Column(
+            'dt_created',
+            sa.TIMESTAMP(timezone=True),
+            server_default=sa.text('CURRENT_TIMESTAMP'),
+            nullable=False,
+        ),
+        sa.Column(
+            'dt_updated',
+            sa.TIMESTAMP(timezone=True),
+            server_default=sa.text('CURRENT_TIMESTAMP'),
+            nullable=False,
+        ),
+        sa.Column('contest_id', postgresql.UUID(as_uuid=True), nullable=False),
+        sa.Column(
+            'last_run_id', sa.Integer(), server_default='-1', nullable=False
+        ),
+        sa.Column('remote_count', sa.Integer(), nullable=True),
+        sa.Column('synced_at', sa.TIMESTAMP(timezone=True), nullable=True),
+        sa.Column('sync_duration', sa.Float(), nullable=True),
+        sa.ForeignKeyConstraint(
+            ['contest_id'],
+            ['contest.id'],
+            name=op.f('fk__contest_sync_state__contest_id__contest'),
+            ondelete='CASCADE',
+        ),
+        sa.PrimaryKeyConstraint('id', name=op.f('pk__contest_sync_state')),
+        sa.UniqueConstraint('id', name=op.f('uq__contest_sync_state__id')),
+    )
+    op.create_index(
+        op.f('ix__contest_sync_state__contest_id'),
+        'contest_sync_state',
+        ['contest_id'],
+        unique=True,
+    )
+
+
+def downgrade() -> None:
+    op.drop_index(
+        op.f('ix__contest_sync_state__contest_id'),
+        table_name='contest_sync_state',
+    )
+    op.drop_table('contest_sync_state')
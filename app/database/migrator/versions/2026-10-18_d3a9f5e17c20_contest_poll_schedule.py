@@ -0,0 +1,38 @@
+"""contest poll schedule
+
+Revision ID: d3a9f5e17c20
+Revises: b7e24c9d13f6
+Create Date: 2026-10-18 22:31:05.918743
+
+"""
+
+import sqlalchemy as sa
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision = 'd3a9f5e17c20'
+down_revision = 'b7e24c9d13f6'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.add_column(
+        'contest_sync_state',
+        sa.Column(
+            'submissions_rate',
+            sa.Float(),
+            server_default='0.0',
+            nullable=False,
+        ),
+    )
+    op.add_column(
+        'contest_sync_state',
+        sa.Column('next_sync_at', sa.TIMESTAMP(timezone=True), nullable=True),
+    )
+
+
+def downgrade() -> None:
+    op.drop_column('contest_sync_state', 'next_sync_at')
+    op.drop_column('contest_sync_state', 'submissions_rate')
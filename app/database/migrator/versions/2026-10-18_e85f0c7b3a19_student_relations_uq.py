@@ -0,0 +1,202 @@
+"""student relations uq
+
+Revision ID: e85f0c7b3a19
+Revises: a61c3e9b5f24
+Create Date: 2026-10-18 23:59:24.381205
+
+"""
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision = 'e85f0c7b3a19'
+down_revision = 'a61c3e9b5f24'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    # relations with duplicates, their scores are merged or recomputed
+    op.execute(
+        'CREATE TEMPORARY TABLE merged_relations AS '
+        'SELECT DISTINCT a.student_id, a.course_id, a.contest_id '
+        'FROM student_task AS a JOIN student_task AS b '
+        'ON a.student_id = b.student_id AND a.task_id = b.task_id '
+        'AND a.id <> b.id '
+        'UNION '
+        'SELECT DISTINCT a.student_id, a.course_id, a.contest_id '
+        'FROM student_contest AS a JOIN student_contest AS b '
+        'ON a.student_id = b.student_id AND a.contest_id = b.contest_id '
+        'AND a.id <> b.id'
+    )
+    # the oldest relation of student is kept,
+    # submissions of duplicates are moved to it
+    op.execute(
+        'UPDATE submission AS s SET student_task_id = keep.id '
+        'FROM student_task AS a '
+        'JOIN ('
+        'SELECT DISTINCT ON (student_id, task_id) id, student_id, task_id '
+        'FROM student_task '
+        'ORDER BY student_id, task_id, dt_created, id'
+        ') AS keep '
+        'ON keep.student_id = a.student_id AND keep.task_id = a.task_id '
+        'WHERE s.student_task_id = a.id AND a.id <> keep.id'
+    )
+    # best scores of duplicates are merged into the kept relation
+    op.execute(
+        'UPDATE student_task AS t SET '
+        'final_score = m.final_score, '
+        'best_score_before_finish = m.best_score_before_finish, '
+        'best_score_no_deadline = m.best_score_no_deadline, '
+        'is_done = m.is_done, '
+        'best_score_before_finish_submission_id = '
+        'm.best_score_before_finish_submission_id, '
+        'best_score_no_deadline_submission_id = '
+        'm.best_score_no_deadline_submission_id '
+        'FROM ('
+        'SELECT student_id, task_id, '
+        'max(final_score) AS final_score, '
+        'max(best_score_before_finish) AS best_score_before_finish, '
+        'max(best_score_no_deadline) AS best_score_no_deadline, '
+        'bool_or(is_done) AS is_done, '
+        '(array_agg(best_score_before_finish_submission_id '
+        'ORDER BY best_score_before_finish DESC, dt_created, id))[1] '
+        'AS best_score_before_finish_submission_id, '
+        '(array_agg(best_score_no_deadline_submission_id '
+        'ORDER BY best_score_no_deadline DESC, dt_created, id))[1] '
+        'AS best_score_no_deadline_submission_id '
+        'FROM student_task '
+        'GROUP BY student_id, task_id '
+        'HAVING count(*) > 1'
+        ') AS m '
+        'WHERE t.student_id = m.student_id AND t.task_id = m.task_id'
+    )
+    op.execute(
+        'DELETE FROM student_task AS a '
+        'USING student_task AS b '
+        'WHERE a.student_id = b.student_id '
+        'AND a.task_id = b.task_id '
+        'AND (a.dt_created, a.id) > (b.dt_created, b.id)'
+    )
+    # scores of contests were split between duplicates,
+    # so they are recomputed from merged tasks
+    op.execute(
+        'UPDATE student_contest AS c SET '
+        'score = coalesce(t.score, 0), '
+        'score_no_deadline = coalesce(t.score_no_deadline, 0), '
+        'tasks_done = coalesce(t.tasks_done, 0), '
+        'is_ok = m.is_ok, '
+        'is_ok_no_deadline = m.is_ok_no_deadline '
+        'FROM ('
+        'SELECT c.student_id, c.contest_id, '
+        'bool_or(c.is_ok) AS is_ok, '
+        'bool_or(c.is_ok_no_deadline) AS is_ok_no_deadline '
+        'FROM student_contest AS c JOIN merged_relations AS r '
+        'ON c.student_id = r.student_id AND c.contest_id = r.contest_id '
+        'GROUP BY c.student_id, c.contest_id'
+        ') AS m '
+        'LEFT JOIN ('
+        'SELECT student_id, contest_id, '
+        'round(sum(final_score)::numeric, 4)::float AS score, '
+        'round(sum(best_score_no_deadline)::numeric, 4)::float '
+        'AS score_no_deadline, '
+        'count(*) FILTER (WHERE is_done) AS tasks_done '
+        'FROM student_task '
+        'GROUP BY student_id, contest_id'
+        ') AS t '
+        'ON t.student_id = m.student_id AND t.contest_id = m.contest_id '
+        'WHERE c.student_id = m.student_id AND c.contest_id = m.contest_id'
+    )
+    op.execute(
+        'DELETE FROM student_contest AS a '
+        'USING student_contest AS b '
+        'WHERE a.student_id = b.student_id '
+        'AND a.contest_id = b.contest_id '
+        'AND (a.dt_created, a.id) > (b.dt_created, b.id)'
+    )
+    # scores of courses are recomputed from contests,
+    # levels are evaluated again by update_results
+    op.execute(
+        'UPDATE student_course AS sc SET '
+        'score = c.score, '
+        'score_no_deadline = c.score_no_deadline, '
+        'is_results_dirty = true '
+        'FROM ('
+        'SELECT student_id, course_id, '
+        'round(sum(score)::numeric, 4)::float AS score, '
+        'round(sum(score_no_deadline)::numeric, 4)::float '
+        'AS score_no_deadline '
+        'FROM student_contest '
+        'WHERE (student_id, course_id) IN '
+        '(SELECT student_id, course_id FROM merged_relations) '
+        'GROUP BY student_id, course_id'
+        ') AS c '
+        'WHERE sc.student_id = c.student_id AND sc.course_id = c.course_id'
+    )
+    op.execute('DROP TABLE merged_relations')
+    # unique indexes are built without locking writes of sync jobs,
+    # then constraints take them by a short lock
+    with op.get_context().autocommit_block():
+        op.create_index(
+            op.f('uq__student_task__student_id_task_id'),
+            'student_task',
+            ['student_id', 'task_id'],
+            unique=True,
+            postgresql_concurrently=True,
+        )
+        op.create_index(
+            op.f('uq__student_contest__student_id_contest_id'),
+            'student_contest',
+            ['student_id', 'contest_id'],
+            unique=True,
+            postgresql_concurrently=True,
+        )
+    op.execute(
+        'ALTER TABLE student_task '
+        'ADD CONSTRAINT uq__student_task__student_id_task_id '
+        'UNIQUE USING INDEX uq__student_task__student_id_task_id'
+    )
+    op.execute(
+        'ALTER TABLE student_contest '
+        'ADD CONSTRAINT uq__student_contest__student_id_contest_id '
+        'UNIQUE USING INDEX uq__student_contest__student_id_contest_id'
+    )
+    # unique indexes serve the same queries
+    with op.get_context().autocommit_block():
+        op.drop_index(
+            op.f('ix__student_task__student_id_task_id'),
+            table_name='student_task',
+            postgresql_concurrently=True,
+        )
+        op.drop_index(
+            op.f('ix__student_contest__student_id_contest_id'),
+            table_name='student_contest',
+            postgresql_concurrently=True,
+        )
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.create_index(
+            op.f('ix__student_contest__student_id_contest_id'),
+            'student_contest',
+            ['student_id', 'contest_id'],
+            postgresql_concurrently=True,
+        )
+        op.create_index(
+            op.f('ix__student_task__student_id_task_id'),
+            'student_task',
+            ['student_id', 'task_id'],
+            postgresql_concurrently=True,
+        )
+    op.drop_constraint(
+        op.f('uq__student_contest__student_id_contest_id'),
+        'student_contest',
+        type_='unique',
+    )
+    op.drop_constraint(
+        op.f('uq__student_task__student_id_task_id'),
+        'student_task',
+        type_='unique',
+    )
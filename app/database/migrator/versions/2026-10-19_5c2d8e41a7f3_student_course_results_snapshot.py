@@ -0,0 +1,33 @@
+"""student course results snapshot
+
+Revision ID: 5c2d8e41a7f3
+Revises: e85f0c7b3a19
+Create Date: 2026-10-19 00:27:41.512806
+
+"""
+
+import sqlalchemy as sa
+from alembic import op
+from sqlalchemy.dialects import postgresql
+
+
+# revision identifiers, used by Alembic.
+revision = '5c2d8e41a7f3'
+down_revision = 'e85f0c7b3a19'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.add_column(
+        'student_course',
+        sa.Column(
+            'results_snapshot',
+            postgresql.JSONB(astext_type=sa.Text()),
+            nullable=True,
+        ),
+    )
+
+
+def downgrade() -> None:
+    op.drop_column('student_course', 'results_snapshot')
@@ -1,5 +1,10 @@
 from .base import BaseModel
-from .contest import Contest, ContestLevels
+from .contest import (
+    Contest,
+    ContestLevels,
+    ContestParticipant,
+    ContestSyncState,
+)
 from .course import Course, CourseLevels
 from .department import Department
 from .group import ContestGroup, Group, StudentGroup
@@ -23,6 +28,8 @@ __all__ = [
     'Contest',
     'ContestGroup',
     'ContestLevels',
+    'ContestParticipant',
+    'ContestSyncState',
     'Course',
     'CourseLevels',
     'Department',
@@ -106,3 +106,83 @@ class ContestLevels(BaseModel):
             f'course_id={self.course_id} '
             f'contest_id={self.contest_id}>'
         )
+
+
+class ContestParticipant(BaseModel):
+    """
+    Participant of Yandex contest.
+
+    Index of contest login to author id, used to resolve
+    author ids of students without requests for each student.
+    """
+
+    __tablename__ = 'contest_participant'
+
+    contest_id = sa.Column(
+        sa.ForeignKey('contest.id', ondelete='CASCADE'),
+        nullable=False,
+        index=True,
+    )
+    login = sa.Column(sa.String, nullable=False)
+    author_id = sa.Column(sa.Integer, nullable=False)
+
+    __table_args__ = (sa.UniqueConstraint('contest_id', 'login'),)
+
+    def __repr__(self):  # type: ignore
+        return (
+            f'<ContestParticipant {self.login} '
+            f'author_id={self.author_id} '
+            f'contest_id={self.contest_id}>'
+        )
+
+
+class ContestSyncState(BaseModel):
+    """
+    State of submissions sync of contest with Yandex contest.
+
+    Written in the same transaction as new submissions of contest.
+    """
+
+    __tablename__ = 'contest_sync_state'
+
+    contest_id = sa.Column(
+        sa.ForeignKey('contest.id', ondelete='CASCADE'),
+        nullable=False,
+        index=True,
+        unique=True,
+    )
+    last_run_id = sa.Column(
+        sa.Integer,
+        nullable=False,
+        default=-1,
+        server_default='-1',
+        doc='Max run id of fetched submissions',
+    )
+    remote_count = sa.Column(
+        sa.Integer,
+        nullable=True,
+        doc='Count of submissions in Yandex contest, '
+        'None if not all new submissions were fetched',
+    )
+    synced_at = sa.Column(sa.TIMESTAMP(timezone=True), nullable=True)
+    sync_duration = sa.Column(
+        sa.Float, nullable=True, doc='Duration of the last sync in seconds'
+    )
+    submissions_rate = sa.Column(
+        sa.Float,
+        nullable=False,
+        default=0.0,
+        server_default='0.0',
+        doc='Smoothed count of new submissions per hour',
+    )
+    next_sync_at = sa.Column(
+        sa.TIMESTAMP(timezone=True),
+        nullable=True,
+        doc='Time when contest is due to sync, None if due now',
+    )
+
+    def __repr__(self):  # type: ignore
+        return (
+            f'<ContestSyncState contest_id={self.contest_id} '
+            f'last_run_id={self.last_run_id}>'
+        )
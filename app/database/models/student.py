@@ -3,7 +3,7 @@ import typing
 
 import sqlalchemy as sa
 from sqlalchemy import CheckConstraint
-from sqlalchemy.dialects.postgresql import UUID
+from sqlalchemy.dialects.postgresql import JSONB, UUID
 
 from .base import BaseModel
 
@@ -152,6 +152,22 @@ class StudentCourse(BaseModel):
         server_default='false',
         doc='Is student allowed to pass exam early',
     )
+    is_results_dirty = sa.Column(
+        sa.Boolean,
+        nullable=False,
+        default=True,
+        server_default='true',
+        doc='Are scores changed since course levels were evaluated',
+    )
+    results_snapshot = sa.orm.deferred(
+        sa.Column(
+            JSONB,
+            nullable=True,
+            doc='Course results of student written by update_results',
+        )
+    )
+
+    __table_args__ = (sa.Index(None, 'student_id', 'course_id'),)
 
     def __repr__(self):  # type: ignore
         return (
@@ -217,6 +233,8 @@ class StudentContest(BaseModel):
         doc='Is ok for level Допуск к зачету',
     )
 
+    __table_args__ = (sa.UniqueConstraint('student_id', 'contest_id'),)
+
     def __repr__(self):  # type: ignore
         return (
             f'<StudentContest student_id={self.student_id} '
@@ -281,6 +299,8 @@ class StudentTask(BaseModel):
         nullable=True,
     )
 
+    __table_args__ = (sa.UniqueConstraint('student_id', 'task_id'),)
+
     def __repr__(self):  # type: ignore
         return (
             f'<StudentContest student_id={self.student_id} '
@@ -310,6 +330,8 @@ class StudentCourseLevels(BaseModel):
         sa.Boolean, default=False, server_default='false', nullable=False
     )
 
+    __table_args__ = (sa.UniqueConstraint('student_id', 'course_level_id'),)
+
     def __repr__(self):  # type: ignore
         return (
             f'<StudentCourseLevels student_id={self.student_id} '
@@ -345,6 +367,8 @@ class StudentContestLevels(BaseModel):
         sa.Boolean, default=False, server_default='false', nullable=False
     )
 
+    __table_args__ = (sa.UniqueConstraint('student_id', 'contest_level_id'),)
+
     def __repr__(self):  # type: ignore
         return (
             f'<StudentContestLevels student_id={self.student_id} '
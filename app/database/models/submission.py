@@ -45,6 +45,29 @@ class Submission(BaseModel):
     )
     submission_link = sa.Column(sa.String, nullable=False)
     submission_time = sa.Column(sa.DateTime, nullable=False)
+    verdict_checks_count = sa.Column(
+        sa.Integer,
+        nullable=False,
+        default=0,
+        server_default='0',
+        doc='Count of checks of submission without verdict',
+    )
+    next_verdict_check_at = sa.Column(
+        sa.TIMESTAMP(timezone=True),
+        nullable=True,
+        doc='Time when submission without verdict is due to check, '
+        'None if due now',
+    )
+
+    __table_args__ = (
+        sa.Index(None, 'contest_id', 'run_id'),
+        sa.Index(None, 'run_id'),
+        sa.Index(
+            None,
+            'next_verdict_check_at',
+            postgresql_where=sa.text("verdict = 'No report'"),
+        ),
+    )
 
     def __repr__(self):  # type: ignore
         return f'<Submission {self.run_id} author_id={self.author_id}>'
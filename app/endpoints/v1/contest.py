@@ -57,6 +57,16 @@ async def create(  # pylint: disable=too-many-statements
             status_code=status.HTTP_409_CONFLICT,
             detail='Contest already exists',
         )
+    try:
+        task_utils.validate_formula(
+            contest_request.default_final_score_evaluation_formula
+            or course.default_final_score_evaluation_formula
+        )
+    except ValueError as exc:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=f'Bad final score evaluation formula: {exc}',
+        ) from exc
     contest_info = await get_contest_info(
         contest_request.yandex_contest_id, logger=loguru.logger
     )
@@ -1,11 +1,20 @@
+import dataclasses
+
 from fastapi import APIRouter, Depends, HTTPException, Request, status
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from app.config import get_settings
 from app.database.connection import SessionManager
 from app.database.models import User
-from app.schemas import PingMessage, PingResponse
+from app.schemas import (
+    DatabasePoolStatus,
+    PingMessage,
+    PingResponse,
+    YandexApiGovernorStatus,
+)
 from app.utils.health_check import health_check_db
 from app.utils.user import get_current_user
+from app.utils.yandex_request import get_governor
 
 
 api_router = APIRouter(
@@ -57,3 +66,33 @@ async def ping_auth(
     user: User = Depends(get_current_user),
 ) -> PingResponse:
     return PingResponse(message=PingMessage.OK, detail=user.username)
+
+
+@api_router.get(
+    '/database_pool',
+    response_model=DatabasePoolStatus,
+    status_code=status.HTTP_200_OK,
+)
+async def database_pool(
+    _: Request,
+    __: User = Depends(get_current_user),
+) -> DatabasePoolStatus:
+    return DatabasePoolStatus(**SessionManager().get_pool_status())
+
+
+@api_router.get(
+    '/yandex_api_governor',
+    response_model=YandexApiGovernorStatus,
+    status_code=status.HTTP_200_OK,
+)
+async def yandex_api_governor(
+    _: Request,
+    __: User = Depends(get_current_user),
+) -> YandexApiGovernorStatus:
+    """
+    Get queue depth and wait time of Yandex Contest API requests
+    made by this process.
+    """
+    return YandexApiGovernorStatus(
+        **dataclasses.asdict(get_governor(get_settings().YANDEX_API_KEY).stats)
+    )
@@ -5,29 +5,28 @@ from pathlib import Path
 
 import loguru
 from fastapi import APIRouter, Depends, HTTPException, UploadFile, status
-from fastapi.responses import FileResponse
+from fastapi.responses import FileResponse, StreamingResponse
 from sqlalchemy.ext.asyncio import AsyncSession
 from starlette.requests import Request
 from starlette.responses import JSONResponse
 
 from app import constants, worker
 from app.bot_helper import send
+from app.config import get_settings
 from app.database.connection import SessionManager
 from app.database.models import User
 from app.limiter import limiter
-from app.schemas import StudentResults
-from app.utils import course as course_utils
+from app.schemas import (
+    StudentResults,
+    StudentResultsBatchItem,
+    StudentResultsBatchRequest,
+)
 from app.utils import pdf
+from app.utils import results as results_utils
 from app.utils import student as student_utils
-from app.utils.course import (
-    get_all_active_courses,
-    get_course_by_short_name,
-    get_course_levels,
-    get_or_create_student_course_level,
-    get_student_courses,
-)
-from app.utils.results import get_student_course_results
+from app.utils.course import get_course_by_short_name
 from app.utils.user import get_current_user
+from app.worker.get_results_by_course import get_results_messages_inline
 
 
 api_router = APIRouter(
@@ -45,7 +44,9 @@ async def get_all_results(
     _: Request,
     student_login: str,
     __: User = Depends(get_current_user),
-    session: AsyncSession = Depends(SessionManager().get_async_session),
+    session: AsyncSession = Depends(
+        SessionManager().get_read_only_async_session
+    ),
 ) -> JSONResponse:
     """
     Get student results for all courses.
@@ -54,39 +55,62 @@ async def get_all_results(
     student = await student_utils.get_student_or_raise(
         session, student_login, headers=headers
     )
-    all_courses = await get_all_active_courses(session)
-    levels_by_course = {
-        course.id: await get_course_levels(session, course.id)
-        for course in all_courses
-    }
+    student_results = await results_utils.get_student_results(
+        session, student, logger=loguru.logger
+    )
+    return JSONResponse(student_results.dict(), headers=headers)
+
+
+@api_router.post(
+    '/batch',
+    response_model=list[StudentResultsBatchItem],
+    status_code=status.HTTP_200_OK,
+)
+async def get_batch_results(
+    request: Request,
+    batch_request: StudentResultsBatchRequest,
+    _: User = Depends(get_current_user),
+    session: AsyncSession = Depends(
+        SessionManager().get_read_only_async_session
+    ),
+) -> JSONResponse | StreamingResponse:
+    """
+    Get results of many students, one StudentResultsBatchItem
+    for each contest login in request order.
+
+    Batches of more than RESULTS_BATCH_STREAM_THRESHOLD students,
+    or if NDJSON is accepted, are streamed as NDJSON, one item a line.
+    """
+    course_id = None
+    if batch_request.course_short_name is not None:
+        course = await get_course_by_short_name(
+            session, batch_request.course_short_name
+        )
+        if course is None:
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND,
+                detail='Course not found',
+            )
+        course_id = course.id
+    # each student once, in order of request
+    contest_logins = list(dict.fromkeys(batch_request.contest_logins))
+    threshold = get_settings().RESULTS_BATCH_STREAM_THRESHOLD
+    ndjson = 'application/x-ndjson' in request.headers.get('accept', '')
+    stream = len(contest_logins) > threshold or ndjson
+    if stream:
+        return StreamingResponse(
+            results_utils.get_batch_results_lines(
+                contest_logins, course_id, loguru.logger
+            ),
+            media_type='application/x-ndjson',
+        )
     return JSONResponse(
-        StudentResults(
-            courses=[
-                await get_student_course_results(
-                    student,
-                    course,
-                    levels_by_course[course.id],
-                    student_course,
-                    [
-                        await get_or_create_student_course_level(
-                            session, student.id, course.id, course_level.id
-                        )
-                        for course_level in levels_by_course[course.id]
-                    ],
-                    student_course_contest_data=(
-                        await course_utils.get_student_course_contests_data(
-                            session, course.id, student.id
-                        )
-                    ),
-                    logger=loguru.logger,
-                )
-                for course, student_course in await get_student_courses(
-                    session, student.id
-                )
-            ],
-            fio=student.fio,
-        ).dict(),
-        headers=headers,
+        [
+            item.dict()
+            async for item in results_utils.get_batch_results_items(
+                session, contest_logins, loguru.logger, course_id=course_id
+            )
+        ]
     )
 
 
@@ -102,20 +126,38 @@ async def get_results_by_course(
 ) -> JSONResponse:
     """
     Get student results for a specific course.
+
+    Results are got inline if it takes less than
+    RESULTS_BY_COURSE_TIME_BUDGET, which is usual as they are served
+    from snapshots. Otherwise, or on error, they are got by celery task.
+    Result of inline path is stored as result of task too, so both
+    paths can be polled by /task/result.
     """
     logger = loguru.logger.bind(
         course={'short_name': course_short_name},
     )
+    student_login = request.headers['log-contest-login']
+    inline_results = await get_results_messages_inline(
+        course_short_name,
+        student_login,
+        worker.celery_broker.backend,
+        logger=logger,
+    )
+    if inline_results is not None:
+        task_id, messages = inline_results
+        return JSONResponse(
+            {'task_id': task_id, 'ready': True, 'messages': messages}
+        )
     task = worker.get_results_by_course_task.delay(
         course_short_name=course_short_name,
-        student_login=request.headers['log-contest-login'],
+        student_login=student_login,
         parent_id=request.scope['request_id'],
     )
     logger = logger.bind(
         celery_task={'id': task.id, 'name': 'get_results_by_course_task'},
     )
     logger.info('Task {} sent to celery', task.id)
-    return JSONResponse({'task_id': task.id})
+    return JSONResponse({'task_id': task.id, 'ready': False, 'messages': None})
 
 
 @api_router.post(
@@ -1,12 +1,20 @@
+import json
+import typing as tp
+
 import fastapi
 import loguru
-from celery import result as celery_result
+from celery import states
 from starlette import requests, responses, status
 
+from app.config import get_settings
 from app.database import models
+from app.utils import celery_task as celery_task_utils
 from app.utils import user as user_utils
 
 
+# seconds between keep-alive comments of task result stream
+STREAM_KEEP_ALIVE_INTERVAL = 15
+
 api_router = fastapi.APIRouter(
     prefix='/task',
     tags=['Task'],
@@ -20,27 +28,69 @@ api_router = fastapi.APIRouter(
 async def get_task_result(
     request: requests.Request,  # pylint: disable=unused-argument
     task_id: str,
+    wait: float = fastapi.Query(0, ge=0),
     _: models.User = fastapi.Depends(user_utils.get_current_user),
 ) -> responses.JSONResponse:
-    SUCCESS_STATUS = 'SUCCESS'
+    """
+    Get result of task.
+
+    :param wait: Seconds to wait for the task to be ready before
+        answering, up to TASK_RESULT_MAX_WAIT. The answer is sent
+        as soon as the task is ready.
+    """
     logger = loguru.logger.bind(
         celery_task={'id': task_id},
     )
-    result = celery_result.AsyncResult(task_id)
-    logger.info('Current task status: {}', result.status)
-    messages = None
-    if result.ready():
-        if result.status != SUCCESS_STATUS:
-            messages = [
-                'Произошла ошибка. Попробуйте еще раз '
-                'или напишите администратору.'
-            ]
-        else:
-            messages = result.result
-
+    result, task_status = await celery_task_utils.wait_task_result(
+        task_id, min(wait, get_settings().TASK_RESULT_MAX_WAIT)
+    )
+    logger.info('Current task status: {}', task_status)
     return responses.JSONResponse(
-        {
-            'ready': result.ready(),
-            'messages': messages,
-        }
+        celery_task_utils.get_task_result_content(result, task_status)
+    )
+
+
+@api_router.get(
+    '/result/stream',
+    status_code=status.HTTP_200_OK,
+)
+async def stream_task_result(
+    request: requests.Request,  # pylint: disable=unused-argument
+    task_id: str,
+    _: models.User = fastapi.Depends(user_utils.get_current_user),
+) -> responses.StreamingResponse:
+    """
+    Stream result of task as Server-Sent Events.
+
+    The `result` event with the same content as /task/result is sent
+    as soon as the task is ready or after TASK_RESULT_MAX_WAIT,
+    then the stream is closed.
+    """
+    return responses.StreamingResponse(
+        _get_task_result_events(task_id),
+        media_type='text/event-stream',
+        headers={'Cache-Control': 'no-cache'},
+    )
+
+
+async def _get_task_result_events(task_id: str) -> tp.AsyncIterator[str]:
+    logger = loguru.logger.bind(
+        celery_task={'id': task_id},
+    )
+    max_wait = get_settings().TASK_RESULT_MAX_WAIT
+    waited = 0.0
+    while True:
+        timeout = min(STREAM_KEEP_ALIVE_INTERVAL, max_wait - waited)
+        result, task_status = await celery_task_utils.wait_task_result(
+            task_id, timeout
+        )
+        waited += timeout
+        if task_status in states.READY_STATES or waited >= max_wait:
+            break
+        yield ': keep-alive\n\n'
+    logger.info('Current task status: {}', task_status)
+    content = json.dumps(
+        celery_task_utils.get_task_result_content(result, task_status),
+        ensure_ascii=False,
     )
+    yield f'event: result\ndata: {content}\n\n'
@@ -5,6 +5,7 @@ from app.schemas import scheduler as scheduler_schemas
 from .contest_register_group import job as contest_register_group
 from .db_dump import job as db_dump
 from .ping import job as ping
+from .sync_contests import job as sync_contests
 from .update_results import job as update_results
 
 
@@ -37,6 +38,15 @@ list_of_jobs: list[scheduler_schemas.JobInfo] = [
         func=update_results,
         name='update_results',
     ),
+    scheduler_schemas.JobInfo(
+        **{
+            'trigger': 'interval',
+            'minutes': 1,
+            'config': {'send_logs': False},
+        },
+        func=sync_contests,
+        name='sync_contests',
+    ),
 ]
 
 
@@ -11,8 +11,10 @@ from apscheduler.schedulers.asyncio import AsyncIOScheduler
 from app import logger_config
 from app.bot_helper import send
 from app.config import get_settings
+from app.database.connection import SessionManager
 from app.scheduler import list_of_jobs
 from app.schemas import scheduler as scheduler_schemas
+from app.utils import yandex_request
 
 
 def _job_info_wrapper(  # pylint: disable=too-many-statements
@@ -153,4 +155,9 @@ if __name__ == '__main__':
         loguru.logger.info('Starting scheduler')
         asyncio.get_event_loop().run_forever()
     except (KeyboardInterrupt, SystemExit):
+        scheduler.shutdown()
+        asyncio.get_event_loop().run_until_complete(
+            yandex_request.close_yandex_client()
+        )
+        asyncio.get_event_loop().run_until_complete(SessionManager().dispose())
         loguru.logger.info('Scheduler stopped')
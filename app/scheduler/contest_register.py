@@ -105,7 +105,6 @@ async def job(
     session: AsyncSession | None = None,
 ) -> None:
     if session is None:
-        SessionManager().refresh()
         async with SessionManager().create_async_session() as session:
             return await job(base_logger=base_logger, session=session)
     courses = await get_all_active_courses(session)
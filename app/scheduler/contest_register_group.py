@@ -21,7 +21,6 @@ async def job(
     session: AsyncSession | None = None,
 ) -> None:
     if session is None:
-        SessionManager().refresh()
         async with SessionManager().create_async_session() as session:
             return await job(base_logger=base_logger, session=session)
     courses = await course_utils.get_all_active_courses(session)
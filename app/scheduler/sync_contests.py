@@ -0,0 +1,106 @@
+import time
+import traceback
+from datetime import datetime, timezone
+from uuid import uuid4
+
+import loguru
+
+from app.bot_helper import send
+from app.config import get_settings
+from app.database.connection import SessionManager
+from app.utils import contest as contest_utils
+from app.utils import course as course_utils
+from app.utils import student as student_utils
+
+from .update_results import (
+    get_celery_client,
+    get_contest_sync_signatures,
+    sync_contest,
+)
+
+
+async def job(base_logger: 'loguru.Logger') -> None:
+    """
+    Sync contests of active courses which are due by poll schedule.
+
+    The hottest contests are synced first. Contests left after
+    CONTEST_SYNC_TIME_BUDGET are synced by the next runs.
+    With UPDATE_RESULTS_FAN_OUT contests are synced by celery workers.
+    """
+    async with SessionManager().create_async_session() as session:
+        courses = await course_utils.get_all_active_courses(session)
+        contests = [
+            (course, contest)
+            for course in courses
+            for contest in await contest_utils.get_contests(session, course.id)
+        ]
+        sync_states = await contest_utils.get_contests_sync_states(
+            session, [contest.id for _, contest in contests]
+        )
+    due_contests = contest_utils.get_due_contests(
+        [
+            (course, contest, sync_states.get(contest.id))
+            for course, contest in contests
+        ],
+        datetime.now(timezone.utc),
+    )
+    base_logger.info(
+        '{} of {} contests are due to sync', len(due_contests), len(contests)
+    )
+    if get_settings().UPDATE_RESULTS_FAN_OUT:
+        parent_id = uuid4().hex
+        signatures = await get_contest_sync_signatures(
+            due_contests,
+            parent_id,
+            get_celery_client(),
+            base_logger=base_logger,
+        )
+        for signature in signatures:
+            signature.apply_async()
+        base_logger.info(
+            'Sync of {} contests sent to celery, parent_id={}',
+            len(signatures),
+            parent_id,
+        )
+        return
+    due_course_ids = {course.id for course, _, _ in due_contests}
+    async with SessionManager().create_async_session() as session:
+        students_by_course = {
+            course.id: (
+                await student_utils.get_students_by_course_with_department(
+                    session, course.id
+                )
+            )
+            for course in courses
+            if course.id in due_course_ids
+        }
+    deadline = time.monotonic() + get_settings().CONTEST_SYNC_TIME_BUDGET
+    for i, (course, contest, _) in enumerate(due_contests):
+        if time.monotonic() > deadline:
+            base_logger.warning(
+                'Sync is behind schedule, {} contests are left',
+                len(due_contests) - i,
+            )
+            break
+        logger = base_logger.bind(
+            course={'id': course.id, 'short_name': course.short_name}
+        )
+        try:
+            await sync_contest(
+                course,
+                contest,
+                students_by_course[course.id],
+                base_logger=logger,
+            )
+        except Exception as exc:  # pylint: disable=broad-except
+            logger.exception(
+                'Error while syncing contest {}: {}',
+                contest.yandex_contest_id,
+                exc,
+            )
+            await send.send_traceback_message_safe(
+                logger=logger,
+                message=f'Error while syncing contest '
+                f'{contest.yandex_contest_id}: {exc}',
+                code=traceback.format_exc(),
+            )
@@ -1,18 +1,25 @@
 # pylint: disable=too-many-lines
+import asyncio
 import collections
 import pathlib
+import time
 import traceback
-from datetime import datetime
+import typing as tp
+from datetime import datetime, timezone
+from uuid import UUID, uuid4
 
+import celery
 import loguru
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app import constants
 from app.bot_helper import send
+from app.config import get_settings
 from app.database import models
 from app.database.connection import SessionManager
 from app.schemas import contest as contest_schemas
 from app.schemas import course as course_schemas
+from app.utils import common as common_utils
 from app.utils import contest as contest_utils
 from app.utils import course as course_utils
 from app.utils import results as results_utils
@@ -21,10 +28,44 @@ from app.utils import submission as submission_utils
 from app.utils import task as task_utils
 
 
+_STUDENT_TASK_SCORE_COLUMNS = [
+    'final_score',
+    'best_score_before_finish',
+    'best_score_no_deadline',
+    'is_done',
+    'best_score_before_finish_submission_id',
+    'best_score_no_deadline_submission_id',
+]
+
+# time.monotonic() of the last recompute of all students in this process
+_last_full_recompute_at: float | None = None
+
+
+def is_full_recompute_due() -> bool:
+    interval = get_settings().UPDATE_RESULTS_FULL_RECOMPUTE_INTERVAL
+    return (
+        _last_full_recompute_at is None
+        or time.monotonic() - _last_full_recompute_at >= interval
+    )
+
+
 async def job(  # pylint: disable=too-many-statements
-    base_logger: 'loguru.Logger', save_csv: bool = True
+    base_logger: 'loguru.Logger',
+    save_csv: bool = True,
+    full_recompute: bool | None = None,
 ) -> None:
-    SessionManager().refresh()
+    """
+    Update results of all active courses.
+
+    :param full_recompute: Evaluate levels of all students instead of
+        students with changed scores. By default, it is done once
+        in UPDATE_RESULTS_FULL_RECOMPUTE_INTERVAL.
+    """
+    global _last_full_recompute_at  # pylint: disable=global-statement
+
+    if full_recompute is None:
+        full_recompute = is_full_recompute_due()
+    base_logger.info('Full recompute: {}', full_recompute)
 
     try:
         await check_and_update_no_verdict_submissions(base_logger)
@@ -47,53 +88,127 @@ async def job(  # pylint: disable=too-many-statements
             for course in courses
         ]
     base_logger.info('Has {} courses', len(courses))
-    filenames = []
-    for course, course_levels in zip(courses, levels_by_course):
-        logger = base_logger.bind(
-            course={'id': course.id, 'short_name': course.short_name}
-        )
-        logger.info('Course: {}', course)
-        try:
-            await update_course_results(course, logger)
-        except Exception as exc:  # pylint: disable=broad-except
-            logger.exception(
-                'Error while updating course results for {}: {}',
-                course.short_name,
-                exc,
-            )
-            await send.send_traceback_message_safe(
-                logger=logger,
-                message=f'Error while updating course '
-                f'results for {course.short_name}: {exc}',
-                code=traceback.format_exc(),
-            )
-
-        # dump results
-        try:
-            course_results = await get_course_results(
-                course, course_levels, base_logger=logger
-            )
-        except Exception as exc:  # pylint: disable=broad-except
-            logger.exception(
-                'Error while getting course results for {}: {}',
-                course.short_name,
-                exc,
-            )
-            await send.send_traceback_message_safe(
-                logger=logger,
-                message=f'Error while getting course '
-                f'results for {course.short_name}: {exc}',
-                code=traceback.format_exc(),
+    if get_settings().UPDATE_RESULTS_FAN_OUT:
+        await enqueue_update_results(
+            courses,
+            base_logger,
+            save_csv=save_csv,
+            full_recompute=full_recompute,
+        )
+        if full_recompute:
+            _last_full_recompute_at = time.monotonic()
+        return
+    concurrency = get_settings().UPDATE_RESULTS_CONCURRENCY
+    # contests of all courses share one limit
+    contests_semaphore = asyncio.Semaphore(concurrency)
+    results_by_course = await common_utils.gather_bounded(
+        [
+            update_and_get_course_results(
+                course,
+                course_levels,
+                base_logger=base_logger.bind(
+                    course={'id': course.id, 'short_name': course.short_name}
+                ),
+                full_recompute=full_recompute,
+                semaphore=contests_semaphore,
             )
+            for course, course_levels in zip(courses, levels_by_course)
+        ],
+        asyncio.Semaphore(concurrency),
+    )
+    filenames = []
+    for course, course_results in zip(courses, results_by_course):
+        if course_results is None or not save_csv:
             continue
-        filename = (
-            f'results_{course.short_name}_'
-            f'{datetime.now().strftime(constants.dt_format_filename)}.csv'
+        filename = get_results_filename(course)
+        await save_to_csv(course_results, filename)
+        filenames.append(filename)
+
+    if full_recompute:
+        _last_full_recompute_at = time.monotonic()
+
+    await send_results_report(filenames, base_logger)
+
+
+async def update_and_get_course_results(  # pylint: disable=too-many-arguments
+    course: models.Course,
+    course_levels: list[models.CourseLevels],
+    base_logger: 'loguru.Logger',
+    full_recompute: bool = True,
+    sync_contests: bool = True,
+    semaphore: asyncio.Semaphore | None = None,
+) -> course_schemas.CourseResultsCSV | None:
+    """
+    Update results of course and get them.
+
+    Errors are logged and sent, not raised, so they do not
+    stop updating of other courses.
+
+    :return: None if results of course can not be got
+    """
+    base_logger.info('Course: {}', course)
+    await run_logging_errors(
+        update_course_results(
+            course,
+            base_logger,
+            sync_contests=sync_contests,
+            semaphore=semaphore,
+        ),
+        f'Error while updating course results for {course.short_name}',
+        base_logger,
+    )
+    try:
+        return await get_course_results(
+            course,
+            course_levels,
+            base_logger=base_logger,
+            full_recompute=full_recompute,
+        )
+    except Exception as exc:  # pylint: disable=broad-except
+        base_logger.exception(
+            'Error while getting course results for {}: {}',
+            course.short_name,
+            exc,
+        )
+        await send.send_traceback_message_safe(
+            logger=base_logger,
+            message=f'Error while getting course '
+            f'results for {course.short_name}: {exc}',
+            code=traceback.format_exc(),
+        )
+        return None
+
+
+async def run_logging_errors(
+    aw: tp.Awaitable[tp.Any],
+    error_message: str,
+    logger: 'loguru.Logger',
+) -> None:
+    """
+    Await and log and send error instead of raising it.
+    """
+    try:
+        await aw
+    except Exception as exc:  # pylint: disable=broad-except
+        logger.exception('{}: {}', error_message, exc)
+        await send.send_traceback_message_safe(
+            logger=logger,
+            message=f'{error_message}: {exc}',
+            code=traceback.format_exc(),
         )
-        if save_csv:
-            await save_to_csv(course_results, filename)
-            filenames.append(filename)
 
+
+def get_results_filename(course: models.Course) -> str:
+    return (
+        f'results_{course.short_name}_'
+        f'{datetime.now().strftime(constants.dt_format_filename)}.csv'
+    )
+
+
+async def send_results_report(
+    filenames: list[str],
+    base_logger: 'loguru.Logger',
+) -> None:
     try:
         await send.send_results(filenames)
     except Exception as exc:
@@ -104,11 +219,142 @@ async def job(  # pylint: disable=too-many-statements
             pathlib.Path(filename).unlink()
 
 
+def get_celery_client() -> celery.Celery:
+    """
+    Get celery app to send tasks to workers by their names.
+    """
+    settings = get_settings()
+    return celery.Celery(
+        broker=settings.CELERY_BROKER_URL,
+        backend=settings.CELERY_RESULT_BACKEND,
+        set_as_current=False,
+    )
+
+
+async def enqueue_update_results(
+    courses: list[models.Course],
+    base_logger: 'loguru.Logger',
+    save_csv: bool = True,
+    full_recompute: bool = False,
+) -> None:
+    """
+    Enqueue update of courses results into celery workers.
+
+    Due contests of each course are synced by separate tasks,
+    then results of the course are dumped. The report is sent
+    after results of all courses are dumped.
+    """
+    parent_id = uuid4().hex
+    async with SessionManager().create_async_session() as session:
+        contests_by_course = [
+            await contest_utils.get_contests(session, course.id)
+            for course in courses
+        ]
+        sync_states = await contest_utils.get_contests_sync_states(
+            session,
+            [
+                contest.id
+                for contests in contests_by_course
+                for contest in contests
+            ],
+        )
+    now = datetime.now(timezone.utc)
+    celery_client = get_celery_client()
+    course_signatures = []
+    for course, contests in zip(courses, contests_by_course):
+        sync_signatures = await get_contest_sync_signatures(
+            contest_utils.get_due_contests(
+                [
+                    (course, contest, sync_states.get(contest.id))
+                    for contest in contests
+                ],
+                now,
+            ),
+            parent_id,
+            celery_client,
+            base_logger=base_logger,
+        )
+        results_signature = celery_client.signature(
+            'dump_course_results',
+            kwargs={
+                'course_id': str(course.id),
+                'full_recompute': full_recompute,
+                'parent_id': parent_id,
+            },
+            immutable=True,
+        )
+        course_signatures.append(
+            celery.chain(celery.group(sync_signatures), results_signature)
+            if sync_signatures
+            else results_signature
+        )
+    if save_csv:
+        result = celery.chord(course_signatures)(
+            celery_client.signature(
+                'send_results_report', kwargs={'parent_id': parent_id}
+            )
+        )
+    else:
+        result = celery.group(course_signatures).apply_async()
+    base_logger.info(
+        'Update of {} courses sent to celery, parent_id={}, task {}',
+        len(courses),
+        parent_id,
+        result.id,
+    )
+
+
+async def get_contest_sync_signatures(
+    due_contests: list[
+        tuple[models.Course, models.Contest, models.ContestSyncState | None]
+    ],
+    parent_id: str,
+    celery_client: celery.Celery,
+    base_logger: 'loguru.Logger',
+) -> list[celery.Signature]:
+    """
+    Get celery tasks to sync contests, which sync is not claimed yet.
+    """
+    signatures = []
+    for course, contest, _ in due_contests:
+        task_id = str(uuid4())
+        if not await contest_utils.claim_contest_sync(contest.id, task_id):
+            base_logger.info(
+                'Contest {} sync is already enqueued, skipping', contest
+            )
+            continue
+        signatures.append(
+            celery_client.signature(
+                'sync_contest',
+                kwargs={
+                    'course_id': str(course.id),
+                    'contest_id': str(contest.id),
+                    'parent_id': parent_id,
+                },
+                immutable=True,
+                task_id=task_id,
+            )
+        )
+    return signatures
+
+
 async def update_course_results(
     course: models.Course,
     base_logger: 'loguru.Logger',
+    sync_contests: bool = True,
+    semaphore: asyncio.Semaphore | None = None,
 ) -> None:
-    SessionManager().refresh()
+    """
+    Check student relations of course contests and sync due contests.
+
+    Contests are processed concurrently, each in its own sessions,
+    and an error in one of them does not stop the others.
+
+    :param sync_contests: Sync due contests, False if they
+        are synced by celery tasks.
+    :param semaphore: Limits contests processed at once,
+        by default to UPDATE_RESULTS_CONCURRENCY.
+    """
     async with SessionManager().create_async_session() as session:
         contests = await contest_utils.get_contests(session, course.id)
         students_sc_departments = (
@@ -128,13 +374,91 @@ async def update_course_results(
             f'Course {course.id} has {course.contest_count} '
             f'contest count, but got {len(contests)} contests'
         )
+    async with SessionManager().create_async_session() as session:
+        sync_states = await contest_utils.get_contests_sync_states(
+            session, [contest.id for contest in contests]
+        )
+    due_contests = (
+        contest_utils.get_due_contests(
+            [
+                (None, contest, sync_states.get(contest.id))
+                for contest in contests
+            ],
+            datetime.now(timezone.utc),
+        )
+        if sync_contests
+        else []
+    )
+    due_contest_ids = {contest.id for _, contest, _ in due_contests}
+    base_logger.info(
+        '{} of {} contests are due to sync',
+        len(due_contest_ids),
+        len(contests),
+    )
+    contests_aws = []
     for contest in contests:
+        if contest.id in due_contest_ids:
+            continue
         logger = base_logger.bind(
             contest={
                 'id': contest.id,
                 'yandex_contest_id': contest.yandex_contest_id,
             }
         )
+        contests_aws.append(
+            run_logging_errors(
+                check_student_contest_relations(
+                    contest, students_sc_departments, base_logger=logger
+                ),
+                f'Error while checking relations of contest '
+                f'{contest.yandex_contest_id}',
+                logger,
+            )
+        )
+    for _, contest, _ in due_contests:
+        contests_aws.append(
+            run_logging_errors(
+                sync_contest(
+                    course,
+                    contest,
+                    students_sc_departments,
+                    base_logger=base_logger,
+                ),
+                f'Error while syncing contest {contest.yandex_contest_id}',
+                base_logger,
+            )
+        )
+    await common_utils.gather_bounded(
+        contests_aws,
+        semaphore
+        or asyncio.Semaphore(get_settings().UPDATE_RESULTS_CONCURRENCY),
+    )
+
+
+async def sync_contest(
+    course: models.Course,
+    contest: models.Contest,
+    students_sc_departments: list[
+        tuple[models.Student, models.StudentCourse, models.Department]
+    ],
+    base_logger: 'loguru.Logger',
+) -> bool:
+    """
+    Sync new submissions of contest and schedule its next sync.
+
+    :return: False if contest is being synced by another job
+    """
+    logger = base_logger.bind(
+        contest={
+            'id': contest.id,
+            'yandex_contest_id': contest.yandex_contest_id,
+        }
+    )
+    lock = contest_utils.get_sync_lock(contest.id)
+    if lock.locked():
+        logger.info('Contest {} is being synced, skipping', contest)
+        return False
+    async with lock:
         logger.info('Contest: {}', contest)
         await check_student_contest_relations(
             contest,
@@ -142,31 +466,88 @@ async def update_course_results(
             base_logger=logger,
         )
         async with SessionManager().create_async_session() as session:
-            last_updated_submission_model = (
-                await submission_utils.get_last_updated_submission(
-                    session, contest.id
-                )
+            sync_state = await contest_utils.get_contest_sync_state(
+                session, contest.id
             )
-            last_updated_submission = (
-                last_updated_submission_model.run_id
-                if last_updated_submission_model
-                else -1
+            last_updated_submission = await get_last_updated_run_id(
+                session, contest, sync_state
             )
             contest_levels = await contest_utils.get_contest_levels(
                 session, contest.id
             )
             contest_levels.sort(key=lambda x: (x.count_method, x.ok_threshold))
-        submissions = await contest_utils.get_new_submissions(
-            contest, last_updated_submission, logger=logger
+        sync_start = time.monotonic()
+        submissions, remote_count = await contest_utils.get_new_submissions(
+            contest,
+            last_updated_submission,
+            logger=logger,
+            known_count=sync_state.remote_count if sync_state else None,
         )
         submissions.sort(key=lambda x: x.id)
-        await process_submissions(
-            course,
+        now = datetime.now(timezone.utc)
+        submissions_rate = contest_utils.get_submissions_rate(
+            sync_state, len(submissions), now
+        )
+        next_sync_at = contest_utils.get_next_sync_at(
+            contest, submissions_rate, now
+        )
+        logger.info(
+            'Contest {} has {:.2f} submissions per hour, next sync at {}',
             contest,
-            contest_levels,
-            submissions,
-            base_logger=logger,
+            submissions_rate,
+            next_sync_at,
         )
+        async with SessionManager().create_async_session() as session:
+            await process_submissions(
+                course,
+                contest,
+                contest_levels,
+                submissions,
+                base_logger=logger,
+                session=session,
+            )
+            await contest_utils.save_contest_sync_state(
+                session,
+                contest.id,
+                last_run_id=max(
+                    (submission.id for submission in submissions),
+                    default=last_updated_submission,
+                ),
+                remote_count=remote_count,
+                sync_duration=time.monotonic() - sync_start,
+                submissions_rate=submissions_rate,
+                next_sync_at=next_sync_at,
+            )
+    return True
+
+
+async def get_last_updated_run_id(
+    session: AsyncSession,
+    contest: models.Contest,
+    sync_state: models.ContestSyncState | None,
+) -> int:
+    """
+    Get run id to fetch submissions of contest after.
+
+    Contests synced before the sync state was saved fall back
+    to the last submission in database. Without bulk ingestion every
+    submission is committed by its own session, so the state can be
+    behind submissions of a failed sync, and the last submission
+    in database is used if it is newer.
+    """
+    if sync_state is not None and get_settings().UPDATE_RESULTS_BULK_INGESTION:
+        return sync_state.last_run_id
+    last_updated_submission_model = (
+        await submission_utils.get_last_updated_submission(session, contest.id)
+    )
+    last_run_id = (
+        last_updated_submission_model.run_id
+        if last_updated_submission_model
+        else -1
+    )
+    if sync_state is not None:
+        return max(sync_state.last_run_id, last_run_id)
+    return last_run_id
 
 
 async def check_student_contest_relations(
@@ -178,7 +559,6 @@ async def check_student_contest_relations(
     session: AsyncSession | None = None,
 ) -> None:
     if session is None:
-        SessionManager().refresh()
         async with SessionManager().create_async_session() as session:
             return await check_student_contest_relations(
                 contest,
@@ -186,13 +566,16 @@ async def check_student_contest_relations(
                 base_logger=base_logger,
                 session=session,
             )
+    student_contests = await contest_utils.get_student_contest_relations(
+        session, contest.id
+    )
+    new_author_ids: dict[UUID, int] = {}
+    missing_author_ids: dict[UUID, int] = {}
     for student, student_course, _ in students_sc_departments:
         logger = base_logger.bind(
             student={'id': student.id, 'contest_login': student.contest_login}
         )
-        student_contest = await contest_utils.get_student_contest_relation(
-            session, student.id, contest.id
-        )
+        student_contest = student_contests.get(student.id)
 
         if student_contest is None:
             if (
@@ -211,30 +594,35 @@ async def check_student_contest_relations(
                 student.id,
                 contest.id,
             )
-            student_contest = await contest_utils.add_student_contest_relation(
+            new_author_ids[student.id] = await contest_utils.resolve_author_id(
                 session,
-                student.id,
-                contest.id,
-                contest.course_id,
-                await contest_utils.get_author_id(
-                    student.contest_login,
-                    contest.yandex_contest_id,
-                    logger=logger,
-                ),
+                contest,
+                student.contest_login,
+                logger=logger,
             )
-            session.add(student_contest)
         elif student_contest.author_id is None:
             logger.info(
                 'Student {} has no author id in contest {}, adding',
                 student.id,
                 contest.id,
             )
-            student_contest.author_id = await contest_utils.get_author_id(
+            missing_author_ids[
+                student.id
+            ] = await contest_utils.resolve_author_id(
+                session,
+                contest,
                 student.contest_login,
-                contest.yandex_contest_id,
                 logger=logger,
             )
-            session.add(student_contest)
+    await contest_utils.add_student_contest_relations(
+        session, contest.id, contest.course_id, new_author_ids
+    )
+    await course_utils.mark_student_courses_results_dirty(
+        session, contest.course_id, list(new_author_ids)
+    )
+    await contest_utils.update_student_contest_author_ids(
+        session, contest.id, missing_author_ids
+    )
 
 
 async def process_submissions(  # pylint: disable=too-many-arguments
@@ -243,8 +631,26 @@ async def process_submissions(  # pylint: disable=too-many-arguments
     contest_levels: list[models.ContestLevels],
     submissions: list[contest_schemas.ContestSubmissionFull],
     base_logger: 'loguru.Logger',
+    session: AsyncSession | None = None,
 ) -> None:
+    """
+    Process new submissions of contest.
+
+    :param session: Session for bulk ingestion, submissions are written
+        in its transaction. Without bulk ingestion every submission is
+        written by its own session.
+    """
     base_logger.info('Got {} submissions for process', len(submissions))
+    if get_settings().UPDATE_RESULTS_BULK_INGESTION:
+        await process_submissions_bulk(
+            course,
+            contest,
+            contest_levels,
+            submissions,
+            base_logger=base_logger,
+            session=session,
+        )
+        return
     for submission in submissions:
         async with SessionManager().create_async_session() as session:
             task = await task_utils.get_task(
@@ -265,6 +671,223 @@ async def process_submissions(  # pylint: disable=too-many-arguments
         )
 
 
+async def process_submissions_bulk(  # noqa: C901 # pylint: disable=too-many-arguments,too-many-locals,too-many-branches
+    course: models.Course,
+    contest: models.Contest,
+    contest_levels: list[models.ContestLevels],
+    submissions: list[contest_schemas.ContestSubmissionFull],
+    base_logger: 'loguru.Logger',
+    session: AsyncSession | None = None,
+    submission_models: dict[int, models.Submission] | None = None,
+) -> None:
+    """
+    Process new submissions of contest in one transaction.
+
+    Tasks, students and existing submissions are loaded by a few
+    queries for all submissions, scores are folded in memory in the
+    same order as in process_submission, and changes are written by
+    executemany statements.
+
+    :param submission_models: Submissions in database by run id,
+        which are updated by submissions instead of adding new ones
+    """
+    if session is None:
+        async with SessionManager().create_async_session() as session:
+            return await process_submissions_bulk(
+                course,
+                contest,
+                contest_levels,
+                submissions,
+                base_logger=base_logger,
+                session=session,
+                submission_models=submission_models,
+            )
+    submission_models = submission_models or {}
+    if not submissions:
+        return
+    tasks = {
+        task.yandex_task_id: task
+        for task in await task_utils.get_tasks(session, contest.id)
+    }
+    for submission in submissions:
+        if submission.problemId not in tasks:
+            raise RuntimeError(
+                f'Task {submission.problemId} not '
+                f'found for contest {contest.id}'
+            )
+    students = await student_utils.get_all_student_models_by_author_ids(
+        session,
+        course.id,
+        contest.id,
+        list({submission.authorId for submission in submissions}),
+    )
+    student_tasks = await task_utils.get_student_tasks(
+        session,
+        contest.id,
+        list({student.id for student, _, _ in students.values()}),
+    )
+    submission_ids = await submission_utils.get_submission_ids_by_run_ids(
+        session, [submission.id for submission in submissions]
+    )
+    # formula of every task is evaluated once for all its submissions
+    submissions_by_task: dict[
+        str, list[contest_schemas.ContestSubmissionFull]
+    ] = collections.defaultdict(list)
+    for submission in submissions:
+        submissions_by_task[submission.problemId].append(submission)
+    scores = {
+        submission.id: submission_scores
+        for problem_id, task_submissions in submissions_by_task.items()
+        for submission, submission_scores in zip(
+            task_submissions,
+            submission_utils.get_submissions_scores(
+                contest, tasks[problem_id], task_submissions
+            ),
+        )
+    }
+    # missing relations of students with tasks are created by one query
+    new_student_tasks: set[tuple[UUID, UUID]] = set()
+    for submission in submissions:
+        student, student_course, student_contest = students.get(
+            submission.authorId, (None, None, None)
+        )
+        if (
+            student is not None
+            and student_course is not None
+            and student_contest is not None
+        ):
+            new_student_tasks.add((student.id, tasks[submission.problemId].id))
+    new_student_tasks -= student_tasks.keys()
+    if new_student_tasks:
+        base_logger.info(
+            'Creating {} student task relations', len(new_student_tasks)
+        )
+        student_tasks.update(
+            await task_utils.get_or_create_student_tasks(
+                session, course.id, contest.id, list(new_student_tasks)
+            )
+        )
+    # objects are changed in memory and written by bulk statements
+    session.expunge_all()
+
+    new_submissions: list[models.Submission] = []
+    changed: dict[
+        type, dict[UUID, models.BaseModel]
+    ] = collections.defaultdict(dict)
+    for submission in submissions:
+        task = tasks[submission.problemId]
+        student, student_course, student_contest = students.get(
+            submission.authorId, (None, None, None)
+        )
+        if (
+            student is None
+            or student_course is None
+            or student_contest is None
+        ):
+            await report_unknown_author(
+                task,
+                submission,
+                student,
+                student_course,
+                student_contest,
+                base_logger=base_logger,
+            )
+            continue
+        logger = base_logger.bind(
+            student={
+                'id': student.id,
+                'contest_login': student.contest_login,
+            },
+        )
+        student_task = student_tasks[(student.id, task.id)]
+        submission_model = submission_models.get(submission.id)
+        if submission_model is not None:
+            submission_model.verdict = submission.verdict
+            (
+                submission_model.score_no_deadline,
+                submission_model.score_before_finish,
+                submission_model.final_score,
+            ) = scores[submission.id]
+            changed[models.Submission][submission_model.id] = submission_model
+        elif submission.id in submission_ids:
+            await report_duplicate_submission(
+                submission.id, submission_ids[submission.id], logger
+            )
+            continue
+        else:
+            submission_model = submission_utils.make_submission_model(
+                student,
+                contest,
+                course,
+                task,
+                student_task,
+                submission,
+                scores=scores[submission.id],
+            )
+            submission_model.id = uuid4()
+            submission_ids[submission.id] = submission_model.id
+            new_submissions.append(submission_model)
+        logger = base_logger.bind(
+            submission={
+                'id': submission_model.id,
+                'author_id': submission.authorId,
+                'run_id': submission.id,
+            },
+        )
+        if apply_submission_scores(
+            task,
+            student_task,
+            student_contest,
+            student_course,
+            submission_model,
+            logger,
+        ):
+            changed[models.StudentTask][student_task.id] = student_task
+            changed[models.StudentContest][
+                student_contest.id
+            ] = student_contest
+            changed[models.StudentCourse][student_course.id] = student_course
+
+    base_logger.info(
+        'Writing {} submissions, {} updated submissions, '
+        '{} student tasks, {} student contests, {} student courses',
+        len(new_submissions),
+        len(changed[models.Submission]),
+        len(changed[models.StudentTask]),
+        len(changed[models.StudentContest]),
+        len(changed[models.StudentCourse]),
+    )
+    await common_utils.bulk_insert_models(
+        session,
+        new_submissions,
+        [
+            column.name
+            for column in models.Submission.__table__.columns
+            if not column.name.startswith('dt_')
+        ],
+    )
+    await common_utils.bulk_update_models(
+        session,
+        list(changed[models.Submission].values()),
+        ['verdict', 'final_score', 'score_no_deadline', 'score_before_finish'],
+    )
+    await common_utils.bulk_update_models(
+        session,
+        list(changed[models.StudentTask].values()),
+        _STUDENT_TASK_SCORE_COLUMNS,
+    )
+    await common_utils.bulk_update_models(
+        session,
+        list(changed[models.StudentContest].values()),
+        ['score', 'score_no_deadline', 'tasks_done'],
+    )
+    await common_utils.bulk_update_models(
+        session,
+        list(changed[models.StudentCourse].values()),
+        ['score', 'score_no_deadline', 'is_results_dirty'],
+    )
+
+
 async def process_submission(  # noqa: C901 # pylint: disable=too-many-arguments,too-many-branches,too-many-statements # TODO
     course: models.Course,
     contest: models.Contest,
@@ -276,7 +899,6 @@ async def process_submission(  # noqa: C901 # pylint: disable=too-many-arguments
     session: AsyncSession | None = None,
 ) -> None:
     if session is None:
-        SessionManager().refresh()
         async with SessionManager().create_async_session() as session:
             return await process_submission(
                 course,
@@ -299,34 +921,13 @@ async def process_submission(  # noqa: C901 # pylint: disable=too-many-arguments
         author_id=submission.authorId,
     )
     if student is None or student_course is None or student_contest is None:
-        logger = base_logger.bind(
-            task={'id': task.id, 'yandex_task_id': task.yandex_task_id},
-            submission={
-                'author_id': submission.authorId,
-                'run_id': submission.id,
-            },
-        )
-        logger.warning(
-            'No student with such author id {} (login {}): student {}, '
-            'student course {}, student contest {}. '
-            'Submission {} will not be processed',
-            submission.authorId,
-            submission.login,
+        await report_unknown_author(
+            task,
+            submission,
             student,
             student_course,
             student_contest,
-            submission.id,
-        )
-        await send.send_message_safe(
-            logger=logger,
-            message=f'No student with such author id '
-            f'{submission.authorId} (login {submission.login}): '
-            f'student {student}, '
-            f'student course {student_course}, '
-            f'student contest {student_contest}. '
-            f'Submission {submission.id} (https://admin.contest.yandex.ru/'
-            f'submissions/{submission.id}/) '
-            f'will not be processed',
+            base_logger=base_logger,
         )
         return
     logger = base_logger.bind(
@@ -337,7 +938,6 @@ async def process_submission(  # noqa: C901 # pylint: disable=too-many-arguments
         contest,
         course,
         task,
-        logger,
         session,
     )
     if submission_model:
@@ -354,16 +954,8 @@ async def process_submission(  # noqa: C901 # pylint: disable=too-many-arguments
             submission.id,
         )
         if submission_model is not None:
-            logger.warning(
-                'Submission {} already in database (id={})',
-                submission.id,
-                submission_model.id,
-            )
-            await send.send_message_safe(
-                logger,
-                message=f'Submission {submission.id} already '
-                f'in database (id={submission_model.id})',
-                level='warning',
+            await report_duplicate_submission(
+                submission.id, submission_model.id, logger
             )
             return
         submission_model = await submission_utils.add_submission(
@@ -383,80 +975,159 @@ async def process_submission(  # noqa: C901 # pylint: disable=too-many-arguments
             'run_id': submission.id,
         },
     )
-    if (  # pylint: disable=too-many-nested-blocks  # TODO
+    if apply_submission_scores(
+        task,
+        student_task,
+        student_contest,
+        student_course,
+        submission_model,
+        logger,
+    ):
+        session.add(student_task)
+        session.add(student_contest)
+        session.add(student_course)
+
+
+async def report_unknown_author(  # pylint: disable=too-many-arguments
+    task: models.Task,
+    submission: contest_schemas.ContestSubmissionFull,
+    student: models.Student | None,
+    student_course: models.StudentCourse | None,
+    student_contest: models.StudentContest | None,
+    base_logger: 'loguru.Logger',
+) -> None:
+    logger = base_logger.bind(
+        task={'id': task.id, 'yandex_task_id': task.yandex_task_id},
+        submission={
+            'author_id': submission.authorId,
+            'run_id': submission.id,
+        },
+    )
+    logger.warning(
+        'No student with such author id {} (login {}): student {}, '
+        'student course {}, student contest {}. '
+        'Submission {} will not be processed',
+        submission.authorId,
+        submission.login,
+        student,
+        student_course,
+        student_contest,
+        submission.id,
+    )
+    await send.send_message_safe(
+        logger=logger,
+        message=f'No student with such author id '
+        f'{submission.authorId} (login {submission.login}): '
+        f'student {student}, '
+        f'student course {student_course}, '
+        f'student contest {student_contest}. '
+        f'Submission {submission.id} (https://admin.contest.yandex.ru/'
+        f'submissions/{submission.id}/) '
+        f'will not be processed',
+    )
+
+
+async def report_duplicate_submission(
+    run_id: int, submission_id: UUID, logger: 'loguru.Logger'
+) -> None:
+    logger.warning(
+        'Submission {} already in database (id={})',
+        run_id,
+        submission_id,
+    )
+    await send.send_message_safe(
+        logger,
+        message=f'Submission {run_id} already '
+        f'in database (id={submission_id})',
+        level='warning',
+    )
+
+
+def apply_submission_scores(  # pylint: disable=too-many-arguments
+    task: models.Task,
+    student_task: models.StudentTask,
+    student_contest: models.StudentContest,
+    student_course: models.StudentCourse,
+    submission_model: models.Submission,
+    logger: 'loguru.Logger',
+) -> bool:
+    """
+    Fold scores of new submission into student task, contest and course.
+
+    Used by both per-submission and bulk processing,
+    so they evaluate results identically.
+
+    :return: True if submission is new best submission for task
+    """
+    if not (
         submission_model.final_score > student_task.final_score
         or submission_model.score_before_finish
         > student_task.best_score_before_finish
         or submission_model.score_no_deadline
         > student_task.best_score_no_deadline
     ):  # TODO: check block other transactions
-        is_done_submission = submission_model.final_score == task.score_max
+        return False
 
-        final_score_diff = max(
-            submission_model.final_score - student_task.final_score, 0
-        )
-        score_before_finish_diff = max(
-            submission_model.score_before_finish
-            - student_task.best_score_before_finish,
-            0,
-        )
-        no_deadline_score_diff = max(
-            submission_model.score_no_deadline
-            - student_task.best_score_no_deadline,
-            0,
-        )  # TODO: max no need?
-        is_done_diff = 0 if student_task.is_done else is_done_submission
+    is_done_submission = submission_model.final_score == task.score_max
 
-        logger.info(
-            'Submission {} is new best submission for task {}. '
-            'final_score_diff={}, score_before_finish_diff={}'
-            'no_deadline_score_diff={}, '
-            'is_done_diff={}',
-            submission.id,
-            task.id,
-            final_score_diff,
-            score_before_finish_diff,
-            no_deadline_score_diff,
-            is_done_diff,
-        )
+    final_score_diff = max(
+        submission_model.final_score - student_task.final_score, 0
+    )
+    score_before_finish_diff = max(
+        submission_model.score_before_finish
+        - student_task.best_score_before_finish,
+        0,
+    )
+    no_deadline_score_diff = max(
+        submission_model.score_no_deadline
+        - student_task.best_score_no_deadline,
+        0,
+    )  # TODO: max no need?
+    is_done_diff = 0 if student_task.is_done else is_done_submission
 
-        if score_before_finish_diff:
-            student_task.best_score_before_finish_submission_id = (
-                submission_model.id
-            )
-        if no_deadline_score_diff:
-            student_task.best_score_no_deadline_submission_id = (
-                submission_model.id
-            )
-        student_task.final_score = round(
-            student_task.final_score + final_score_diff, 4
-        )
-        student_task.best_score_before_finish = round(
-            student_task.best_score_before_finish + score_before_finish_diff, 4
-        )
-        student_task.best_score_no_deadline = round(
-            student_task.best_score_no_deadline + no_deadline_score_diff, 4
-        )
-        student_task.is_done = student_task.is_done or is_done_submission
+    logger.info(
+        'Submission {} is new best submission for task {}. '
+        'final_score_diff={}, score_before_finish_diff={}'
+        'no_deadline_score_diff={}, '
+        'is_done_diff={}',
+        submission_model.run_id,
+        task.id,
+        final_score_diff,
+        score_before_finish_diff,
+        no_deadline_score_diff,
+        is_done_diff,
+    )
 
-        student_contest.score = round(
-            student_contest.score + final_score_diff, 4
+    if score_before_finish_diff:
+        student_task.best_score_before_finish_submission_id = (
+            submission_model.id
         )
-        student_contest.score_no_deadline = round(
-            student_contest.score_no_deadline + no_deadline_score_diff, 4
-        )  # TODO: magic constant
-        student_contest.tasks_done += is_done_diff
+    if no_deadline_score_diff:
+        student_task.best_score_no_deadline_submission_id = submission_model.id
+    student_task.final_score = round(
+        student_task.final_score + final_score_diff, 4
+    )
+    student_task.best_score_before_finish = round(
+        student_task.best_score_before_finish + score_before_finish_diff, 4
+    )
+    student_task.best_score_no_deadline = round(
+        student_task.best_score_no_deadline + no_deadline_score_diff, 4
+    )
+    student_task.is_done = student_task.is_done or is_done_submission
 
-        student_course.score = round(
-            student_course.score + final_score_diff, 4
-        )
-        student_course.score_no_deadline = round(
-            student_course.score_no_deadline + no_deadline_score_diff, 4
-        )
+    student_contest.score = round(student_contest.score + final_score_diff, 4)
+    student_contest.score_no_deadline = round(
+        student_contest.score_no_deadline + no_deadline_score_diff, 4
+    )  # TODO: magic constant
+    student_contest.tasks_done += is_done_diff
 
-        session.add(student_task)
-        session.add(student_contest)
-        session.add(student_course)
+    student_course.score = round(student_course.score + final_score_diff, 4)
+    student_course.score_no_deadline = round(
+        student_course.score_no_deadline + no_deadline_score_diff, 4
+    )
+    student_course.is_results_dirty = True
+
+    return True
 
 
 async def check_student_task_relation(  # pylint: disable=too-many-arguments
@@ -464,95 +1135,109 @@ async def check_student_task_relation(  # pylint: disable=too-many-arguments
     contest: models.Contest,
     course: models.Course,
     task: models.Task,
-    logger: 'loguru.Logger',
     session: AsyncSession | None = None,
 ) -> models.StudentTask:
     if session is None:
-        SessionManager().refresh()
         async with SessionManager().create_async_session() as session:
             return await check_student_task_relation(
                 student,
                 contest,
                 course,
                 task,
-                logger,
                 session,
             )
-    student_task = await task_utils.get_student_task_relation(
-        session, student.id, task.id
+    return await task_utils.get_or_create_student_task_relation(
+        session,
+        student,
+        contest,
+        course,
+        task,
     )
 
-    if student_task is None:
-        logger.info(
-            'Student {} has no relation with task {}, creating',
-            student.id,
-            task.id,
-        )
-        student_task = await task_utils.add_student_task_relation(
-            session,
-            student,
-            contest,
-            course,
-            task,
-        )
-        session.add(student_task)
-    return student_task
-
 
 async def get_course_results(  # pylint: disable=too-many-statements
     course: models.Course,
     course_levels: list[models.CourseLevels],
     base_logger: 'loguru.Logger',
+    full_recompute: bool = True,
 ) -> course_schemas.CourseResultsCSV:
-    SessionManager().refresh()
+    """
+    Evaluate levels of students and get results of course.
+
+    :param full_recompute: Evaluate levels of all students. Otherwise,
+        only students with changed scores are evaluated.
+    """
     async with SessionManager().create_async_session() as session:
+        levels_data = await results_utils.get_course_levels_data(
+            session, course, course_levels
+        )
+        recompute_student_ids = {
+            student.id
+            for student, student_course, _ in levels_data.students
+            if full_recompute or student_course.is_results_dirty
+        }
+        levels_data.apply_changes(
+            results_utils.evaluate_course_levels(levels_data.make_matrix()),
+            recompute_student_ids,
+        )
+        await course_utils.clear_student_courses_results_dirty(
+            session,
+            [
+                student_course
+                for student, student_course, _ in levels_data.students
+                if student.id in recompute_student_ids
+            ],
+        )
+        await session.commit()
+        # dt_updated of changed relations is set by database, so they
+        # are refreshed before it is read for results
+        await contest_utils.get_course_student_contests(
+            session,
+            course.id,
+            list(recompute_student_ids),
+            populate_existing=True,
+        )
+        recomputed_count = len(recompute_student_ids)
         students_departments_results = []
-        for (
-            student,
-            student_course,
-            department,
-        ) in await student_utils.get_students_by_course_with_department(
-            session, course.id
-        ):
+        for student, student_course, department in levels_data.students:
             logger = base_logger.bind(
                 student={
                     'id': student.id,
                     'contest_login': student.contest_login,
                 }
             )
-            student_course_levels = [
-                await course_utils.get_or_create_student_course_level(
-                    session, student.id, course.id, course_level.id
-                )
-                for course_level in course_levels
-            ]
-            await results_utils.update_student_course_results(
-                student,
-                course,
-                course_levels,
-                student_course,
-                student_course_levels,
-                base_logger=logger,
-                session=session,
-            )
-            await session.commit()
-            student_course_contest_data = (
-                await course_utils.get_student_course_contests_data(
-                    session, course.id, student.id
-                )
-            )
             student_results = await results_utils.get_student_course_results(
                 student,
                 course,
                 course_levels,
                 student_course,
-                student_course_levels,
-                student_course_contest_data,
+                levels_data.get_student_course_levels(student.id),
+                levels_data.get_student_course_contests_data(student.id),
                 logger=logger,
             )
             students_departments_results.append(
                 (student, department, student_results)
             )
+        # only changed snapshots are written
+        snapshots = await results_utils.get_course_results_snapshots(
+            session, course.id
+        )
+        changed_snapshots = {}
+        for student, _, student_results in students_departments_results:
+            snapshot = student_results.dict()
+            if snapshots.get(student.id) != snapshot:
+                changed_snapshots[student.id] = snapshot
+        await results_utils.save_course_results_snapshots(
+            session, course.id, changed_snapshots
+        )
+        await session.commit()
+    base_logger.info(
+        'Levels are evaluated for {} of {} students, '
+        '{} results snapshots are updated',
+        recomputed_count,
+        len(students_departments_results),
+        len(changed_snapshots),
+    )
     course_results = course_schemas.CourseResultsCSV(
         keys=[
             'contest_login',
@@ -629,67 +1314,122 @@ async def save_to_csv(
     course_results: course_schemas.CourseResultsCSV, filename: str
 ) -> None:
     with open(filename, 'w', encoding='utf-8') as f:
-        f.write(','.join(course_results.keys))
-        f.write('\n')
-        for data in course_results.results.values():
-            for i, key in enumerate(course_results.keys):
-                f.write(f'{data.get(key, "")}')
-                if i != len(course_results.keys) - 1:
-                    f.write(',')
-            f.write('\n')
+        f.write(get_csv(course_results))
+
+
+def get_csv(course_results: course_schemas.CourseResultsCSV) -> str:
+    lines = [','.join(course_results.keys)]
+    for data in course_results.results.values():
+        lines.append(
+            ','.join(f'{data.get(key, "")}' for key in course_results.keys)
+        )
+    return '\n'.join(lines) + '\n'
 
 
 async def check_and_update_no_verdict_submissions(
     base_logger: 'loguru.Logger',
 ) -> None:
+    """
+    Check submissions without verdict which are due to check.
+
+    Submissions are checked by contests, each contest by batched
+    requests in its own transaction. Submissions still without verdict
+    are checked again after exponentially growing intervals.
+    """
     async with SessionManager().create_async_session() as session:
         no_verdict_submissions = (
-            await submission_utils.get_no_verdict_submissions(session)
-        )
-        for submission in no_verdict_submissions:
-            logger = base_logger.bind(
-                submission={
-                    'id': submission.id,
-                    'author_id': submission.author_id,
-                    'run_id': submission.run_id,
-                },
-                course={'id': submission.course_id},
-                contest={'id': submission.contest_id},
-                task={'id': submission.task_id},
-                student={'id': submission.student_id},
+            await submission_utils.get_no_verdict_submissions(
+                session, datetime.now(timezone.utc)
             )
-            contest = await contest_utils.get_contest_by_id(
-                session, submission.contest_id
-            )
-            yandex_submission = await contest_utils.get_submission_from_yandex(
-                contest, submission, logger
-            )
-            if yandex_submission.verdict == submission.verdict:
-                logger.info(
-                    'Submission {} has no verdict, skipping',
-                    yandex_submission.id,
+        )
+    submissions_by_contest: dict[
+        UUID, list[models.Submission]
+    ] = collections.defaultdict(list)
+    for submission in no_verdict_submissions:
+        submissions_by_contest[submission.contest_id].append(submission)
+    base_logger.info(
+        '{} submissions without verdict in {} contests are due to check',
+        len(no_verdict_submissions),
+        len(submissions_by_contest),
+    )
+    for contest_id, submissions in submissions_by_contest.items():
+        logger = base_logger.bind(contest={'id': contest_id})
+        await run_logging_errors(
+            check_contest_no_verdict_submissions(
+                contest_id, submissions, base_logger=logger
+            ),
+            f'Error while checking submissions without verdict '
+            f'of contest {contest_id}',
+            logger,
+        )
+
+
+async def check_contest_no_verdict_submissions(
+    contest_id: UUID,
+    submissions: list[models.Submission],
+    base_logger: 'loguru.Logger',
+) -> None:
+    async with SessionManager().create_async_session() as session:
+        contest = await contest_utils.get_contest_by_id(session, contest_id)
+        course = await course_utils.get_course_by_id(
+            session, contest.course_id
+        )
+        contest_levels = await contest_utils.get_contest_levels(
+            session, contest.id
+        )
+        logger = base_logger.bind(
+            course={'id': course.id, 'short_name': course.short_name},
+            contest={
+                'id': contest.id,
+                'yandex_contest_id': contest.yandex_contest_id,
+            },
+        )
+        yandex_submissions = await contest_utils.get_submissions_from_yandex(
+            contest, submissions, logger
+        )
+        submission_models = {
+            submission.run_id: submission for submission in submissions
+        }
+        verdicts = {
+            submission.run_id: submission.verdict for submission in submissions
+        }
+        checked_submissions = [
+            yandex_submission
+            for yandex_submission in yandex_submissions
+            if yandex_submission.verdict != verdicts[yandex_submission.id]
+        ]
+        await process_submissions_bulk(
+            course,
+            contest,
+            contest_levels,
+            checked_submissions,
+            base_logger=logger,
+            session=session,
+            submission_models=submission_models,
+        )
+        # including submissions with verdict which were not processed
+        pending_submissions = [
+            submission_models[yandex_submission.id]
+            for yandex_submission in yandex_submissions
+            if submission_models[yandex_submission.id].verdict
+            == verdicts[yandex_submission.id]
+        ]
+        now = datetime.now(timezone.utc)
+        for submission in pending_submissions:
+            submission.verdict_checks_count += 1
+            submission.next_verdict_check_at = (
+                submission_utils.get_next_verdict_check_at(
+                    submission.verdict_checks_count, now
                 )
-                continue
-            course = await course_utils.get_course_by_id(
-                session, submission.course_id
-            )
-            contest_levels = await contest_utils.get_contest_levels(
-                session, contest.id
-            )
-            task = await task_utils.get_task_by_id(session, submission.task_id)
-            await process_submission(
-                course,
-                contest=contest,
-                contest_levels=contest_levels,
-                task=task,
-                submission=yandex_submission,
-                base_logger=logger.bind(
-                    course={'id': course.id, 'short_name': course.short_name},
-                    contest={
-                        'id': contest.id,
-                        'yandex_contest_id': contest.yandex_contest_id,
-                    },
-                ),
-                submission_model=submission,
-                session=session,
             )
+        logger.info(
+            'Checked {} submissions without verdict, {} are still '
+            'without verdict',
+            len(yandex_submissions),
+            len(pending_submissions),
+        )
+        await common_utils.bulk_update_models(
+            session,
+            pending_submissions,
+            ['verdict_checks_count', 'next_verdict_check_at'],
+        )
@@ -1,4 +1,9 @@
-from .application_health.ping import PingMessage, PingResponse
+from .application_health.ping import (
+    DatabasePoolStatus,
+    PingMessage,
+    PingResponse,
+    YandexApiGovernorStatus,
+)
 from .auth.token import Token, TokenData
 from .auth.user import User as UserSchema
 from .contest.create import ContestCreateRequest
@@ -9,6 +14,7 @@ from .course.course import CourseBase, CourseResponse
 from .course.results import CourseResultsCSV
 from .department.department import DepartmentBase, DepartmentResponse
 from .register.register import RegisterRequest, RegisterResponse
+from .results.batch import StudentResultsBatchItem, StudentResultsBatchRequest
 from .results.results import (
     ContestResults,
     CourseLevelResults,
@@ -21,6 +27,8 @@ from .status.database import DatabaseStatus
 __all__ = [
     'PingResponse',
     'PingMessage',
+    'DatabasePoolStatus',
+    'YandexApiGovernorStatus',
     'Token',
     'UserSchema',
     'TokenData',
@@ -35,6 +43,8 @@ __all__ = [
     'ContestSubmissionFull',
     'CourseResultsCSV',
     'StudentResults',
+    'StudentResultsBatchRequest',
+    'StudentResultsBatchItem',
     'CourseResults',
     'ContestResults',
     'Level',
@@ -12,3 +12,20 @@ class PingMessage(str, Enum):
 class PingResponse(BaseModel):
     message: PingMessage
     detail: str | None
+
+
+class DatabasePoolStatus(BaseModel):
+    size: int
+    checked_in: int
+    checked_out: int
+    overflow: int
+    engines: int
+
+
+class YandexApiGovernorStatus(BaseModel):
+    queue_depth: int
+    in_flight: int
+    acquired_count: int
+    throttled_count: int
+    total_wait_time: float
+    max_wait_time: float
@@ -0,0 +1,21 @@
+from pydantic import BaseModel, Field
+
+from .results import StudentResults
+
+
+# the most students of one batch request
+BATCH_MAX_SIZE = 1000
+
+
+class StudentResultsBatchRequest(BaseModel):
+    contest_logins: list[str] = Field(
+        ..., min_items=1, max_items=BATCH_MAX_SIZE
+    )
+    course_short_name: str | None = None
+
+
+class StudentResultsBatchItem(BaseModel):
+    """Results of student in batch, results are null if no student"""
+
+    contest_login: str
+    results: StudentResults | None
@@ -0,0 +1,16 @@
+from .service import (
+    close_redis_client,
+    get_redis_client,
+    get_task_result_content,
+    get_task_status,
+    wait_task_result,
+)
+
+
+__all__ = [
+    'close_redis_client',
+    'get_redis_client',
+    'get_task_result_content',
+    'get_task_status',
+    'wait_task_result',
+]
@@ -0,0 +1,105 @@
+import asyncio
+import typing as tp
+
+from celery import result as celery_result
+from celery import states
+from redis import asyncio as aioredis
+from starlette.concurrency import run_in_threadpool
+
+from app.config import get_settings
+
+
+# client of result backend and its event loop, created once
+_redis_client: tuple[aioredis.Redis, asyncio.AbstractEventLoop] | None = None
+
+
+def get_redis_client() -> aioredis.Redis:
+    """
+    Get client of result backend, shared by all waiting requests.
+
+    Connections of the client are pooled, but can be used only in the
+    loop they are opened in, so the client is recreated if the running
+    loop has changed.
+    """
+    global _redis_client  # pylint: disable=global-statement
+    loop = asyncio.get_running_loop()
+    if _redis_client is None or _redis_client[1] is not loop:
+        _redis_client = (
+            aioredis.from_url(get_settings().CELERY_RESULT_BACKEND),
+            loop,
+        )
+    return _redis_client[0]
+
+
+async def close_redis_client() -> None:
+    global _redis_client  # pylint: disable=global-statement
+    if _redis_client is None:
+        return
+    client, loop = _redis_client
+    _redis_client = None
+    if loop is asyncio.get_running_loop():
+        await client.close()
+
+
+async def get_task_status(result: celery_result.AsyncResult) -> str:
+    # redis client of celery backend is blocking
+    return await run_in_threadpool(lambda: result.status)
+
+
+async def wait_task_result(
+    task_id: str, timeout: float
+) -> tuple[celery_result.AsyncResult, str]:
+    """
+    Wait until task is ready, but no longer than timeout seconds.
+
+    Result backend publishes meta of task to the channel named as its
+    key on every update, so the task is checked again only when it is
+    updated, not in a polling loop.
+
+    :return: Result of task and its last status
+    """
+    result = celery_result.AsyncResult(task_id)
+    status = await get_task_status(result)
+    if timeout <= 0 or status in states.READY_STATES:
+        return result, status
+    loop = asyncio.get_running_loop()
+    deadline = loop.time() + timeout
+    async with get_redis_client().pubsub() as pubsub:
+        await pubsub.subscribe(result.backend.get_key_for_task(task_id))
+        # task could be finished before subscription
+        status = await get_task_status(result)
+        while status not in states.READY_STATES:
+            remaining = deadline - loop.time()
+            if remaining <= 0:
+                break
+            if await pubsub.get_message(
+                ignore_subscribe_messages=True, timeout=remaining
+            ):
+                status = await get_task_status(result)
+    return result, status
+
+
+def get_task_result_content(
+    result: celery_result.AsyncResult,
+    status: str,
+) -> dict[str, tp.Any]:
+    """
+    Get content of task result by status got by wait_task_result.
+
+    Meta of ready task is cached by the result, so the backend
+    is not requested again.
+    """
+    ready = status in states.READY_STATES
+    messages = None
+    if ready:
+        if status != states.SUCCESS:
+            messages = [
+                'Произошла ошибка. Попробуйте еще раз '
+                'или напишите администратору.'
+            ]
+        else:
+            messages = result.result
+    return {
+        'ready': ready,
+        'messages': messages,
+    }
@@ -1,3 +1,5 @@
+from .bulk import bulk_insert_models, bulk_update_models, get_or_create_models
+from .concurrency import gather_bounded
 from .datetime_utils import get_datetime_msk_tz
 from .hostname import get_hostname
 from .password import hash_password
@@ -7,4 +9,8 @@ __all__ = [
     'get_hostname',
     'hash_password',
     'get_datetime_msk_tz',
+    'bulk_insert_models',
+    'bulk_update_models',
+    'get_or_create_models',
+    'gather_bounded',
 ]
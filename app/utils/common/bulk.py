@@ -0,0 +1,111 @@
+import typing as tp
+
+from sqlalchemy import bindparam, insert, select, tuple_, update
+from sqlalchemy.dialects import postgresql
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.database import models
+
+
+M = tp.TypeVar('M', bound=models.BaseModel)
+
+
+def _make_rows(
+    objects: tp.Iterable[models.BaseModel], columns: list[str]
+) -> list[dict[str, tp.Any]]:
+    return [
+        {column: getattr(obj, column) for column in columns} for obj in objects
+    ]
+
+
+async def bulk_insert_models(
+    session: AsyncSession,
+    objects: tp.Sequence[models.BaseModel],
+    columns: list[str],
+) -> None:
+    """
+    Insert objects of one model by executemany INSERT.
+
+    Objects are not added to session, so `columns` must contain
+    all values to write, including client-side generated `id`.
+    """
+    if not objects:
+        return
+    await session.execute(
+        insert(type(objects[0]).__table__), _make_rows(objects, columns)
+    )
+
+
+async def bulk_update_models(
+    session: AsyncSession,
+    objects: tp.Sequence[models.BaseModel],
+    columns: list[str],
+) -> None:
+    """
+    Update `columns` of objects of one model by executemany UPDATE by id.
+    """
+    if not objects:
+        return
+    table = type(objects[0]).__table__
+    await session.execute(
+        update(table)
+        .where(table.c.id == bindparam('b_id'))
+        .values({column: bindparam(f'b_{column}') for column in columns}),
+        [
+            {f'b_{key}': value for key, value in row.items()}
+            for row in _make_rows(objects, ['id', *columns])
+        ],
+    )
+
+
+async def get_or_create_models(
+    session: AsyncSession,
+    model: type[M],
+    rows: list[dict[str, tp.Any]],
+    index_elements: list[str],
+) -> list[M]:
+    """
+    Get or create objects of model by INSERT ... ON CONFLICT DO NOTHING
+    RETURNING for each 1000 rows.
+
+    Rows conflicting by unique `index_elements` are not written, so no
+    rows are locked, and existing objects are got by one SELECT.
+    Concurrent calls never create duplicates.
+
+    :return: Objects in order of first occurrence of their rows
+    """
+
+    def _get_key(obj: tp.Any) -> tuple[tp.Any, ...]:
+        if isinstance(obj, dict):
+            return tuple(obj[column] for column in index_elements)
+        return tuple(getattr(obj, column) for column in index_elements)
+
+    unique_rows = list({_get_key(row): row for row in rows}.values())
+    objects = {}
+    for i in range(0, len(unique_rows), 1000):
+        chunk = unique_rows[i : i + 1000]
+        query = (
+            postgresql.insert(model)
+            .values(chunk)
+            .on_conflict_do_nothing(index_elements=index_elements)
+            .returning(*model.__table__.columns)
+        )
+        for obj in (
+            (await session.execute(select(model).from_statement(query)))
+            .scalars()
+            .all()
+        ):
+            objects[_get_key(obj)] = obj
+        existing_keys = [
+            _get_key(row) for row in chunk if _get_key(row) not in objects
+        ]
+        if not existing_keys:
+            continue
+        query = select(model).where(
+            tuple_(*[getattr(model, column) for column in index_elements]).in_(
+                existing_keys
+            )
+        )
+        for obj in (await session.execute(query)).scalars().all():
+            objects[_get_key(obj)] = obj
+    return [objects[_get_key(row)] for row in unique_rows]
@@ -0,0 +1,24 @@
+import asyncio
+import typing as tp
+
+
+T = tp.TypeVar('T')
+
+
+async def gather_bounded(
+    aws: tp.Iterable[tp.Awaitable[T]],
+    semaphore: asyncio.Semaphore,
+) -> list[T]:
+    """
+    Await all awaitables, running no more of them at once
+    than the semaphore allows.
+
+    Awaitables start in the given order, so with a semaphore
+    of one they are awaited one by one. Results are in the same order.
+    """
+
+    async def _bounded(aw: tp.Awaitable[T]) -> T:
+        async with semaphore:
+            return await aw
+
+    return list(await asyncio.gather(*[_bounded(aw) for aw in aws]))
@@ -12,13 +12,47 @@ from .database import (
     get_student_contest_relation,
     is_student_registered_on_contest,
 )
+from .levels import (
+    get_course_contest_levels,
+    get_or_create_course_student_contest_levels,
+    get_student_contest_levels,
+)
+from .participants import (
+    get_contest_participants,
+    get_participants_index,
+    resolve_author_id,
+    save_contest_participants,
+)
+from .polling import (
+    claim_contest_sync,
+    extend_contest_sync,
+    get_due_contests,
+    get_next_sync_at,
+    get_poll_interval,
+    get_submissions_rate,
+    get_sync_lock,
+    is_sync_due,
+    keep_contest_sync,
+    release_contest_sync,
+)
+from .relations import (
+    add_student_contest_relations,
+    get_course_student_contests,
+    get_student_contest_relations,
+    update_student_contest_author_ids,
+)
 from .service import (
     add_student_to_contest,
-    get_author_id,
     get_contest_info,
     get_new_submissions,
-    get_or_create_student_contest,
-    get_submission_from_yandex,
+    get_participants_login_to_id,
+    get_submissions_from_yandex,
+    register_participant,
+)
+from .sync_state import (
+    get_contest_sync_state,
+    get_contests_sync_states,
+    save_contest_sync_state,
 )
 
 
@@ -32,13 +66,37 @@ __all__ = [
     'get_contests_with_relations',
     'get_contest_info',
     'get_contest_by_yandex_contest_id',
-    'get_author_id',
     'get_ok_author_ids',
-    'get_or_create_student_contest',
     'get_new_submissions',
     'get_contest_levels',
     'get_or_create_student_contest_level',
-    'get_submission_from_yandex',
+    'get_submissions_from_yandex',
     'get_contest_by_id',
     'get_contest_by_lecture',
+    'get_participants_login_to_id',
+    'register_participant',
+    'get_contest_participants',
+    'save_contest_participants',
+    'get_participants_index',
+    'resolve_author_id',
+    'get_student_contest_relations',
+    'add_student_contest_relations',
+    'update_student_contest_author_ids',
+    'get_course_contest_levels',
+    'get_course_student_contests',
+    'get_student_contest_levels',
+    'get_or_create_course_student_contest_levels',
+    'get_contest_sync_state',
+    'save_contest_sync_state',
+    'get_contests_sync_states',
+    'get_due_contests',
+    'claim_contest_sync',
+    'extend_contest_sync',
+    'get_next_sync_at',
+    'get_poll_interval',
+    'get_submissions_rate',
+    'get_sync_lock',
+    'is_sync_due',
+    'keep_contest_sync',
+    'release_contest_sync',
 ]
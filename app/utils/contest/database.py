@@ -9,6 +9,7 @@ from app.database.models import (
     StudentContest,
     StudentContestLevels,
 )
+from app.utils import common as common_utils
 
 
 async def get_all_contests(session: AsyncSession) -> list[Contest]:
@@ -103,7 +104,7 @@ async def add_student_contest_relation(
     author_id: int,
 ) -> StudentContest:
     """
-    Add student contest relation.
+    Add student contest relation if it does not exist.
 
     :param session: Database session
     :param student_id: Student id
@@ -111,15 +112,21 @@ async def add_student_contest_relation(
     :param course_id: Course id
     :param author_id: Author id in yandex contest
 
-    :return: Student contest relation
+    :return: Added or existing student contest relation
     """
-    student_contest = StudentContest(
-        student_id=student_id,
-        contest_id=contest_id,
-        course_id=course_id,
-        author_id=author_id,
+    (student_contest,) = await common_utils.get_or_create_models(
+        session,
+        StudentContest,
+        [
+            {
+                'student_id': student_id,
+                'contest_id': contest_id,
+                'course_id': course_id,
+                'author_id': author_id,
+            }
+        ],
+        index_elements=['student_id', 'contest_id'],
     )
-    session.add(student_contest)
     return student_contest
 
 
@@ -196,21 +203,17 @@ async def get_or_create_student_contest_level(
     contest_id: UUID,
     level_id: UUID,
 ) -> StudentContestLevels:
-    query = (
-        select(StudentContestLevels)
-        .where(StudentContestLevels.student_id == student_id)
-        .where(StudentContestLevels.contest_id == contest_id)
-        .where(StudentContestLevels.course_id == course_id)
-        .where(StudentContestLevels.contest_level_id == level_id)
+    (student_contest_level,) = await common_utils.get_or_create_models(
+        session,
+        StudentContestLevels,
+        [
+            {
+                'student_id': student_id,
+                'course_id': course_id,
+                'contest_id': contest_id,
+                'contest_level_id': level_id,
+            }
+        ],
+        index_elements=['student_id', 'contest_level_id'],
     )
-    student_contest_level = await session.scalar(query)
-    if student_contest_level is None:
-        student_contest_level = StudentContestLevels(
-            student_id=student_id,
-            course_id=course_id,
-            contest_id=contest_id,
-            contest_level_id=level_id,
-        )
-        session.add(student_contest_level)
-        await session.flush()
     return student_contest_level
@@ -0,0 +1,90 @@
+from uuid import UUID
+
+from sqlalchemy import select
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.database.models import (
+    ContestLevels,
+    StudentContest,
+    StudentContestLevels,
+)
+
+
+async def get_course_contest_levels(
+    session: AsyncSession,
+    course_id: UUID,
+) -> list[ContestLevels]:
+    """
+    Get levels of all contests of course.
+
+    :param session: Database session
+    :param course_id: Course id
+
+    :return: List of contest levels
+    """
+    query = select(ContestLevels).where(ContestLevels.course_id == course_id)
+    return (await session.execute(query)).scalars().all()
+
+
+async def get_student_contest_levels(
+    session: AsyncSession,
+    student_ids: list[UUID],
+    course_id: UUID,
+) -> list[StudentContestLevels]:
+    """
+    Get existing levels of students in all contests of course.
+
+    :param session: Database session
+    :param student_ids: Student ids
+    :param course_id: Course id
+
+    :return: List of student contest levels
+    """
+    query = (
+        select(StudentContestLevels)
+        .where(StudentContestLevels.student_id.in_(student_ids))
+        .where(StudentContestLevels.course_id == course_id)
+    )
+    return (await session.execute(query)).scalars().all()
+
+
+async def get_or_create_course_student_contest_levels(
+    session: AsyncSession,
+    course_id: UUID,
+) -> list[StudentContestLevels]:
+    """
+    Get levels of all student contest relations of course.
+
+    Missing levels are created by one INSERT ... ON CONFLICT DO NOTHING
+    for every level of every contest student has relation with.
+
+    :param session: Database session
+    :param course_id: Course id
+
+    :return: List of student contest levels
+    """
+    await session.execute(
+        insert(StudentContestLevels)
+        .from_select(
+            ['course_id', 'contest_id', 'student_id', 'contest_level_id'],
+            select(
+                StudentContest.course_id,
+                StudentContest.contest_id,
+                StudentContest.student_id,
+                ContestLevels.id,
+            )
+            .join(
+                ContestLevels,
+                ContestLevels.contest_id == StudentContest.contest_id,
+            )
+            .where(StudentContest.course_id == course_id),
+        )
+        .on_conflict_do_nothing(
+            index_elements=['student_id', 'contest_level_id']
+        )
+    )
+    query = select(StudentContestLevels).where(
+        StudentContestLevels.course_id == course_id
+    )
+    return (await session.execute(query)).scalars().all()
@@ -0,0 +1,185 @@
+import typing as tp
+from datetime import datetime, timedelta, timezone
+from uuid import UUID
+
+import httpx
+import loguru
+from sqlalchemy import delete, func, select, update
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.config import get_settings
+from app.database.models import Contest, ContestParticipant
+
+from .service import get_participants_login_to_id, register_participant
+
+
+# contest id -> (time of the last full refresh, login -> author id)
+_participants_cache: dict[UUID, tuple[datetime, dict[str, int]]] = {}
+
+
+async def get_contest_participants(
+    session: AsyncSession,
+    contest_id: UUID,
+) -> tuple[dict[str, int], datetime | None]:
+    """
+    Get saved participants index of contest.
+
+    :param session: Database session
+    :param contest_id: Contest id
+
+    :return: Dict of contest login to author id and time of the
+        oldest update, which is the time of the last full refresh
+    """
+    query = select(
+        ContestParticipant.login,
+        ContestParticipant.author_id,
+        ContestParticipant.dt_updated,
+    ).where(ContestParticipant.contest_id == contest_id)
+    participants: dict[str, int] = {}
+    refreshed_at = None
+    for login, author_id, dt_updated in await session.execute(query):
+        participants[login] = author_id
+        refreshed_at = min(refreshed_at or dt_updated, dt_updated)
+    return participants, refreshed_at
+
+
+async def save_contest_participants(
+    session: AsyncSession,
+    contest_id: UUID,
+    participants: dict[str, int],
+    removed_logins: tp.Iterable[str] = (),
+    mark_refreshed: bool = False,
+) -> None:
+    """
+    Insert or update participants of contest.
+
+    :param session: Database session
+    :param contest_id: Contest id
+    :param participants: Dict of contest login to author id to save
+    :param removed_logins: Logins which are not participants anymore
+    :param mark_refreshed: Mark all participants of contest as refreshed
+    """
+    items = list(participants.items())
+    for i in range(0, len(items), 1000):
+        insert_query = insert(ContestParticipant).values(
+            [
+                {
+                    'contest_id': contest_id,
+                    'login': login,
+                    'author_id': author_id,
+                }
+                for login, author_id in items[i : i + 1000]
+            ]
+        )
+        await session.execute(
+            insert_query.on_conflict_do_update(
+                index_elements=['contest_id', 'login'],
+                set_={
+                    'author_id': insert_query.excluded.author_id,
+                    'dt_updated': func.current_timestamp(),
+                },
+            )
+        )
+    removed_logins = list(removed_logins)
+    if removed_logins:
+        await session.execute(
+            delete(ContestParticipant)
+            .where(ContestParticipant.contest_id == contest_id)
+            .where(ContestParticipant.login.in_(removed_logins))
+        )
+    if mark_refreshed:
+        await session.execute(
+            update(ContestParticipant)
+            .where(ContestParticipant.contest_id == contest_id)
+            .values(dt_updated=func.current_timestamp())
+        )
+
+
+async def get_participants_index(
+    session: AsyncSession,
+    contest: Contest,
+    logger: 'loguru.Logger',
+    force_refresh: bool = False,
+) -> dict[str, int]:
+    """
+    Get login to author id index of contest participants.
+
+    The index is cached in memory and in database. When it is older than
+    CONTEST_PARTICIPANTS_TTL, it is refreshed by one request for all
+    participants, and only new, changed or removed participants
+    are written to database.
+    """
+    ttl = timedelta(seconds=get_settings().CONTEST_PARTICIPANTS_TTL)
+    now = datetime.now(timezone.utc)
+    cached = _participants_cache.get(contest.id)
+    if not force_refresh and cached and now - cached[0] < ttl:
+        return cached[1]
+    participants, refreshed_at = await get_contest_participants(
+        session, contest.id
+    )
+    if not force_refresh and refreshed_at and now - refreshed_at < ttl:
+        _participants_cache[contest.id] = (refreshed_at, participants)
+        return participants
+
+    try:
+        remote_participants = await get_participants_login_to_id(
+            contest.yandex_contest_id, logger=logger
+        )
+    except httpx.HTTPError as exc:
+        logger.warning(
+            'Can not get participants of contest {}: {}',
+            contest.yandex_contest_id,
+            exc,
+        )
+        # stale index is used until TTL, so missing logins are
+        # registered one by one instead of downloading the list again
+        _participants_cache[contest.id] = (now, participants)
+        return participants
+    changed_participants = {
+        login: author_id
+        for login, author_id in remote_participants.items()
+        if participants.get(login) != author_id
+    }
+    removed_logins = participants.keys() - remote_participants.keys()
+    logger.info(
+        'Contest {} has {} participants: {} new or changed, {} removed',
+        contest.yandex_contest_id,
+        len(remote_participants),
+        len(changed_participants),
+        len(removed_logins),
+    )
+    await save_contest_participants(
+        session,
+        contest.id,
+        changed_participants,
+        removed_logins=removed_logins,
+        mark_refreshed=True,
+    )
+    _participants_cache[contest.id] = (now, remote_participants)
+    return remote_participants
+
+
+async def resolve_author_id(
+    session: AsyncSession,
+    contest: Contest,
+    login: str,
+    logger: 'loguru.Logger',
+) -> int:
+    """
+    Get author id of login in contest using participants index.
+
+    If the login is not in the index, it is registered in contest by
+    one request, the list of participants is not downloaded again.
+    The result is added to the index.
+    """
+    participants = await get_participants_index(session, contest, logger)
+    if login not in participants:
+        author_id = await register_participant(
+            login, contest.yandex_contest_id, logger=logger
+        )
+        await save_contest_participants(
+            session, contest.id, {login: author_id}
+        )
+        participants[login] = author_id
+    return participants[login]
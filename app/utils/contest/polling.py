@@ -0,0 +1,221 @@
+import asyncio
+import heapq
+import math
+import typing as tp
+from datetime import datetime, timedelta, timezone
+from uuid import UUID
+
+import loguru
+from redis import asyncio as aioredis
+
+from app.config import get_settings
+from app.database.models import Contest, ContestSyncState
+
+
+T = tp.TypeVar('T')
+
+# contest id -> lock held while contest is synced
+_sync_locks: dict[UUID, asyncio.Lock] = {}
+
+# deletes the claim only if it is still held by the token
+_RELEASE_CLAIM_SCRIPT = """
+if redis.call('get', KEYS[1]) == ARGV[1] then
+    return redis.call('del', KEYS[1])
+end
+return 0
+"""
+
+# extends the claim only if it is still held by the token
+_EXTEND_CLAIM_SCRIPT = """
+if redis.call('get', KEYS[1]) == ARGV[1] then
+    return redis.call('pexpire', KEYS[1], ARGV[2])
+end
+return 0
+"""
+
+
+def get_sync_lock(contest_id: UUID) -> asyncio.Lock:
+    """
+    Get lock of contest sync, shared by jobs of this process.
+    """
+    return _sync_locks.setdefault(contest_id, asyncio.Lock())
+
+
+def _get_sync_claim_key(contest_id: UUID) -> str:
+    return f'contest-sync-claim:{contest_id}'
+
+
+async def claim_contest_sync(contest_id: UUID, token: str) -> bool:
+    """
+    Claim sync of contest for celery task with token as its id.
+
+    The claim is shared by all workers and the scheduler, so a contest
+    sync is never enqueued while another one is queued or running.
+
+    :return: False if contest sync is already claimed
+    """
+    settings = get_settings()
+    async with aioredis.from_url(settings.CELERY_BROKER_URL) as client:
+        return bool(
+            await client.set(
+                _get_sync_claim_key(contest_id),
+                token,
+                nx=True,
+                ex=settings.CONTEST_SYNC_CLAIM_TTL,
+            )
+        )
+
+
+async def extend_contest_sync(contest_id: UUID, token: str) -> bool:
+    """
+    Extend claim of contest sync for CONTEST_SYNC_CLAIM_TTL seconds.
+
+    :return: False if contest sync is not claimed by the token anymore
+    """
+    settings = get_settings()
+    async with aioredis.from_url(settings.CELERY_BROKER_URL) as client:
+        return bool(
+            await client.eval(
+                _EXTEND_CLAIM_SCRIPT,
+                1,
+                _get_sync_claim_key(contest_id),
+                token,
+                settings.CONTEST_SYNC_CLAIM_TTL * 1000,
+            )
+        )
+
+
+async def keep_contest_sync(
+    contest_id: UUID, token: str, logger: 'loguru.Logger'
+) -> None:
+    """
+    Extend claim of contest sync until cancelled.
+
+    The claim is extended three times per CONTEST_SYNC_CLAIM_TTL,
+    so it does not expire while the sync is running.
+    """
+    interval = get_settings().CONTEST_SYNC_CLAIM_TTL / 3
+    while True:
+        await asyncio.sleep(interval)
+        try:
+            if not await extend_contest_sync(contest_id, token):
+                logger.warning('Claim of contest {} sync is lost', contest_id)
+                return
+        except Exception as exc:  # pylint: disable=broad-except
+            logger.warning(
+                'Failed to extend claim of contest {} sync: {}',
+                contest_id,
+                exc,
+            )
+
+
+async def release_contest_sync(contest_id: UUID, token: str) -> None:
+    settings = get_settings()
+    async with aioredis.from_url(settings.CELERY_BROKER_URL) as client:
+        await client.eval(
+            _RELEASE_CLAIM_SCRIPT, 1, _get_sync_claim_key(contest_id), token
+        )
+
+
+def get_poll_interval(
+    contest: Contest,
+    submissions_rate: float,
+    now: datetime,
+) -> float:
+    """
+    Get seconds between syncs of contest.
+
+    Contest is polled most often around its deadline, otherwise the
+    interval is the expected time between its new submissions, up to
+    CONTEST_POLL_IDLE_INTERVAL. Contests with no submissions long after
+    the deadline are polled once in CONTEST_POLL_DORMANT_INTERVAL.
+    """
+    settings = get_settings()
+    since_deadline = (
+        (
+            now.astimezone(timezone.utc).replace(tzinfo=None)
+            - contest.deadline
+        ).total_seconds()
+        if contest.deadline is not None
+        else None
+    )
+    if (
+        since_deadline is not None
+        and abs(since_deadline) <= settings.CONTEST_POLL_DEADLINE_WINDOW
+    ):
+        return settings.CONTEST_POLL_MIN_INTERVAL
+    if submissions_rate * settings.CONTEST_POLL_IDLE_INTERVAL >= 3600:
+        return max(3600 / submissions_rate, settings.CONTEST_POLL_MIN_INTERVAL)
+    if (
+        since_deadline is not None
+        and since_deadline > settings.CONTEST_POLL_DORMANT_AFTER
+        and submissions_rate * settings.CONTEST_POLL_DORMANT_INTERVAL < 3600
+    ):
+        return settings.CONTEST_POLL_DORMANT_INTERVAL
+    return settings.CONTEST_POLL_IDLE_INTERVAL
+
+
+def get_submissions_rate(
+    sync_state: ContestSyncState | None,
+    new_submissions_count: int,
+    now: datetime,
+) -> float:
+    """
+    Get smoothed count of new submissions per hour after sync.
+
+    The rate of the sync is averaged with the previous rate, which
+    weight halves every CONTEST_POLL_RATE_HALF_LIFE seconds.
+    """
+    if sync_state is None or sync_state.synced_at is None:
+        return 0.0
+    elapsed = max((now - sync_state.synced_at).total_seconds(), 1.0)
+    decay = 0.5 ** (elapsed / get_settings().CONTEST_POLL_RATE_HALF_LIFE)
+    return (
+        sync_state.submissions_rate * decay
+        + new_submissions_count * 3600 / elapsed * (1 - decay)
+    )
+
+
+def get_next_sync_at(
+    contest: Contest,
+    submissions_rate: float,
+    now: datetime,
+) -> datetime:
+    return now + timedelta(
+        seconds=get_poll_interval(contest, submissions_rate, now)
+    )
+
+
+def is_sync_due(sync_state: ContestSyncState | None, now: datetime) -> bool:
+    return (
+        sync_state is None
+        or sync_state.next_sync_at is None
+        or sync_state.next_sync_at <= now
+    )
+
+
+def get_due_contests(
+    items: list[tuple[T, Contest, ContestSyncState | None]],
+    now: datetime,
+) -> list[tuple[T, Contest, ContestSyncState | None]]:
+    """
+    Get contests due to sync, the hottest first.
+
+    Contests are ordered by poll interval and then by how long they
+    are overdue, so when a run is behind schedule, contests near
+    deadline and with many submissions are synced first.
+    """
+    queue: list[tuple[float, float, int]] = []
+    for i, (_, contest, sync_state) in enumerate(items):
+        if not is_sync_due(sync_state, now):
+            continue
+        overdue = (
+            (now - sync_state.next_sync_at).total_seconds()
+            if sync_state is not None and sync_state.next_sync_at is not None
+            else math.inf
+        )
+        interval = get_poll_interval(
+            contest, sync_state.submissions_rate if sync_state else 0.0, now
+        )
+        heapq.heappush(queue, (interval, -overdue, i))
+    return [items[heapq.heappop(queue)[2]] for _ in range(len(queue))]
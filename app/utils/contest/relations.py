@@ -0,0 +1,115 @@
+from uuid import UUID
+
+from sqlalchemy import bindparam, select, update
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.database.models import StudentContest
+
+
+async def get_student_contest_relations(
+    session: AsyncSession,
+    contest_id: UUID,
+) -> dict[UUID, StudentContest]:
+    """
+    Get all student contest relations of contest.
+
+    :param session: Database session
+    :param contest_id: Contest id
+
+    :return: Dict of student id to student contest relation
+    """
+    query = select(StudentContest).where(
+        StudentContest.contest_id == contest_id
+    )
+    return {
+        student_contest.student_id: student_contest
+        for student_contest in (await session.execute(query)).scalars()
+    }
+
+
+async def add_student_contest_relations(
+    session: AsyncSession,
+    contest_id: UUID,
+    course_id: UUID,
+    author_ids: dict[UUID, int],
+) -> None:
+    """
+    Add student contest relations by one query for each 1000 students.
+
+    Relations conflicting with existing ones are skipped.
+
+    :param session: Database session
+    :param contest_id: Contest id
+    :param course_id: Course id
+    :param author_ids: Dict of student id to author id in yandex contest
+    """
+    items = list(author_ids.items())
+    for i in range(0, len(items), 1000):
+        await session.execute(
+            insert(StudentContest)
+            .values(
+                [
+                    {
+                        'student_id': student_id,
+                        'contest_id': contest_id,
+                        'course_id': course_id,
+                        'author_id': author_id,
+                    }
+                    for student_id, author_id in items[i : i + 1000]
+                ]
+            )
+            .on_conflict_do_nothing()
+        )
+
+
+async def update_student_contest_author_ids(
+    session: AsyncSession,
+    contest_id: UUID,
+    author_ids: dict[UUID, int],
+) -> None:
+    """
+    Set author ids of student contest relations by one query.
+
+    :param session: Database session
+    :param contest_id: Contest id
+    :param author_ids: Dict of student id to author id in yandex contest
+    """
+    if not author_ids:
+        return
+    table = StudentContest.__table__
+    await session.execute(
+        update(table)
+        .where(table.c.contest_id == contest_id)
+        .where(table.c.student_id == bindparam('b_student_id'))
+        .values(author_id=bindparam('b_author_id')),
+        [
+            {'b_student_id': student_id, 'b_author_id': author_id}
+            for student_id, author_id in author_ids.items()
+        ],
+    )
+
+
+async def get_course_student_contests(
+    session: AsyncSession,
+    course_id: UUID,
+    student_ids: list[UUID] | None = None,
+    populate_existing: bool = False,
+) -> list[StudentContest]:
+    """
+    Get all student contest relations of course.
+
+    :param session: Database session
+    :param course_id: Course id
+    :param student_ids: Get relations only of these students
+    :param populate_existing: Overwrite relations already loaded
+        in session by values from database
+
+    :return: List of student contest relations
+    """
+    query = select(StudentContest).where(StudentContest.course_id == course_id)
+    if student_ids is not None:
+        query = query.where(StudentContest.student_id.in_(student_ids))
+    if populate_existing:
+        query = query.execution_options(populate_existing=True)
+    return (await session.execute(query)).scalars().all()
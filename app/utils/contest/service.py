@@ -1,14 +1,18 @@
 # pylint: disable=too-many-lines
 
+import asyncio
+import collections
+import time
+import typing as tp
 from datetime import datetime, timedelta
 
 import httpx
 import loguru
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from app.config import get_settings
 from app.database import models
-from app.database.models import Contest, Course, Student, StudentContest
-from app.m3tqdm import tqdm
+from app.database.models import Contest, Student
 from app.schemas import (
     ContestSubmission,
     ContestSubmissionFull,
@@ -18,10 +22,7 @@ from app.schemas import contest as contest_schemas
 from app.utils.common.datetime_utils import get_datetime_msk_tz
 from app.utils.yandex_request import make_request_to_yandex_contest_api
 
-from .database import (
-    add_student_contest_relation,
-    get_student_contest_relation,
-)
+from .database import add_student_contest_relation
 
 
 async def add_student_to_contest(
@@ -90,50 +91,61 @@ async def add_student_to_contest(
     return True, None
 
 
-async def get_author_id(
+async def register_participant(
     login: str,
     yandex_contest_id: int,
     logger: 'loguru.Logger',
 ) -> int:
+    """
+    Register login in contest and get its author id.
+
+    If login is already registered, author id is got by the request
+    for the login, the list of all participants is not downloaded.
+    """
     try:
         response = await make_request_to_yandex_contest_api(
             f'contests/{yandex_contest_id}/participants?login={login}',
             logger=logger,
-            method='GET',
+            method='POST',
         )
     except httpx.HTTPStatusError as exc:
-        logger.warning(
-            'Got error in request participants by login: {}, fallback to participants list',
-            exc,
-        )
-        response = await make_request_to_yandex_contest_api(
-            f'contests/{yandex_contest_id}/participants',
-            logger=logger,
-            method='GET',
+        if exc.response.status_code != 409:
+            raise
+        logger.info(
+            'Login {} is already registered in contest {}',
+            login,
+            yandex_contest_id,
         )
-    data = response.json()
-    for item in data:
+    else:
+        return int(response.text)
+    response = await make_request_to_yandex_contest_api(
+        f'contests/{yandex_contest_id}/participants?login={login}',
+        logger=logger,
+        method='GET',
+    )
+    for item in response.json():
         if item.get('login') == login:
             return int(item['id'])
-    logger.warning(
-        'No author id for login {} in contest {}, '
-        'trying to get by POST register request',
-        login,
-        yandex_contest_id,
+    raise ValueError(
+        f'No author id for login {login} in contest {yandex_contest_id}'
     )
+
+
+async def get_participants_login_to_id(
+    yandex_contest_id: int,
+    logger: 'loguru.Logger',
+) -> dict[str, int]:
+    """
+    Get all participants of Yandex contest by one request.
+
+    :return: Dict of contest login to author id
+    """
     response = await make_request_to_yandex_contest_api(
-        f'contests/{yandex_contest_id}/participants?login={login}',
+        f'contests/{yandex_contest_id}/participants',
         logger=logger,
-        method='POST',
+        method='GET',
     )
-    try:
-        author_id = int(response.text)
-    except Exception:
-        logger.error(
-            'No author id for login {} in contest {}', login, yandex_contest_id
-        )
-        raise
-    return author_id
+    return {item['login']: int(item['id']) for item in response.json()}
 
 
 async def get_contest_info(
@@ -170,44 +182,169 @@ async def get_contest_info(
     )
 
 
-async def get_or_create_student_contest(
-    session: AsyncSession,
-    student: Student,
-    contest: Contest,
-    course: Course,
-    logger: 'loguru.Logger',
-) -> StudentContest:
-    sc = await get_student_contest_relation(session, student.id, contest.id)
-    if sc is None:
-        sc = await add_student_contest_relation(
-            session,
-            student.id,
-            contest.id,
-            course.id,
-            await get_author_id(
-                student.contest_login,
-                contest.yandex_contest_id,
-                logger=logger,
+def _filter_new_submissions(
+    submissions: list[dict[str, tp.Any]],
+    last_updated_submission: int,
+) -> dict[int, ContestSubmission]:
+    return dict(
+        map(
+            lambda submission: (
+                int(submission['id']),
+                ContestSubmission(**submission),
+            ),
+            filter(
+                lambda submission: not last_updated_submission
+                or int(submission['id']) > last_updated_submission,
+                submissions,
             ),
         )
-    return sc
+    )
+
+
+async def _get_pages_serial(
+    url: str,
+    data: dict[str, tp.Any],
+    page_size: int,
+    last_updated_submission: int,
+    logger: 'loguru.Logger',
+) -> tuple[dict[int, ContestSubmission], bool]:
+    """
+    Fetches pages one by one.
+
+    New submissions only shift older ones to the next pages, so they
+    are fetched twice but never skipped. If the listing shrank, no
+    submissions are returned, as some of them could be skipped.
+
+    :return: Submissions and if count was the same on all pages
+    """
+    page = 1
+    all_submissions_count = data['count']
+    is_count_stable = True
+    result_dict: dict[int, ContestSubmission] = {}
+    while len(result_dict) != all_submissions_count:
+        new_values = _filter_new_submissions(
+            data['submissions'], last_updated_submission
+        )
+        result_dict.update(new_values)
+        if len(new_values) < len(data['submissions']):
+            break
+        if len(result_dict) == all_submissions_count:
+            break
+        page += 1
+        response = await make_request_to_yandex_contest_api(
+            url.format(page, page_size), logger=logger
+        )
+        data = response.json()
+        if data['count'] != all_submissions_count:
+            logger.warning(
+                'Submissions count changed from {} to {} while fetching',
+                all_submissions_count,
+                data['count'],
+            )
+            is_count_stable = False
+            if data['count'] < all_submissions_count:
+                return {}, is_count_stable
+    return result_dict, is_count_stable
+
+
+async def _get_pages_parallel(  # pylint: disable=too-many-arguments
+    url: str,
+    data: dict[str, tp.Any],
+    page_size: int,
+    last_updated_submission: int,
+    known_count: int | None,
+    fan_out: int,
+    logger: 'loguru.Logger',
+) -> dict[int, ContestSubmission] | None:
+    """
+    Fetches pages in waves of `fan_out` concurrent requests.
+
+    Submissions are listed from the newest, so pages are merged in order
+    and fetching stops at the first page reaching the watermark.
+    Waves are not requested past the pages of submissions newer than
+    `known_count`, the rest pages are fetched one by one.
+    Returns None if count of any page differs from the first page,
+    as pages could have shifted and some submissions could be skipped.
+    """
+    all_submissions_count = data['count']
+    pages_count = (all_submissions_count + page_size - 1) // page_size
+    new_count = all_submissions_count
+    if known_count is not None and known_count < all_submissions_count:
+        new_count = all_submissions_count - known_count
+    # the page after new submissions reaches the watermark
+    pages_budget = min(pages_count, new_count // page_size + 1)
+    pages_data = {1: data}
+    next_page = 2
+    result_dict: dict[int, ContestSubmission] = {}
+    page = 1
+    while page <= pages_count:
+        if page not in pages_data:
+            wave = list(
+                range(
+                    next_page,
+                    min(
+                        next_page + fan_out,
+                        max(pages_budget, next_page) + 1,
+                    ),
+                )
+            )
+            logger.info('Getting submissions pages {}-{}', wave[0], wave[-1])
+            responses = await asyncio.gather(
+                *[
+                    make_request_to_yandex_contest_api(
+                        url.format(wave_page, page_size), logger=logger
+                    )
+                    for wave_page in wave
+                ]
+            )
+            for wave_page, response in zip(wave, responses):
+                pages_data[wave_page] = response.json()
+            next_page = wave[-1] + 1
+            counts = {pages_data[wave_page]['count'] for wave_page in wave}
+            if counts != {all_submissions_count}:
+                logger.warning(
+                    'Submissions count changed from {} to {} while fetching',
+                    all_submissions_count,
+                    sorted(counts),
+                )
+                return None
+        page_data = pages_data.pop(page)
+        new_values = _filter_new_submissions(
+            page_data['submissions'], last_updated_submission
+        )
+        result_dict.update(new_values)
+        if not page_data['submissions'] or len(new_values) < len(
+            page_data['submissions']
+        ):
+            break
+        page += 1
+    return result_dict
 
 
 async def get_new_submissions(
     contest: Contest,
     last_updated_submission: int,
     logger: 'loguru.Logger',
-) -> list[ContestSubmissionFull]:
+    known_count: int | None = None,
+) -> tuple[list[ContestSubmissionFull], int | None]:
+    """
+    Get submissions of contest newer than last_updated_submission.
+
+    :param known_count: Count of submissions on the last complete sync,
+        if it is not changed, no more pages are downloaded
+
+    :return: New submissions and count of submissions in contest,
+        count is None if not all new submissions were fetched
+    """
+    settings = get_settings()
     url = (
         f'contests/{contest.yandex_contest_id}/submissions'
         f'?page={{}}&pageSize={{}}'
     )
-    page = 1
     page_size = 100
-    result_dict: dict[int, ContestSubmission] = {}
 
     response = await make_request_to_yandex_contest_api(
-        url.format(page, page_size), logger=logger
+        url.format(1, page_size), logger=logger
     )
     data = response.json()
     all_submissions_count = data['count']
@@ -216,158 +353,269 @@ async def get_new_submissions(
         contest.yandex_contest_id,
         all_submissions_count,
     )
+    if all_submissions_count == known_count:
+        logger.info(
+            'Contest {} submissions count is not changed, skipping',
+            contest.yandex_contest_id,
+        )
+        return [], all_submissions_count
 
-    while len(result_dict) != all_submissions_count:
-        new_values = dict(
-            map(
-                lambda submission: (
-                    int(submission['id']),
-                    ContestSubmission(**submission),
-                ),
-                filter(
-                    lambda submission: not last_updated_submission
-                    or int(submission['id']) > last_updated_submission,
-                    data['submissions'],
-                ),
-            )
+    result_dict = None
+    is_count_stable = True
+    if (
+        settings.YANDEX_SUBMISSIONS_PAGES_FAN_OUT > 1
+        and all_submissions_count > page_size
+    ):
+        result_dict = await _get_pages_parallel(
+            url,
+            data,
+            page_size,
+            last_updated_submission,
+            known_count,
+            settings.YANDEX_SUBMISSIONS_PAGES_FAN_OUT,
+            logger=logger,
         )
-        result_dict.update(new_values)
-        if len(new_values) < len(data['submissions']):
-            break
-        if len(result_dict) == all_submissions_count:
-            break
-        page += 1
-        response = await make_request_to_yandex_contest_api(
-            url.format(page, page_size), logger=logger
+        if result_dict is None:
+            response = await make_request_to_yandex_contest_api(
+                url.format(1, page_size), logger=logger
+            )
+            data = response.json()
+    if result_dict is None:
+        result_dict, is_count_stable = await _get_pages_serial(
+            url, data, page_size, last_updated_submission, logger=logger
         )
-        data = response.json()
-    return await make_full_submissions(
+    submissions = await make_full_submissions(
         result_dict,
         contest,
         logger=logger,
     )
+    if not is_count_stable or (
+        result_dict
+        and (not submissions or submissions[-1].id != max(result_dict))
+    ):
+        return submissions, None
+    return submissions, data['count']
+
 
+class _BatchSizer:
+    """
+    Adapts size of `/submissions/multiple` batches to observed latency:
+    grows additively while requests are fast and halves on slow
+    or failed requests.
+    """
 
-async def make_full_submissions(
+    def __init__(self, max_size: int, target_latency: float) -> None:
+        self.max_size = max(max_size, 1)
+        self.size = self.max_size
+        self.target_latency = target_latency
+
+    def on_success(self, latency: float) -> None:
+        if latency > self.target_latency:
+            self.size = max(1, self.size // 2)
+        elif latency < self.target_latency / 2:
+            self.size = min(self.max_size, self.size + 10)
+
+    def on_failure(self) -> None:
+        self.size = max(1, self.size // 2)
+
+
+def _is_permanent_error(exc: Exception) -> bool:
+    return (
+        isinstance(exc, httpx.HTTPStatusError)
+        and 400 <= exc.response.status_code < 500
+        and exc.response.status_code != 429
+    )
+
+
+async def _get_submissions_batch(
+    url: str,
+    run_ids: list[int],
+    logger: 'loguru.Logger',
+    retry: bool = True,
+) -> list[dict[str, tp.Any]]:
+    """
+    :param retry: Retry on timeouts and 429 and 5xx responses,
+        otherwise make only one attempt.
+    """
+    response = await make_request_to_yandex_contest_api(
+        url + '&'.join(f'runIds={run_id}' for run_id in run_ids),
+        timeout=60,
+        retry_count=5 if retry else 1,
+        status_retry_count=None if retry else 0,
+        logger=logger,
+    )
+    if response.status_code != 200:
+        raise httpx.HTTPStatusError(
+            f'Unexpected status code {response.status_code}',
+            request=response.request,
+            response=response,
+        )
+    return response.json()
+
+
+async def make_full_submissions(  # noqa: C901
     submissions: dict[int, ContestSubmission],
     contest: Contest,
     logger: 'loguru.Logger',
 ) -> list[ContestSubmissionFull]:
+    """
+    Gets full info for submissions by batches of run ids.
+
+    Batches are fetched concurrently. A failed batch is split in half
+    and retried down to a single run id, halves are requested only
+    once. No new batches are requested after
+    YANDEX_SUBMISSIONS_FETCH_BUDGET. If a run id still can not be
+    fetched or is not requested, submissions starting from it are not
+    returned, so they will be fetched again on the next sync instead
+    of being skipped.
+    """
+    settings = get_settings()
     url = f'contests/{contest.yandex_contest_id}/submissions/multiple?'
-    batch_size = 100
-    results: list[ContestSubmissionFull] = []
-    submission_values = sorted(
-        list(
-            submissions.values(),
-        ),
-        key=lambda x: x.id,
+    sizer = _BatchSizer(
+        settings.YANDEX_SUBMISSIONS_BATCH_SIZE,
+        settings.YANDEX_SUBMISSIONS_BATCH_TARGET_LATENCY,
     )
+    deadline = time.monotonic() + settings.YANDEX_SUBMISSIONS_FETCH_BUDGET
+    pending_ids = collections.deque(sorted(submissions))
+    retry_batches: collections.deque[list[int]] = collections.deque()
+    fetched: dict[int, dict[str, tp.Any]] = {}
+    failed_ids: list[int] = []
     logger.info(
         'Getting submissions for contest "{}" for {} submissions',
         contest.yandex_contest_id,
-        len(submission_values),
+        len(pending_ids),
     )
-    async for i in tqdm(
-        range(0, len(submission_values), batch_size),
-        name='make_full_submissions',
-        total=(len(submission_values) + batch_size - 1) // batch_size,
-    ):
-        batch_url = url + '&'.join(
-            map(
-                lambda run_id: f'runIds={run_id}',
-                [
-                    submission_value.id
-                    for submission_value in submission_values[
-                        i : i + batch_size
-                    ]
-                ],
+
+    async def _worker() -> None:
+        while (retry_batches or pending_ids) and time.monotonic() < deadline:
+            is_retry = bool(retry_batches)
+            if is_retry:
+                run_ids = retry_batches.popleft()
+            else:
+                run_ids = [
+                    pending_ids.popleft()
+                    for _ in range(min(sizer.size, len(pending_ids)))
+                ]
+            logger.info(
+                'Getting submissions ids {}-{} ({} ids)',
+                run_ids[0],
+                run_ids[-1],
+                len(run_ids),
             )
+            start = time.monotonic()
+            try:
+                data = await _get_submissions_batch(
+                    url, run_ids, logger, retry=not is_retry
+                )
+            except (httpx.HTTPStatusError, httpx.TransportError) as exc:
+                sizer.on_failure()
+                if len(run_ids) > 1:
+                    middle = len(run_ids) // 2
+                    logger.warning(
+                        'Error for submissions ids {}-{}: {}, '
+                        'retrying by halves',
+                        run_ids[0],
+                        run_ids[-1],
+                        exc,
+                    )
+                    retry_batches.extendleft(
+                        [run_ids[middle:], run_ids[:middle]]
+                    )
+                elif _is_permanent_error(exc):
+                    logger.error(
+                        'Submission {} can not be fetched, skipping: {}',
+                        run_ids[0],
+                        exc,
+                    )
+                else:
+                    logger.error(
+                        'Error for submission {}: {}', run_ids[0], exc
+                    )
+                    failed_ids.append(run_ids[0])
+                continue
+            sizer.on_success(time.monotonic() - start)
+            fetched.update(
+                (submission['runId'], submission) for submission in data
+            )
+
+    await asyncio.gather(
+        *[
+            _worker()
+            for _ in range(
+                max(settings.YANDEX_SUBMISSIONS_BATCH_CONCURRENCY, 1)
+            )
+        ]
+    )
+    not_requested_ids = list(pending_ids) + [
+        run_id for batch in retry_batches for run_id in batch
+    ]
+    if not_requested_ids:
+        logger.warning(
+            'Time budget of getting submissions for contest {} is '
+            'exceeded, {} submissions are not requested',
+            contest.yandex_contest_id,
+            len(not_requested_ids),
         )
-        first_id, last_id = (
-            submission_values[i].id,
-            submission_values[i + batch_size].id
-            if i + batch_size < len(submission_values)
-            else submission_values[-1].id,
+    if failed_ids:
+        logger.error(
+            'Failed to get submissions {} for contest {}',
+            sorted(failed_ids),
+            contest.yandex_contest_id,
         )
+    run_ids = sorted(fetched)
+    if failed_ids or not_requested_ids:
+        first_unfetched_id = min(failed_ids + not_requested_ids)
         logger.info(
-            'Getting submissions ids {}-{} (index {}-{})',
-            first_id,
-            last_id,
-            i,
-            i + batch_size
-            if i + batch_size < len(submission_values)
-            else len(submission_values) - 1,
+            'Submissions for contest {} starting from {} '
+            'will be fetched on the next sync',
+            contest.yandex_contest_id,
+            first_unfetched_id,
         )
-        try:
-            response = await make_request_to_yandex_contest_api(
-                batch_url, timeout=60, retry_count=5, logger=logger
-            )
-        except httpx.ReadTimeout:
-            logger.error(
-                'Timeout error for submissions ids {}-{} (index {}-{})',
-                first_id,
-                last_id,
-                i,
-                i + batch_size
-                if i + batch_size < len(submission_values)
-                else len(submission_values) - 1,
-            )
-            continue
-        if response.status_code != 200:
-            logger.error(
-                'Error while getting submissions {}-{} (index {}-{}). '
-                'Status code: {}. Response: {}',
-                first_id,
-                last_id,
-                i,
-                i + batch_size
-                if i + batch_size < len(submission_values)
-                else len(submission_values) - 1,
-                response.status_code,
-                response.text,
-            )
-            continue
-        results.extend(
-            ContestSubmissionFull(
-                id=submission['runId'],
-                authorId=submissions[submission['runId']].authorId,
-                problemId=submission['problemId'],
-                problemAlias=submission['problemAlias'],
-                verdict=submission['verdict'],
-                login=submission['participantInfo']['login'],
-                submissionTime=datetime.fromisoformat(
-                    submission['submissionTime']
-                ).replace(tzinfo=None),
-                finalScore=(
-                    float(submission['finalScore'])
-                    if isinstance(submission['finalScore'], str)
-                    and submission['finalScore']
-                    and float(submission['finalScore'])
-                    else 0
-                ),
-            )
-            for submission in response.json()
+        run_ids = [run_id for run_id in run_ids if run_id < first_unfetched_id]
+    return [
+        ContestSubmissionFull(
+            id=submission['runId'],
+            authorId=submissions[submission['runId']].authorId,
+            problemId=submission['problemId'],
+            problemAlias=submission['problemAlias'],
+            verdict=submission['verdict'],
+            login=submission['participantInfo']['login'],
+            submissionTime=datetime.fromisoformat(
+                submission['submissionTime']
+            ).replace(tzinfo=None),
+            finalScore=(
+                float(submission['finalScore'])
+                if isinstance(submission['finalScore'], str)
+                and submission['finalScore']
+                and float(submission['finalScore'])
+                else 0
+            ),
         )
-    return results
+        for submission in map(fetched.__getitem__, run_ids)
+    ]
 
 
-async def get_submission_from_yandex(
+async def get_submissions_from_yandex(
     contest: Contest,
-    submission: models.Submission,
+    submissions: list[models.Submission],
     logger: 'loguru.Logger',
-) -> ContestSubmissionFull:
-    return (
-        await make_full_submissions(
-            {
-                submission.run_id: ContestSubmission(
-                    id=submission.run_id,
-                    authorId=submission.author_id,
-                    problemId='',
-                    problemAlias='',
-                    verdict='',
-                )
-            },
-            contest,
-            logger,
-        )
-    )[0]
+) -> list[ContestSubmissionFull]:
+    """
+    Get submissions of contest from yandex by batched requests.
+
+    Submissions which can not be fetched are skipped.
+    """
+    return await make_full_submissions(
+        {
+            submission.run_id: ContestSubmission(
+                id=submission.run_id,
+                authorId=submission.author_id,
+                problemId='',
+                problemAlias='',
+                verdict='',
+            )
+            for submission in sorted(submissions, key=lambda x: x.run_id)
+        },
+        contest,
+        logger,
+    )
@@ -0,0 +1,99 @@
+from datetime import datetime
+from uuid import UUID
+
+from sqlalchemy import func, select
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.database.models import ContestSyncState
+
+
+async def get_contest_sync_state(
+    session: AsyncSession,
+    contest_id: UUID,
+) -> ContestSyncState | None:
+    """
+    Get state of submissions sync of contest.
+
+    :param session: Database session
+    :param contest_id: Contest id
+
+    :return: Sync state or None if contest was not synced yet
+    """
+    query = select(ContestSyncState).where(
+        ContestSyncState.contest_id == contest_id
+    )
+    return await session.scalar(query)
+
+
+async def get_contests_sync_states(
+    session: AsyncSession,
+    contest_ids: list[UUID],
+) -> dict[UUID, ContestSyncState]:
+    """
+    Get states of submissions sync of contests.
+
+    :param session: Database session
+    :param contest_ids: Contest ids
+
+    :return: Dict of contest id to sync state, for synced contests only
+    """
+    if not contest_ids:
+        return {}
+    query = select(ContestSyncState).where(
+        ContestSyncState.contest_id.in_(contest_ids)
+    )
+    return {
+        sync_state.contest_id: sync_state
+        for sync_state in (await session.execute(query)).scalars()
+    }
+
+
+async def save_contest_sync_state(
+    session: AsyncSession,
+    contest_id: UUID,
+    last_run_id: int,
+    remote_count: int | None,
+    sync_duration: float,
+    submissions_rate: float = 0.0,
+    next_sync_at: datetime | None = None,
+) -> None:
+    """
+    Insert or update state of submissions sync of contest.
+
+    :param session: Database session
+    :param contest_id: Contest id
+    :param last_run_id: Max run id of fetched submissions, saved
+        run id is never decreased
+    :param remote_count: Count of submissions in Yandex contest,
+        None if not all new submissions were fetched
+    :param sync_duration: Duration of sync in seconds
+    :param submissions_rate: Smoothed count of new submissions per hour
+    :param next_sync_at: Time when contest is due to sync next time
+    """
+    insert_query = insert(ContestSyncState).values(
+        contest_id=contest_id,
+        last_run_id=last_run_id,
+        remote_count=remote_count,
+        synced_at=func.current_timestamp(),
+        sync_duration=sync_duration,
+        submissions_rate=submissions_rate,
+        next_sync_at=next_sync_at,
+    )
+    await session.execute(
+        insert_query.on_conflict_do_update(
+            index_elements=['contest_id'],
+            set_={
+                'last_run_id': func.greatest(
+                    ContestSyncState.last_run_id,
+                    insert_query.excluded.last_run_id,
+                ),
+                'remote_count': insert_query.excluded.remote_count,
+                'synced_at': insert_query.excluded.synced_at,
+                'sync_duration': insert_query.excluded.sync_duration,
+                'submissions_rate': insert_query.excluded.submissions_rate,
+                'next_sync_at': insert_query.excluded.next_sync_at,
+                'dt_updated': func.current_timestamp(),
+            },
+        )
+    )
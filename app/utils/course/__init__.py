@@ -1,5 +1,6 @@
 from .database import (
     add_student_to_course,
+    clear_student_courses_results_dirty,
     get_all_active_courses,
     get_all_active_courses_with_allowed_smart_suggests,
     get_all_courses_with_open_registration,
@@ -7,11 +8,14 @@ from .database import (
     get_course_by_id,
     get_course_by_short_name,
     get_course_levels,
+    get_or_create_course_student_course_levels,
     get_or_create_student_course_level,
     get_student_course,
     get_student_course_contests_data,
+    get_student_course_levels,
     get_student_courses,
     is_student_registered_on_course,
+    mark_student_courses_results_dirty,
 )
 
 
@@ -29,4 +33,8 @@ __all__ = [
     'get_student_course_contests_data',
     'get_course_by_id',
     'get_all_active_courses_with_allowed_smart_suggests',
+    'mark_student_courses_results_dirty',
+    'clear_student_courses_results_dirty',
+    'get_or_create_course_student_course_levels',
+    'get_student_course_levels',
 ]
@@ -1,6 +1,7 @@
 from uuid import UUID
 
-from sqlalchemy import select
+from sqlalchemy import and_, bindparam, select, update
+from sqlalchemy.dialects.postgresql import insert
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.database import models
@@ -10,6 +11,7 @@ from app.database.models import (
     StudentCourse,
     StudentCourseLevels,
 )
+from app.utils import common as common_utils
 from app.utils.contest.database import (
     get_contest_levels,
     get_contests_with_relations,
@@ -103,27 +105,70 @@ async def get_course_levels(
     return (await session.execute(query)).scalars().all()
 
 
-async def get_or_create_student_course_level(
-    session: AsyncSession, student_id: UUID, course_id: UUID, level_id: UUID
-) -> StudentCourseLevels:
+async def get_student_course_levels(
+    session: AsyncSession, student_ids: list[UUID], course_id: UUID
+) -> list[StudentCourseLevels]:
     query = (
         select(StudentCourseLevels)
-        .where(StudentCourseLevels.student_id == student_id)
+        .where(StudentCourseLevels.student_id.in_(student_ids))
         .where(StudentCourseLevels.course_id == course_id)
-        .where(StudentCourseLevels.course_level_id == level_id)
     )
-    student_course_level = await session.scalar(query)
-    if student_course_level is None:
-        student_course_level = StudentCourseLevels(
-            student_id=student_id,
-            course_id=course_id,
-            course_level_id=level_id,
-        )
-        session.add(student_course_level)
-        await session.flush()
+    return (await session.execute(query)).scalars().all()
+
+
+async def get_or_create_student_course_level(
+    session: AsyncSession, student_id: UUID, course_id: UUID, level_id: UUID
+) -> StudentCourseLevels:
+    (student_course_level,) = await common_utils.get_or_create_models(
+        session,
+        StudentCourseLevels,
+        [
+            {
+                'student_id': student_id,
+                'course_id': course_id,
+                'course_level_id': level_id,
+            }
+        ],
+        index_elements=['student_id', 'course_level_id'],
+    )
     return student_course_level
 
 
+async def get_or_create_course_student_course_levels(
+    session: AsyncSession,
+    course_id: UUID,
+) -> list[StudentCourseLevels]:
+    """
+    Get course levels of all students of course.
+
+    Missing levels are created by one INSERT ... ON CONFLICT DO NOTHING
+    for every level of course and every student on course.
+    """
+    await session.execute(
+        insert(StudentCourseLevels)
+        .from_select(
+            ['course_id', 'student_id', 'course_level_id'],
+            select(
+                StudentCourse.course_id,
+                StudentCourse.student_id,
+                CourseLevels.id,
+            )
+            .join(
+                CourseLevels,
+                CourseLevels.course_id == StudentCourse.course_id,
+            )
+            .where(StudentCourse.course_id == course_id),
+        )
+        .on_conflict_do_nothing(
+            index_elements=['student_id', 'course_level_id']
+        )
+    )
+    query = select(StudentCourseLevels).where(
+        StudentCourseLevels.course_id == course_id
+    )
+    return (await session.execute(query)).scalars().all()
+
+
 async def get_student_course_contests_data(
     session: AsyncSession,
     course_id: UUID,
@@ -172,3 +217,50 @@ async def get_student_course_contests_data(
             ),
         )
     )
+
+
+async def mark_student_courses_results_dirty(
+    session: AsyncSession, course_id: UUID, student_ids: list[UUID]
+) -> None:
+    """
+    Mark results of students on course for levels evaluation.
+    """
+    if not student_ids:
+        return
+    await session.execute(
+        update(StudentCourse)
+        .where(StudentCourse.course_id == course_id)
+        .where(StudentCourse.student_id.in_(student_ids))
+        .values(is_results_dirty=True)
+    )
+
+
+async def clear_student_courses_results_dirty(
+    session: AsyncSession, student_courses: list[StudentCourse]
+) -> None:
+    """
+    Clear dirty flag of relations by executemany UPDATE.
+
+    Only relations not updated since they were loaded are cleared, so
+    the flag set by concurrent sync of contest is kept.
+    """
+    if not student_courses:
+        return
+    table = StudentCourse.__table__
+    await session.execute(
+        update(table)
+        .where(
+            and_(
+                table.c.id == bindparam('b_id'),
+                table.c.dt_updated == bindparam('b_dt_updated'),
+            )
+        )
+        .values(is_results_dirty=False),
+        [
+            {
+                'b_id': student_course.id,
+                'b_dt_updated': student_course.dt_updated,
+            }
+            for student_course in student_courses
+        ],
+    )
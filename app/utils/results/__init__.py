@@ -1,7 +1,42 @@
+from .batch import (
+    get_batch_results_items,
+    get_batch_results_lines,
+    get_students_results,
+)
+from .evaluator import evaluate_course_levels
+from .loader import CourseLevelsData, get_course_levels_data
+from .matrix import CourseLevelsChanges, CourseMatrix, make_course_matrix
+from .reader import get_student_course_levels_data
 from .service import get_student_course_results, update_student_course_results
+from .snapshot import (
+    get_course_results_snapshots,
+    get_student_course_with_snapshot,
+    get_student_courses_with_snapshots,
+    get_student_results,
+    get_students_courses_with_snapshots,
+    load_student_course_results,
+    save_course_results_snapshots,
+)
 
 
 __all__ = [
     'get_student_course_results',
     'update_student_course_results',
+    'CourseMatrix',
+    'CourseLevelsChanges',
+    'make_course_matrix',
+    'evaluate_course_levels',
+    'CourseLevelsData',
+    'get_course_levels_data',
+    'get_student_course_levels_data',
+    'get_student_courses_with_snapshots',
+    'get_student_course_with_snapshot',
+    'get_course_results_snapshots',
+    'save_course_results_snapshots',
+    'load_student_course_results',
+    'get_students_courses_with_snapshots',
+    'get_students_results',
+    'get_student_results',
+    'get_batch_results_items',
+    'get_batch_results_lines',
 ]
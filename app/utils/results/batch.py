@@ -0,0 +1,159 @@
+import typing as tp
+from uuid import UUID
+
+import loguru
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.database import models
+from app.database.connection import SessionManager
+from app.schemas import CourseResults, StudentResults, StudentResultsBatchItem
+from app.utils import course as course_utils
+from app.utils import student as student_utils
+
+from .reader import get_student_course_levels_data
+from .service import get_student_course_results
+from .snapshot import get_students_courses_with_snapshots
+
+
+# students loaded and processed at once
+BATCH_CHUNK_SIZE = 500
+
+
+async def get_students_results(
+    session: AsyncSession,
+    contest_logins: list[str],
+    logger: 'loguru.Logger',
+    course_id: UUID | None = None,
+) -> tp.AsyncIterator[tuple[str, StudentResults | None]]:
+    """
+    Get results of students in order of contest logins.
+
+    Students are processed by chunks with set-based queries. Results
+    are taken from snapshots, missing ones are computed only by reads
+    with contests and levels of course loaded once for the chunk.
+
+    :param course_id: Get results only of this course
+    :return: Contest login and results, None if student not found
+    """
+    for i in range(0, len(contest_logins), BATCH_CHUNK_SIZE):
+        chunk = contest_logins[i : i + BATCH_CHUNK_SIZE]
+        students_departments = (
+            await student_utils.get_students_by_contest_logins_with_department(
+                session, chunk
+            )
+        )
+        students = {
+            student.contest_login: (student, department)
+            for student, department in students_departments
+        }
+        courses_results = await _get_students_courses_results(
+            session,
+            [student for student, _ in students.values()],
+            logger,
+            course_id,
+        )
+        for contest_login in chunk:
+            if contest_login not in students:
+                yield contest_login, None
+                continue
+            student, department = students[contest_login]
+            yield contest_login, StudentResults(
+                courses=courses_results.get(student.id, []),
+                fio=student.fio,
+                department=department.name if department else '',
+            )
+
+
+async def _get_students_courses_results(
+    session: AsyncSession,
+    students: list[models.Student],
+    logger: 'loguru.Logger',
+    course_id: UUID | None,
+) -> dict[UUID, list[CourseResults]]:
+    """
+    :return: Student id -> results of student on courses
+    """
+    students_by_id = {student.id: student for student in students}
+    rows = await get_students_courses_with_snapshots(
+        session, list(students_by_id), course_id
+    )
+    # course id -> course and relations with no snapshot
+    no_snapshot: dict[
+        UUID, tuple[models.Course, list[models.StudentCourse]]
+    ] = {}
+    for course, student_course in rows:
+        if student_course.results_snapshot is None:
+            no_snapshot.setdefault(course.id, (course, []))[1].append(
+                student_course
+            )
+    computed = {}
+    for course, student_courses in no_snapshot.values():
+        logger.info(
+            'No results snapshots of {} students on course {}, '
+            'computing results',
+            len(student_courses),
+            course.short_name,
+        )
+        course_levels = await course_utils.get_course_levels(
+            session, course.id
+        )
+        levels_data = await get_student_course_levels_data(
+            session,
+            course,
+            course_levels,
+            [student_course.student_id for student_course in student_courses],
+        )
+        for student_course in student_courses:
+            computed[
+                (student_course.student_id, course.id)
+            ] = await get_student_course_results(
+                students_by_id[student_course.student_id],
+                course,
+                course_levels,
+                student_course,
+                levels_data.get_student_course_levels(
+                    student_course.student_id
+                ),
+                levels_data.get_student_course_contests_data(
+                    student_course.student_id
+                ),
+                logger=logger,
+            )
+    courses_results: dict[UUID, list[CourseResults]] = {}
+    for course, student_course in rows:
+        courses_results.setdefault(student_course.student_id, []).append(
+            CourseResults.parse_obj(student_course.results_snapshot)
+            if student_course.results_snapshot is not None
+            else computed[(student_course.student_id, course.id)]
+        )
+    return courses_results
+
+
+async def get_batch_results_items(
+    session: AsyncSession,
+    contest_logins: list[str],
+    logger: 'loguru.Logger',
+    course_id: UUID | None = None,
+) -> tp.AsyncIterator[StudentResultsBatchItem]:
+    async for contest_login, student_results in get_students_results(
+        session, contest_logins, logger, course_id=course_id
+    ):
+        yield StudentResultsBatchItem(
+            contest_login=contest_login, results=student_results
+        )
+
+
+async def get_batch_results_lines(
+    contest_logins: list[str],
+    course_id: UUID | None,
+    logger: 'loguru.Logger',
+) -> tp.AsyncIterator[str]:
+    """
+    Get NDJSON lines of results of students, one item a line.
+    """
+    # own session, so streaming does not rely on when dependencies exit
+    async with SessionManager().create_read_only_async_session() as session:
+        async for item in get_batch_results_items(
+            session, contest_logins, logger, course_id=course_id
+        ):
+            yield item.json(ensure_ascii=False) + '\n'
@@ -0,0 +1,118 @@
+from app.database import models
+from app.schemas import contest as contest_schemas
+
+from .matrix import ContestColumn, CourseLevelsChanges, CourseMatrix
+
+
+CONTEST_OK_LEVEL_NAMES = ('Зачет автоматом', 'Зачет')
+CONTEST_ADMISSION_LEVEL_NAME = 'Допуск к зачету'
+
+
+def evaluate_contest_levels(  # pylint: disable=too-many-locals
+    column: ContestColumn,
+    matrix: CourseMatrix,
+    changes: CourseLevelsChanges,
+) -> tuple[list[list[bool]], list[int]]:
+    """
+    Evaluate levels of one contest for all students of course.
+
+    :return: Level values of students and changes of their contests_ok
+    """
+    is_ok = list(column.is_ok)
+    is_ok_no_deadline = list(column.is_ok_no_deadline)
+    contests_ok_diff = [0] * len(matrix.student_ids)
+    level_values = []
+    for level, old_values in zip(column.levels, column.level_is_ok):
+        values = [bool(value) for value in old_values]
+        evaluated = [
+            has_relation and not value
+            for has_relation, value in zip(column.has_relation, values)
+        ]
+        if any(evaluated):
+            values = [
+                new_value if is_evaluated else value
+                for new_value, is_evaluated, value in zip(
+                    _get_contest_level_is_ok(column, level),
+                    evaluated,
+                    values,
+                )
+            ]
+            if level.level_name in CONTEST_OK_LEVEL_NAMES:
+                contests_ok_diff = [
+                    (0 if contest_is_ok else int(value))
+                    if is_evaluated
+                    else diff
+                    for contest_is_ok, value, is_evaluated, diff in zip(
+                        is_ok, values, evaluated, contests_ok_diff
+                    )
+                ]
+                is_ok = [
+                    contest_is_ok or (is_evaluated and value)
+                    for contest_is_ok, value, is_evaluated in zip(
+                        is_ok, values, evaluated
+                    )
+                ]
+                is_ok_no_deadline = [
+                    no_deadline or (is_evaluated and contest_is_ok)
+                    for no_deadline, contest_is_ok, is_evaluated in zip(
+                        is_ok_no_deadline, is_ok, evaluated
+                    )
+                ]
+            elif level.level_name == CONTEST_ADMISSION_LEVEL_NAME:
+                is_ok_no_deadline = [
+                    no_deadline or (is_evaluated and value)
+                    for no_deadline, value, is_evaluated in zip(
+                        is_ok_no_deadline, values, evaluated
+                    )
+                ]
+        level_values.append(values)
+        for row, student_id in enumerate(matrix.student_ids):
+            if column.has_relation[row] and values[row] != old_values[row]:
+                changes.student_contest_levels[
+                    (student_id, column.contest.id, level.id)
+                ] = values[row]
+
+    for row, student_id in enumerate(matrix.student_ids):
+        if not column.has_relation[row]:
+            continue
+        if (is_ok[row], is_ok_no_deadline[row]) != (
+            column.is_ok[row],
+            column.is_ok_no_deadline[row],
+        ):
+            changes.student_contests[(student_id, column.contest.id)] = (
+                is_ok[row],
+                is_ok_no_deadline[row],
+            )
+    return level_values, contests_ok_diff
+
+
+def _get_contest_level_is_ok(
+    column: ContestColumn, level: models.ContestLevels
+) -> list[bool]:
+    if level.level_ok_method == contest_schemas.LevelOkMethod.TASKS_COUNT:
+        if level.include_after_deadline:
+            raise NotImplementedError(
+                f'Not implemented for '
+                f'{contest_schemas.LevelOkMethod.TASKS_COUNT} '
+                f'{level.count_method} include_after_deadline'
+            )
+        values: list[float] | list[int] = column.tasks_done
+        total = column.contest.tasks_count
+    elif level.level_ok_method == contest_schemas.LevelOkMethod.SCORE_SUM:
+        values = (
+            column.score_no_deadline
+            if level.include_after_deadline
+            else column.score
+        )
+        total = column.contest.score_max
+    else:
+        raise RuntimeError(
+            f'Contest level ok method {level.level_ok_method} not found'
+        )
+    if level.count_method == contest_schemas.LevelCountMethod.ABSOLUTE:
+        return [value >= level.ok_threshold for value in values]
+    if level.count_method == contest_schemas.LevelCountMethod.PERCENT:
+        return [100 * value / total >= level.ok_threshold for value in values]
+    raise RuntimeError(
+        f'Contest level count method {level.count_method} not found'
+    )
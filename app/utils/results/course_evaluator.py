@@ -0,0 +1,167 @@
+import datetime
+
+from app.schemas import course as course_schemas
+
+from .matrix import CourseLevelsChanges, CourseMatrix
+
+
+COURSE_OK_LEVEL_NAMES = ('Зачет автоматом', 'Зачет', 'Досрочный зачет')
+
+
+def evaluate_student_course_levels(
+    matrix: CourseMatrix,
+    contest_level_values: list[list[list[bool]]],
+    changes: CourseLevelsChanges,
+    now: datetime.datetime,
+) -> list[bool]:
+    """
+    Evaluate course levels for all students of course.
+
+    :return: is_ok of student courses
+    """
+    is_ok = list(matrix.is_ok)
+    for level, old_values in zip(
+        matrix.course_levels, matrix.course_level_is_ok
+    ):
+        values = [bool(value) for value in old_values]
+        if level.level_info and not (
+            level.result_update_end and now > level.result_update_end
+        ):
+            evaluated = [not value for value in values]
+            if any(evaluated):
+                level_info = course_schemas.LevelInfo(
+                    data=level.level_info['data']
+                )
+                values = [
+                    new_value if is_evaluated else value
+                    for new_value, is_evaluated, value in zip(
+                        _get_course_level_is_ok(
+                            matrix, contest_level_values, level_info, evaluated
+                        ),
+                        evaluated,
+                        values,
+                    )
+                ]
+            if level.level_name in COURSE_OK_LEVEL_NAMES:
+                is_ok = [
+                    course_is_ok or value
+                    for course_is_ok, value in zip(is_ok, values)
+                ]
+        for row, student_id in enumerate(matrix.student_ids):
+            if values[row] != old_values[row]:
+                changes.student_course_levels[(student_id, level.id)] = values[
+                    row
+                ]
+    return is_ok
+
+
+def _get_course_level_is_ok(
+    matrix: CourseMatrix,
+    contest_level_values: list[list[list[bool]]],
+    level_info: course_schemas.LevelInfo,
+    is_ok: list[bool],
+) -> list[bool]:
+    for level_elem in level_info.data:
+        indexes = [
+            index
+            for index, column in enumerate(matrix.contests)
+            if set(level_elem.tags) <= set(column.contest.tags)
+        ]
+        if (
+            level_elem.level_ok_method
+            == course_schemas.LevelOkMethod.CONTESTS_OK
+        ):
+            count_all = _sum_columns(
+                [matrix.contests[index].has_relation for index in indexes],
+                len(is_ok),
+            )
+            count_ok = _sum_columns(
+                [
+                    [
+                        has_relation and value
+                        for has_relation, value in zip(
+                            matrix.contests[index].has_relation,
+                            contest_level_values[index][level_index],
+                        )
+                    ]
+                    for index, level_index in _get_levels_indexes(
+                        matrix, indexes, level_elem.contest_ok_level_name
+                    )
+                ],
+                len(is_ok),
+            )
+        elif (
+            level_elem.level_ok_method
+            == course_schemas.LevelOkMethod.SCORE_SUM
+        ):
+            count_ok = _sum_columns(
+                [
+                    [
+                        score if has_relation else 0
+                        for score, has_relation in zip(
+                            matrix.contests[index].score,
+                            matrix.contests[index].has_relation,
+                        )
+                    ]
+                    for index in indexes
+                ],
+                len(is_ok),
+            )
+            count_all = _sum_columns(
+                [
+                    [
+                        matrix.contests[index].contest.score_max
+                        if has_relation
+                        else 0
+                        for has_relation in matrix.contests[index].has_relation
+                    ]
+                    for index in indexes
+                ],
+                len(is_ok),
+            )
+        else:
+            raise RuntimeError(
+                f'Course level ok method '
+                f'{level_elem.level_ok_method} not found'
+            )
+        if level_elem.count_method == course_schemas.LevelCountMethod.ABSOLUTE:
+            is_ok = [
+                value and ok >= level_elem.ok_threshold
+                for value, ok in zip(is_ok, count_ok)
+            ]
+        elif (
+            level_elem.count_method == course_schemas.LevelCountMethod.PERCENT
+        ):
+            is_ok = [
+                value and round(100 * ok / all_, 4) >= level_elem.ok_threshold
+                for value, ok, all_ in zip(is_ok, count_ok, count_all)
+            ]
+        else:
+            raise RuntimeError(
+                f'Course level count method '
+                f'{level_elem.count_method} not found'
+            )
+    return [value and bool(level_info.data) for value in is_ok]
+
+
+def _get_levels_indexes(
+    matrix: CourseMatrix, indexes: list[int], level_name: str | None
+) -> list[tuple[int, int]]:
+    result = []
+    for index in indexes:
+        level_names = [
+            level.level_name for level in matrix.contests[index].levels
+        ]
+        if level_name in level_names:
+            result.append((index, level_names.index(level_name)))
+    return result
+
+
+def _sum_columns(
+    columns: list[list[bool]] | list[list[float]], rows_count: int
+) -> list[float]:
+    # sums are accumulated in contests order, like in the scalar code
+    result: list[float] = [0] * rows_count
+    for column in columns:
+        result = [value + item for value, item in zip(result, column)]
+    return result
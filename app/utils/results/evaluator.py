@@ -0,0 +1,46 @@
+import datetime
+
+from .contest_evaluator import evaluate_contest_levels
+from .course_evaluator import evaluate_student_course_levels
+from .matrix import CourseLevelsChanges, CourseMatrix
+
+
+def evaluate_course_levels(
+    matrix: CourseMatrix,
+    now: datetime.datetime | None = None,
+) -> CourseLevelsChanges:
+    """
+    Evaluate contest and course levels of all students of course.
+
+    Every rule is evaluated for all students at once, column by column,
+    with the same semantics as update_student_contest_levels_results
+    and update_student_course_levels_results. The matrix is not changed.
+
+    :return: Changed values, ready to be written in bulk
+    """
+    now = now or datetime.datetime.now()
+    changes = CourseLevelsChanges()
+    contests_ok = list(matrix.contests_ok)
+    contest_level_values = []
+    for column in matrix.contests:
+        (
+            level_values,
+            contests_ok_diff,
+        ) = evaluate_contest_levels(column, matrix, changes)
+        contest_level_values.append(level_values)
+        contests_ok = [
+            value + diff for value, diff in zip(contests_ok, contests_ok_diff)
+        ]
+    is_ok = evaluate_student_course_levels(
+        matrix, contest_level_values, changes, now
+    )
+    for row, student_id in enumerate(matrix.student_ids):
+        if (is_ok[row], contests_ok[row]) != (
+            matrix.is_ok[row],
+            matrix.contests_ok[row],
+        ):
+            changes.student_courses[student_id] = (
+                is_ok[row],
+                contests_ok[row],
+            )
+    return changes
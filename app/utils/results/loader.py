@@ -0,0 +1,223 @@
+import dataclasses
+from uuid import UUID
+
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.database import models
+from app.utils import contest as contest_utils
+from app.utils import course as course_utils
+from app.utils import student as student_utils
+
+from .matrix import CourseLevelsChanges, CourseMatrix, make_course_matrix
+
+
+@dataclasses.dataclass
+class CourseLevelsData:
+    """
+    Relations and levels of all students of course.
+
+    Objects are attached to the session they were loaded by, so changes
+    applied by apply_changes are written on commit.
+    """
+
+    course: models.Course
+    course_levels: list[models.CourseLevels]
+    students: list[
+        tuple[models.Student, models.StudentCourse, models.Department]
+    ]
+    # contests sorted by lecture with levels sorted like in results
+    contests: list[tuple[models.Contest, list[models.ContestLevels]]]
+    # (student id, contest id) -> relation
+    student_contests: dict[tuple[UUID, UUID], models.StudentContest]
+    # (student id, contest level id) -> level of student
+    student_contest_levels: dict[
+        tuple[UUID, UUID], models.StudentContestLevels
+    ]
+    # (student id, course level id) -> level of student
+    student_course_levels: dict[tuple[UUID, UUID], models.StudentCourseLevels]
+
+    def get_student_course_levels(
+        self, student_id: UUID
+    ) -> list[models.StudentCourseLevels]:
+        """
+        Get course levels of student in order of course levels.
+        """
+        return [
+            self.student_course_levels[(student_id, level.id)]
+            for level in self.course_levels
+        ]
+
+    def get_student_course_contests_data(
+        self, student_id: UUID
+    ) -> list[
+        tuple[
+            models.Contest,
+            models.StudentContest,
+            list[models.ContestLevels],
+            list[models.StudentContestLevels],
+        ]
+    ]:
+        """
+        Get data like course_utils.get_student_course_contests_data.
+        """
+        contests_data = []
+        for contest, contest_levels in self.contests:
+            student_contest = self.student_contests.get(
+                (student_id, contest.id)
+            )
+            if student_contest is None:
+                continue
+            contests_data.append(
+                (
+                    contest,
+                    student_contest,
+                    contest_levels,
+                    [
+                        self.student_contest_levels[(student_id, level.id)]
+                        for level in contest_levels
+                    ],
+                )
+            )
+        return contests_data
+
+    def make_matrix(self) -> CourseMatrix:
+        """
+        Make course matrix for levels evaluation.
+        """
+        return make_course_matrix(
+            self.course.id,
+            [student_course for _, student_course, _ in self.students],
+            self.contests,
+            list(self.student_contests.values()),
+            list(self.student_contest_levels.values()),
+            self.course_levels,
+            list(self.student_course_levels.values()),
+        )
+
+    def apply_changes(
+        self, changes: CourseLevelsChanges, student_ids: set[UUID]
+    ) -> None:
+        """
+        Apply evaluated changes of students with given ids.
+
+        Percents of course are updated like in
+        update_student_course_results for students with contests.
+        """
+        for (
+            student_id,
+            _,
+            level_id,
+        ), is_ok in changes.student_contest_levels.items():
+            if student_id in student_ids:
+                self.student_contest_levels[
+                    (student_id, level_id)
+                ].is_ok = is_ok
+        for (student_id, contest_id), (
+            is_ok,
+            is_ok_no_deadline,
+        ) in changes.student_contests.items():
+            if student_id in student_ids:
+                student_contest = self.student_contests[
+                    (student_id, contest_id)
+                ]
+                student_contest.is_ok = is_ok
+                student_contest.is_ok_no_deadline = is_ok_no_deadline
+        for (
+            student_id,
+            level_id,
+        ), is_ok in changes.student_course_levels.items():
+            if student_id in student_ids:
+                self.student_course_levels[
+                    (student_id, level_id)
+                ].is_ok = is_ok
+        students_with_contests = {
+            student_id for student_id, _ in self.student_contests
+        }
+        for _, student_course, _ in self.students:
+            if student_course.student_id not in student_ids:
+                continue
+            if student_course.student_id in changes.student_courses:
+                (
+                    student_course.is_ok,
+                    student_course.contests_ok,
+                ) = changes.student_courses[student_course.student_id]
+            if student_course.student_id in students_with_contests:
+                student_course.score_percent = round(
+                    100 * student_course.score / self.course.score_max, 4
+                )
+                student_course.contests_ok_percent = round(
+                    100
+                    * student_course.contests_ok
+                    / self.course.contest_count,
+                    4,
+                )
+
+
+async def get_course_levels_data(
+    session: AsyncSession,
+    course: models.Course,
+    course_levels: list[models.CourseLevels],
+) -> CourseLevelsData:
+    """
+    Load relations and levels of all students of course.
+
+    Missing levels of students are created, so every student has
+    a level for every course level and for every level of every
+    contest student has relation with.
+    """
+    students = await student_utils.get_students_by_course_with_department(
+        session, course.id
+    )
+    contests = sorted(
+        await contest_utils.get_contests(session, course.id),
+        key=lambda x: x.lecture,
+    )
+    contest_levels: dict[UUID, list[models.ContestLevels]] = {
+        contest.id: [] for contest in contests
+    }
+    for level in await contest_utils.get_course_contest_levels(
+        session, course.id
+    ):
+        contest_levels.setdefault(level.contest_id, []).append(level)
+    student_contests = await contest_utils.get_course_student_contests(
+        session, course.id
+    )
+    student_contest_levels = (
+        await contest_utils.get_or_create_course_student_contest_levels(
+            session, course.id
+        )
+    )
+    student_course_levels = (
+        await course_utils.get_or_create_course_student_course_levels(
+            session, course.id
+        )
+    )
+    return CourseLevelsData(
+        course=course,
+        course_levels=course_levels,
+        students=students,
+        contests=[
+            (
+                contest,
+                sorted(
+                    contest_levels[contest.id],
+                    key=lambda x: (x.count_method, x.ok_threshold),
+                ),
+            )
+            for contest in contests
+        ],
+        student_contests={
+            (student_contest.student_id, student_contest.contest_id): (
+                student_contest
+            )
+            for student_contest in student_contests
+        },
+        student_contest_levels={
+            (level.student_id, level.contest_level_id): level
+            for level in student_contest_levels
+        },
+        student_course_levels={
+            (level.student_id, level.course_level_id): level
+            for level in student_course_levels
+        },
+    )
@@ -0,0 +1,162 @@
+import dataclasses
+from uuid import UUID
+
+from app.database import models
+
+
+@dataclasses.dataclass
+class ContestColumn:
+    """
+    Values of one contest for all students of course.
+
+    Lists are indexed like CourseMatrix.student_ids. Level values
+    are None if student has no level row yet.
+    """
+
+    contest: models.Contest
+    levels: list[models.ContestLevels]
+    has_relation: list[bool]
+    score: list[float]
+    score_no_deadline: list[float]
+    tasks_done: list[int]
+    is_ok: list[bool]
+    is_ok_no_deadline: list[bool]
+    level_is_ok: list[list[bool | None]]
+
+
+@dataclasses.dataclass
+class CourseMatrix:
+    """
+    Students x contests values of course for levels evaluation.
+    """
+
+    course_id: UUID
+    student_ids: list[UUID]
+    is_ok: list[bool]
+    contests_ok: list[int]
+    contests: list[ContestColumn]
+    course_levels: list[models.CourseLevels]
+    course_level_is_ok: list[list[bool | None]]
+
+
+@dataclasses.dataclass
+class CourseLevelsChanges:
+    """
+    Values changed by levels evaluation, including new level rows.
+    """
+
+    # (student id, contest id, contest level id) -> is_ok
+    student_contest_levels: dict[
+        tuple[UUID, UUID, UUID], bool
+    ] = dataclasses.field(default_factory=dict)
+    # (student id, contest id) -> (is_ok, is_ok_no_deadline)
+    student_contests: dict[
+        tuple[UUID, UUID], tuple[bool, bool]
+    ] = dataclasses.field(default_factory=dict)
+    # (student id, course level id) -> is_ok
+    student_course_levels: dict[tuple[UUID, UUID], bool] = dataclasses.field(
+        default_factory=dict
+    )
+    # student id -> (is_ok, contests_ok)
+    student_courses: dict[UUID, tuple[bool, int]] = dataclasses.field(
+        default_factory=dict
+    )
+
+
+def make_course_matrix(  # pylint: disable=too-many-arguments,too-many-locals
+    course_id: UUID,
+    student_courses: list[models.StudentCourse],
+    contests: list[tuple[models.Contest, list[models.ContestLevels]]],
+    student_contests: list[models.StudentContest],
+    student_contest_levels: list[models.StudentContestLevels],
+    course_levels: list[models.CourseLevels],
+    student_course_levels: list[models.StudentCourseLevels],
+) -> CourseMatrix:
+    """
+    Build course matrix from models of course.
+
+    Contest levels are sorted like in update_student_course_results.
+    If there are many level rows for one student and level,
+    the first one is used.
+    """
+    student_ids = [
+        student_course.student_id for student_course in student_courses
+    ]
+    student_contests_by_key = {
+        (student_contest.contest_id, student_contest.student_id): (
+            student_contest
+        )
+        for student_contest in student_contests
+    }
+    contest_levels_is_ok: dict[tuple[UUID, UUID], bool] = {}
+    for level_model in student_contest_levels:
+        contest_levels_is_ok.setdefault(
+            (level_model.contest_level_id, level_model.student_id),
+            level_model.is_ok,
+        )
+    course_levels_is_ok: dict[tuple[UUID, UUID], bool] = {}
+    for level_model in student_course_levels:
+        course_levels_is_ok.setdefault(
+            (level_model.course_level_id, level_model.student_id),
+            level_model.is_ok,
+        )
+
+    columns = []
+    for contest, contest_levels in contests:
+        relations = [
+            student_contests_by_key.get((contest.id, student_id))
+            for student_id in student_ids
+        ]
+        levels = sorted(
+            contest_levels, key=lambda x: (x.count_method, x.ok_threshold)
+        )
+        columns.append(
+            ContestColumn(
+                contest=contest,
+                levels=levels,
+                has_relation=[relation is not None for relation in relations],
+                score=[
+                    relation.score if relation else 0.0
+                    for relation in relations
+                ],
+                score_no_deadline=[
+                    relation.score_no_deadline if relation else 0.0
+                    for relation in relations
+                ],
+                tasks_done=[
+                    relation.tasks_done if relation else 0
+                    for relation in relations
+                ],
+                is_ok=[
+                    bool(relation and relation.is_ok) for relation in relations
+                ],
+                is_ok_no_deadline=[
+                    bool(relation and relation.is_ok_no_deadline)
+                    for relation in relations
+                ],
+                level_is_ok=[
+                    [
+                        contest_levels_is_ok.get((level.id, student_id))
+                        for student_id in student_ids
+                    ]
+                    for level in levels
+                ],
+            )
+        )
+    return CourseMatrix(
+        course_id=course_id,
+        student_ids=student_ids,
+        is_ok=[student_course.is_ok for student_course in student_courses],
+        contests_ok=[
+            student_course.contests_ok for student_course in student_courses
+        ],
+        contests=columns,
+        course_levels=course_levels,
+        course_level_is_ok=[
+            [
+                course_levels_is_ok.get((level.id, student_id))
+                for student_id in student_ids
+            ]
+            for level in course_levels
+        ],
+    )
@@ -0,0 +1,97 @@
+from uuid import UUID
+
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.database import models
+from app.utils import contest as contest_utils
+from app.utils import course as course_utils
+
+from .loader import CourseLevelsData
+
+
+async def get_student_course_levels_data(
+    session: AsyncSession,
+    course: models.Course,
+    course_levels: list[models.CourseLevels],
+    student_ids: list[UUID],
+) -> CourseLevelsData:
+    """
+    Load relations and levels of some students of course only by reads.
+
+    Contests and levels of course are loaded once for all students.
+    Missing levels of students are not created but made not ok and
+    not added to session, so nothing is written. `students` are not
+    loaded, the data is only for getting results of students.
+    """
+    contests = sorted(
+        await contest_utils.get_contests(session, course.id),
+        key=lambda x: x.lecture,
+    )
+    contest_levels: dict[UUID, list[models.ContestLevels]] = {
+        contest.id: [] for contest in contests
+    }
+    for level in await contest_utils.get_course_contest_levels(
+        session, course.id
+    ):
+        contest_levels.setdefault(level.contest_id, []).append(level)
+    student_contests = {
+        (student_contest.student_id, student_contest.contest_id): (
+            student_contest
+        )
+        for student_contest in await contest_utils.get_course_student_contests(
+            session, course.id, student_ids
+        )
+    }
+    student_contest_levels = {
+        (level.student_id, level.contest_level_id): level
+        for level in await contest_utils.get_student_contest_levels(
+            session, student_ids, course.id
+        )
+    }
+    for student_id, contest_id in student_contests:
+        for level in contest_levels[contest_id]:
+            student_contest_levels.setdefault(
+                (student_id, level.id),
+                models.StudentContestLevels(
+                    course_id=course.id,
+                    contest_id=contest_id,
+                    student_id=student_id,
+                    contest_level_id=level.id,
+                    is_ok=False,
+                ),
+            )
+    student_course_levels = {
+        (level.student_id, level.course_level_id): level
+        for level in await course_utils.get_student_course_levels(
+            session, student_ids, course.id
+        )
+    }
+    for student_id in student_ids:
+        for level in course_levels:
+            student_course_levels.setdefault(
+                (student_id, level.id),
+                models.StudentCourseLevels(
+                    course_id=course.id,
+                    student_id=student_id,
+                    course_level_id=level.id,
+                    is_ok=False,
+                ),
+            )
+    return CourseLevelsData(
+        course=course,
+        course_levels=course_levels,
+        students=[],
+        contests=[
+            (
+                contest,
+                sorted(
+                    contest_levels[contest.id],
+                    key=lambda x: (x.count_method, x.ok_threshold),
+                ),
+            )
+            for contest in contests
+        ],
+        student_contests=student_contests,
+        student_contest_levels=student_contest_levels,
+        student_course_levels=student_course_levels,
+    )
@@ -0,0 +1,161 @@
+import typing as tp
+from uuid import UUID
+
+import loguru
+from sqlalchemy import and_, bindparam, select, update
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import undefer
+
+from app.database import models
+from app.schemas import CourseResults, StudentResults
+from app.utils import course as course_utils
+from app.utils import department as department_utils
+
+from .reader import get_student_course_levels_data
+from .service import get_student_course_results
+
+
+async def get_student_courses_with_snapshots(
+    session: AsyncSession, student_id: UUID
+) -> list[tuple[models.Course, models.StudentCourse]]:
+    """
+    Get active courses of student with results snapshots loaded.
+    """
+    return await get_students_courses_with_snapshots(session, [student_id])
+
+
+async def get_students_courses_with_snapshots(
+    session: AsyncSession,
+    student_ids: list[UUID],
+    course_id: UUID | None = None,
+) -> list[tuple[models.Course, models.StudentCourse]]:
+    """
+    Get active courses of students with results snapshots loaded.
+
+    :param course_id: Get only this course
+    """
+    query = (
+        select(models.Course, models.StudentCourse)
+        .where(models.Course.id == models.StudentCourse.course_id)
+        .where(models.StudentCourse.student_id.in_(student_ids))
+        .where(~models.Course.is_archive)
+        .options(undefer(models.StudentCourse.results_snapshot))
+    )
+    if course_id is not None:
+        query = query.where(models.Course.id == course_id)
+    return (await session.execute(query)).fetchall()
+
+
+async def get_student_course_with_snapshot(
+    session: AsyncSession, student_id: UUID, course_id: UUID
+) -> models.StudentCourse | None:
+    query = (
+        select(models.StudentCourse)
+        .where(models.StudentCourse.student_id == student_id)
+        .where(models.StudentCourse.course_id == course_id)
+        .options(undefer(models.StudentCourse.results_snapshot))
+    )
+    return await session.scalar(query)
+
+
+async def get_course_results_snapshots(
+    session: AsyncSession, course_id: UUID
+) -> dict[UUID, dict[str, tp.Any] | None]:
+    """
+    :return: Student id -> results snapshot of student on course
+    """
+    query = select(
+        models.StudentCourse.student_id,
+        models.StudentCourse.results_snapshot,
+    ).where(models.StudentCourse.course_id == course_id)
+    return dict((await session.execute(query)).fetchall())
+
+
+async def save_course_results_snapshots(
+    session: AsyncSession,
+    course_id: UUID,
+    snapshots: dict[UUID, dict[str, tp.Any]],
+) -> None:
+    """
+    Write results snapshots of students on course by executemany UPDATE.
+    """
+    if not snapshots:
+        return
+    table = models.StudentCourse.__table__
+    await session.execute(
+        update(table)
+        .where(
+            and_(
+                table.c.course_id == course_id,
+                table.c.student_id == bindparam('b_student_id'),
+            )
+        )
+        .values(results_snapshot=bindparam('b_results_snapshot')),
+        [
+            {'b_student_id': student_id, 'b_results_snapshot': snapshot}
+            for student_id, snapshot in snapshots.items()
+        ],
+    )
+
+
+async def load_student_course_results(  # pylint: disable=too-many-arguments
+    session: AsyncSession,
+    student: models.Student,
+    course: models.Course,
+    student_course: models.StudentCourse,
+    logger: 'loguru.Logger',
+) -> CourseResults:
+    """
+    Get course results of student from the snapshot written by
+    update_results.
+
+    Results are computed from relations only if there is no snapshot
+    yet, e.g. right after registration on course. Computing only reads,
+    so the session may be read only.
+
+    :param student_course: Relation loaded with results snapshot.
+    """
+    if student_course.results_snapshot is not None:
+        return CourseResults.parse_obj(student_course.results_snapshot)
+    logger.info(
+        'No results snapshot of student {}, computing results',
+        student.contest_login,
+    )
+    course_levels = await course_utils.get_course_levels(session, course.id)
+    levels_data = await get_student_course_levels_data(
+        session, course, course_levels, [student.id]
+    )
+    return await get_student_course_results(
+        student,
+        course,
+        course_levels,
+        student_course,
+        levels_data.get_student_course_levels(student.id),
+        levels_data.get_student_course_contests_data(student.id),
+        logger=logger,
+    )
+
+
+async def get_student_results(
+    session: AsyncSession,
+    student: models.Student,
+    logger: 'loguru.Logger',
+) -> StudentResults:
+    """
+    Get results of student on all active courses.
+    """
+    department = await department_utils.get_department_by_student(
+        session, student.id
+    )
+    return StudentResults(
+        courses=[
+            await load_student_course_results(
+                session, student, course, student_course, logger=logger
+            )
+            for course, student_course in (
+                await get_student_courses_with_snapshots(session, student.id)
+            )
+        ],
+        fio=student.fio,
+        department=department.name,
+    )
@@ -1,10 +1,12 @@
 from .database import (
     create_student,
+    get_all_student_models_by_author_ids,
     get_or_create_all_student_models,
     get_student,
     get_student_by_fio,
     get_student_by_tg_id,
     get_student_by_token,
+    get_students_by_contest_logins_with_department,
     get_students_by_course,
     get_students_by_course_with_department,
     get_students_by_course_with_no_contest,
@@ -26,4 +28,6 @@ __all__ = [
     'get_student_or_raise',
     'get_students_by_course_with_no_group',
     'get_student_by_tg_id',
+    'get_all_student_models_by_author_ids',
+    'get_students_by_contest_logins_with_department',
 ]
@@ -112,6 +112,19 @@ async def get_students_by_course_with_department(
     return (await session.execute(query)).fetchall()
 
 
+async def get_students_by_contest_logins_with_department(
+    session: AsyncSession, contest_logins: list[str]
+) -> list[tuple[Student, Department | None]]:
+    query = (
+        select(Student, Department)
+        .select_from(Student)
+        .where(Student.contest_login.in_(contest_logins))
+        .join(StudentDepartment, isouter=True)
+        .join(Department, isouter=True)
+    )
+    return (await session.execute(query)).fetchall()
+
+
 async def create_student(
     session: AsyncSession,
     data: RegisterRequest,
@@ -167,3 +180,38 @@ async def get_or_create_all_student_models(
     )
 
     return student, student_course, student_contest
+
+
+async def get_all_student_models_by_author_ids(
+    session: AsyncSession,
+    course_id: UUID,
+    contest_id: UUID,
+    author_ids: list[int],
+) -> dict[int, tuple[Student, StudentCourse | None, StudentContest]]:
+    """
+    Get student models for many author ids of contest by one query.
+
+    :return: Dict of author id to student, student course
+        and student contest
+    """
+    query = (
+        select(Student, StudentCourse, StudentContest)
+        .join(StudentContest, StudentContest.student_id == Student.id)
+        .join(
+            StudentCourse,
+            and_(
+                StudentCourse.student_id == Student.id,
+                StudentCourse.course_id == course_id,
+            ),
+            isouter=True,
+        )
+        .where(StudentContest.contest_id == contest_id)
+        .where(StudentContest.course_id == course_id)
+        .where(StudentContest.author_id.in_(author_ids))
+    )
+    return {
+        student_contest.author_id: (student, student_course, student_contest)
+        for student, student_course, student_contest in (
+            await session.execute(query)
+        )
+    }
@@ -3,8 +3,15 @@ from .database import (
     get_last_updated_submission,
     get_no_verdict_submissions,
     get_submission,
+    get_submission_ids_by_run_ids,
     update_submission,
 )
+from .service import (
+    get_next_verdict_check_at,
+    get_submission_scores,
+    get_submissions_scores,
+    make_submission_model,
+)
 
 
 __all__ = [
@@ -13,4 +20,9 @@ __all__ = [
     'get_last_updated_submission',
     'get_no_verdict_submissions',
     'update_submission',
+    'get_submission_ids_by_run_ids',
+    'get_submission_scores',
+    'make_submission_model',
+    'get_submissions_scores',
+    'get_next_verdict_check_at',
 ]
@@ -1,11 +1,13 @@
+from datetime import datetime
 from uuid import UUID
 
-from sqlalchemy import select
+from sqlalchemy import or_, select
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.database import models
 from app.schemas import contest as contest_schemas
-from app.utils import task as task_utils
+
+from .service import get_submission_scores, make_submission_model
 
 
 async def get_last_updated_submission(
@@ -28,6 +30,23 @@ async def get_submission(
     return (await session.execute(query)).scalars().first()
 
 
+async def get_submission_ids_by_run_ids(
+    session: AsyncSession,
+    run_ids: list[int],
+) -> dict[int, UUID]:
+    """
+    Get ids of submissions which are already in database.
+
+    :return: Dict of run id to submission id
+    """
+    if not run_ids:
+        return {}
+    query = select(models.Submission.run_id, models.Submission.id).where(
+        models.Submission.run_id.in_(run_ids)
+    )
+    return dict((await session.execute(query)).all())
+
+
 async def add_submission(  # pylint: disable=too-many-arguments
     session: AsyncSession,
     student: models.Student,
@@ -37,41 +56,8 @@ async def add_submission(  # pylint: disable=too-many-arguments
     student_task: models.StudentTask,
     submission: contest_schemas.ContestSubmissionFull,
 ) -> models.Submission:
-    no_deadline_score = (
-        task.score_max
-        if (
-            not submission.finalScore
-            and submission.verdict == 'OK'
-            and task.is_zero_ok
-        )
-        else submission.finalScore
-    )
-    score_before_finish = (
-        no_deadline_score
-        if submission.submissionTime <= contest.deadline
-        else 0
-    )
-    final_score = task_utils.eval_expr(
-        task.final_score_evaluation_formula.format(
-            best_score_before_finish=score_before_finish,
-            best_score_no_deadline=no_deadline_score,
-        )
-    )
-    submission_model = models.Submission(
-        course_id=course.id,
-        contest_id=contest.id,
-        task_id=task.id,
-        student_id=student.id,
-        student_task_id=student_task.id,
-        author_id=submission.authorId,
-        run_id=submission.id,
-        verdict=submission.verdict,
-        final_score=final_score,
-        score_no_deadline=no_deadline_score,
-        score_before_finish=score_before_finish,
-        submission_link=f'https://admin.contest.yandex.ru/'
-        f'submissions/{submission.id}/',
-        submission_time=submission.submissionTime,
+    submission_model = make_submission_model(
+        student, contest, course, task, student_task, submission
     )
     session.add(submission_model)
     return submission_model
@@ -84,26 +70,11 @@ async def update_submission(  # pylint: disable=too-many-arguments
     submission: contest_schemas.ContestSubmissionFull,
     submission_for_update: models.Submission,
 ) -> None:
-    no_deadline_score = (
-        task.score_max
-        if (
-            not submission.finalScore
-            and submission.verdict == 'OK'
-            and task.is_zero_ok
-        )
-        else submission.finalScore
-    )
-    score_before_finish = (
-        no_deadline_score
-        if submission.submissionTime <= contest.deadline
-        else 0
-    )
-    final_score = task_utils.eval_expr(
-        task.final_score_evaluation_formula.format(
-            best_score_before_finish=score_before_finish,
-            best_score_no_deadline=no_deadline_score,
-        )
-    )
+    (
+        no_deadline_score,
+        score_before_finish,
+        final_score,
+    ) = get_submission_scores(contest, task, submission)
     submission_for_update.verdict = submission.verdict
     submission_for_update.final_score = final_score
     submission_for_update.score_no_deadline = no_deadline_score
@@ -113,8 +84,31 @@ async def update_submission(  # pylint: disable=too-many-arguments
 
 async def get_no_verdict_submissions(
     session: AsyncSession,
+    now: datetime | None = None,
 ) -> list[models.Submission]:
+    """
+    Get submissions without verdict.
+
+    :param now: Get only submissions due to check at this time
+    """
     query = select(models.Submission).where(
         models.Submission.verdict == 'No report'
     )
-    return (await session.execute(query)).scalars().all()
+    if now is not None:
+        query = query.where(
+            or_(
+                models.Submission.next_verdict_check_at.is_(None),
+                models.Submission.next_verdict_check_at <= now,
+            )
+        )
+    return (
+        (
+            await session.execute(
+                query.order_by(
+                    models.Submission.contest_id, models.Submission.run_id
+                )
+            )
+        )
+        .scalars()
+        .all()
+    )
@@ -0,0 +1,131 @@
+from datetime import datetime, timedelta
+
+from app.config import get_settings
+from app.database import models
+from app.schemas import contest as contest_schemas
+from app.utils import task as task_utils
+
+
+def _get_deadline_scores(
+    contest: models.Contest,
+    task: models.Task,
+    submission: contest_schemas.ContestSubmissionFull,
+) -> tuple[float, float]:
+    no_deadline_score = (
+        task.score_max
+        if (
+            not submission.finalScore
+            and submission.verdict == 'OK'
+            and task.is_zero_ok
+        )
+        else submission.finalScore
+    )
+    score_before_finish = (
+        no_deadline_score
+        if submission.submissionTime <= contest.deadline
+        else 0
+    )
+    return no_deadline_score, score_before_finish
+
+
+def get_submission_scores(
+    contest: models.Contest,
+    task: models.Task,
+    submission: contest_schemas.ContestSubmissionFull,
+) -> tuple[float, float, float]:
+    """
+    Evaluate scores of submission.
+
+    :return: Score with no deadline, score before finish and final score
+    """
+    no_deadline_score, score_before_finish = _get_deadline_scores(
+        contest, task, submission
+    )
+    final_score = task_utils.evaluate_formula(
+        task.final_score_evaluation_formula,
+        best_score_before_finish=score_before_finish,
+        best_score_no_deadline=no_deadline_score,
+    )
+    return no_deadline_score, score_before_finish, final_score
+
+
+def get_submissions_scores(
+    contest: models.Contest,
+    task: models.Task,
+    submissions: list[contest_schemas.ContestSubmissionFull],
+) -> list[tuple[float, float, float]]:
+    """
+    Evaluate scores of many submissions of one task at once.
+
+    :return: Scores like get_submission_scores for every submission
+    """
+    deadline_scores = [
+        _get_deadline_scores(contest, task, submission)
+        for submission in submissions
+    ]
+    final_scores = task_utils.evaluate_formula_batch(
+        task.final_score_evaluation_formula,
+        [score_before_finish for _, score_before_finish in deadline_scores],
+        [no_deadline_score for no_deadline_score, _ in deadline_scores],
+    )
+    return [
+        (no_deadline_score, score_before_finish, final_score)
+        for (no_deadline_score, score_before_finish), final_score in zip(
+            deadline_scores, final_scores
+        )
+    ]
+
+
+def make_submission_model(  # pylint: disable=too-many-arguments
+    student: models.Student,
+    contest: models.Contest,
+    course: models.Course,
+    task: models.Task,
+    student_task: models.StudentTask,
+    submission: contest_schemas.ContestSubmissionFull,
+    scores: tuple[float, float, float] | None = None,
+) -> models.Submission:
+    """
+    Make submission model, scores are evaluated if not given.
+    """
+    (
+        no_deadline_score,
+        score_before_finish,
+        final_score,
+    ) = scores or get_submission_scores(contest, task, submission)
+    return models.Submission(
+        course_id=course.id,
+        contest_id=contest.id,
+        task_id=task.id,
+        student_id=student.id,
+        student_task_id=student_task.id,
+        author_id=submission.authorId,
+        run_id=submission.id,
+        verdict=submission.verdict,
+        final_score=final_score,
+        score_no_deadline=no_deadline_score,
+        score_before_finish=score_before_finish,
+        submission_link=f'https://admin.contest.yandex.ru/'
+        f'submissions/{submission.id}/',
+        submission_time=submission.submissionTime,
+        verdict_checks_count=0,
+    )
+
+
+def get_next_verdict_check_at(
+    verdict_checks_count: int, now: datetime
+) -> datetime:
+    """
+    Get time of the next check of submission without verdict.
+
+    The interval doubles with every check, from NO_VERDICT_CHECK_INTERVAL
+    up to NO_VERDICT_CHECK_MAX_INTERVAL.
+    """
+    settings = get_settings()
+    return now + timedelta(
+        seconds=min(
+            settings.NO_VERDICT_CHECK_INTERVAL
+            * 2 ** min(verdict_checks_count, 32),
+            settings.NO_VERDICT_CHECK_MAX_INTERVAL,
+        )
+    )
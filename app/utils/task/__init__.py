@@ -1,20 +1,38 @@
 from .database import (
-    add_student_task_relation,
+    get_or_create_student_task_relation,
+    get_or_create_student_tasks,
     get_student_task_relation,
+    get_student_tasks,
     get_task,
     get_task_by_alias,
     get_task_by_id,
+    get_tasks,
     get_tasks_by_yandex_ids,
 )
-from .service import eval_expr
+from .service import (
+    compile_formula,
+    compile_formula_batch,
+    eval_expr,
+    evaluate_formula,
+    evaluate_formula_batch,
+    validate_formula,
+)
 
 
 __all__ = [
     'get_task',
     'get_student_task_relation',
-    'add_student_task_relation',
+    'get_or_create_student_task_relation',
     'eval_expr',
     'get_task_by_id',
     'get_task_by_alias',
     'get_tasks_by_yandex_ids',
+    'get_tasks',
+    'get_student_tasks',
+    'get_or_create_student_tasks',
+    'compile_formula',
+    'compile_formula_batch',
+    'evaluate_formula',
+    'evaluate_formula_batch',
+    'validate_formula',
 ]
@@ -4,6 +4,7 @@ from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.database import models
+from app.utils import common as common_utils
 
 
 async def get_task(
@@ -55,7 +56,7 @@ async def get_student_task_relation(
     return (await session.execute(query)).scalars().first()
 
 
-async def add_student_task_relation(
+async def get_or_create_student_task_relation(
     session: AsyncSession,
     student: models.Student,
     contest: models.Contest,
@@ -63,7 +64,7 @@ async def add_student_task_relation(
     task: models.Task,
 ) -> models.StudentTask:
     """
-    Add student task relation.
+    Get student task relation, which is created if it does not exist.
 
     :param session: Database session
     :param student: Student models
@@ -73,14 +74,44 @@ async def add_student_task_relation(
 
     :return: Student task relation
     """
-    student_task = models.StudentTask(
-        course_id=course.id,
-        contest_id=contest.id,
-        task_id=task.id,
-        student_id=student.id,
-    )
-    session.add(student_task)
-    return student_task
+    return (
+        await get_or_create_student_tasks(
+            session, course.id, contest.id, [(student.id, task.id)]
+        )
+    )[(student.id, task.id)]
+
+
+async def get_or_create_student_tasks(
+    session: AsyncSession,
+    course_id: UUID,
+    contest_id: UUID,
+    keys: list[tuple[UUID, UUID]],
+) -> dict[tuple[UUID, UUID], models.StudentTask]:
+    """
+    Get student task relations of contest for many students and tasks,
+    missing ones are created by the same query.
+
+    :param keys: List of (student id, task id)
+
+    :return: Dict of (student id, task id) to student task relation
+    """
+    return {
+        (student_task.student_id, student_task.task_id): student_task
+        for student_task in await common_utils.get_or_create_models(
+            session,
+            models.StudentTask,
+            [
+                {
+                    'course_id': course_id,
+                    'contest_id': contest_id,
+                    'student_id': student_id,
+                    'task_id': task_id,
+                }
+                for student_id, task_id in keys
+            ],
+            index_elements=['student_id', 'task_id'],
+        )
+    }
 
 
 async def get_tasks_by_yandex_ids(
@@ -91,3 +122,31 @@ async def get_tasks_by_yandex_ids(
         models.Task.yandex_task_id.in_(yandex_task_ids)
     )
     return (await session.execute(query)).scalars().all()
+
+
+async def get_tasks(
+    session: AsyncSession, contest_id: UUID
+) -> list[models.Task]:
+    query = select(models.Task).where(models.Task.contest_id == contest_id)
+    return (await session.execute(query)).scalars().all()
+
+
+async def get_student_tasks(
+    session: AsyncSession,
+    contest_id: UUID,
+    student_ids: list[UUID],
+) -> dict[tuple[UUID, UUID], models.StudentTask]:
+    """
+    Get student task relations of contest for many students.
+
+    :return: Dict of (student id, task id) to student task relation
+    """
+    query = (
+        select(models.StudentTask)
+        .where(models.StudentTask.contest_id == contest_id)
+        .where(models.StudentTask.student_id.in_(student_ids))
+    )
+    return {
+        (student_task.student_id, student_task.task_id): student_task
+        for student_task in (await session.execute(query)).scalars()
+    }
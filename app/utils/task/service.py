@@ -1,5 +1,9 @@
 import ast
+import functools
+import math
 import operator as op
+import string
+import typing as tp
 
 
 # supported operators
@@ -47,3 +51,236 @@ def _eval(node: ast.AST) -> float:
             *[_eval(arg) for arg in node.args]
         )
     raise TypeError(node)
+
+
+FORMULA_VARIABLES = ('best_score_before_finish', 'best_score_no_deadline')
+
+# characters which can be glued with substituted number into one token
+_TOKEN_CHARS = set(string.ascii_letters + string.digits + '_.')
+
+Formula = tp.Callable[[float, float], float]
+BatchFormula = tp.Callable[[list[float], list[float]], list[float]]
+
+
+def compile_formula(formula: str) -> Formula:
+    """
+    Compile final score evaluation formula once into a callable.
+
+    The callable takes best_score_before_finish and
+    best_score_no_deadline and returns the same result as
+    ``eval_expr(formula.format(...))`` for non-negative finite scores.
+
+    :raises ValueError: If formula can not be evaluated
+    """
+    return _compile_formula(formula)[0]
+
+
+def compile_formula_batch(formula: str) -> BatchFormula:
+    """
+    Compile formula into a callable evaluating lists of scores at once.
+    """
+    return _compile_formula(formula)[1]
+
+
+def validate_formula(formula: str) -> None:
+    """
+    Check that formula can be evaluated.
+
+    :raises ValueError: If formula can not be evaluated
+    """
+    formula_func = compile_formula(formula)
+    try:
+        formula_func(1.0, 1.0)
+    except ArithmeticError:
+        # formula is correct, but not defined for sample scores
+        pass
+    except (TypeError, KeyError, AttributeError) as exc:
+        raise ValueError(f'Bad formula {formula!r}: {exc!r}') from exc
+
+
+def evaluate_formula(
+    formula: str,
+    best_score_before_finish: float,
+    best_score_no_deadline: float,
+) -> float:
+    if not (
+        _is_safe_value(best_score_before_finish)
+        and _is_safe_value(best_score_no_deadline)
+    ):
+        return _eval_formatted(
+            formula, best_score_before_finish, best_score_no_deadline
+        )
+    return compile_formula(formula)(
+        best_score_before_finish, best_score_no_deadline
+    )
+
+
+def evaluate_formula_batch(
+    formula: str,
+    best_scores_before_finish: list[float],
+    best_scores_no_deadline: list[float],
+) -> list[float]:
+    """
+    Evaluate formula for many pairs of scores at once.
+    """
+    if all(map(_is_safe_value, best_scores_before_finish)) and all(
+        map(_is_safe_value, best_scores_no_deadline)
+    ):
+        return compile_formula_batch(formula)(
+            best_scores_before_finish, best_scores_no_deadline
+        )
+    return [
+        evaluate_formula(formula, before_finish, no_deadline)
+        for before_finish, no_deadline in zip(
+            best_scores_before_finish, best_scores_no_deadline
+        )
+    ]
+
+
+def _is_safe_value(value: float) -> bool:
+    # negative numbers are substituted as unary minus, so operator
+    # precedence of formatted formula differs, e.g. "{x}**2" for -1
+    return (
+        isinstance(value, (int, float))
+        and not isinstance(value, bool)
+        and math.isfinite(value)
+        and math.copysign(1, value) > 0
+    )
+
+
+def _eval_formatted(
+    formula: str,
+    best_score_before_finish: float,
+    best_score_no_deadline: float,
+) -> float:
+    return eval_expr(
+        formula.format(
+            best_score_before_finish=best_score_before_finish,
+            best_score_no_deadline=best_score_no_deadline,
+        )
+    )
+
+
+@functools.lru_cache(maxsize=1024)
+def _compile_formula(formula: str) -> tuple[Formula, BatchFormula]:
+    expr = []
+    is_textual = False
+    try:
+        parsed_formula = list(string.Formatter().parse(formula))
+    except ValueError as exc:
+        raise ValueError(f'Bad formula {formula!r}: {exc}') from exc
+    for index, (literal, field_name, format_spec, conversion) in enumerate(
+        parsed_formula
+    ):
+        expr.append(literal)
+        if field_name is None:
+            continue
+        if field_name not in FORMULA_VARIABLES:
+            raise ValueError(
+                f'Bad formula {formula!r}: unknown field {field_name!r}'
+            )
+        next_literal, next_field_name, _, _ = (
+            parsed_formula[index + 1]
+            if index + 1 < len(parsed_formula)
+            else ('', None, None, None)
+        )
+        if (
+            format_spec
+            or conversion
+            or literal[-1:] in _TOKEN_CHARS
+            or next_literal[:1] in _TOKEN_CHARS
+            or (not next_literal and next_field_name is not None)
+        ):
+            is_textual = True
+        expr.append(field_name)
+
+    if is_textual:
+        # substituted numbers are glued with the formula text,
+        # so it can be evaluated only after formatting
+        def _textual(
+            best_score_before_finish: float, best_score_no_deadline: float
+        ) -> float:
+            return _eval_formatted(
+                formula, best_score_before_finish, best_score_no_deadline
+            )
+
+        return _textual, lambda xs, ys: list(map(_textual, xs, ys))
+
+    try:
+        node = ast.parse(''.join(expr), mode='eval').body
+        scalar = _compile_node(node)
+        batch = _compile_batch_node(node)
+    except (SyntaxError, KeyError, TypeError, AttributeError) as exc:
+        raise ValueError(f'Bad formula {formula!r}: {exc!r}') from exc
+    return (
+        lambda before_finish, no_deadline: scalar(
+            (before_finish, no_deadline)
+        ),
+        lambda before_finish, no_deadline: batch(
+            (before_finish, no_deadline), len(before_finish)
+        ),
+    )
+
+
+def _is_number_node(node: ast.AST) -> bool:
+    # the same nodes as ast.Num in _eval
+    return (
+        isinstance(node, ast.Constant)
+        and isinstance(node.value, (int, float, complex))
+        and not isinstance(node.value, bool)
+    )
+
+
+def _compile_node(node: ast.AST) -> tp.Callable[[tuple[float, ...]], float]:
+    if _is_number_node(node):
+        value = node.value  # type: ignore
+        return lambda args: value
+    if isinstance(node, ast.Name) and node.id in FORMULA_VARIABLES:
+        index = FORMULA_VARIABLES.index(node.id)
+        return lambda args: args[index]
+    if isinstance(node, ast.BinOp):
+        operator = _allowed_operators[type(node.op)]
+        left, right = _compile_node(node.left), _compile_node(node.right)
+        return lambda args: operator(left(args), right(args))  # type: ignore
+    if isinstance(node, ast.UnaryOp):
+        operator = _allowed_operators[type(node.op)]
+        operand = _compile_node(node.operand)
+        return lambda args: operator(operand(args))  # type: ignore
+    if isinstance(node, ast.Call):
+        func = _allowed_funcs[node.func.id]  # type: ignore
+        func_args = [_compile_node(arg) for arg in node.args]
+        return lambda args: func(  # type: ignore
+            *[func_arg(args) for func_arg in func_args]
+        )
+    raise TypeError(node)
+
+
+def _compile_batch_node(
+    node: ast.AST,
+) -> tp.Callable[[tuple[list[float], ...], int], list[float]]:
+    if _is_number_node(node):
+        value = node.value  # type: ignore
+        return lambda columns, size: [value] * size
+    if isinstance(node, ast.Name) and node.id in FORMULA_VARIABLES:
+        index = FORMULA_VARIABLES.index(node.id)
+        return lambda columns, size: columns[index]
+    if isinstance(node, ast.BinOp):
+        operator = _allowed_operators[type(node.op)]
+        left = _compile_batch_node(node.left)
+        right = _compile_batch_node(node.right)
+        return lambda columns, size: list(
+            map(operator, left(columns, size), right(columns, size))
+        )
+    if isinstance(node, ast.UnaryOp):
+        operator = _allowed_operators[type(node.op)]
+        operand = _compile_batch_node(node.operand)
+        return lambda columns, size: list(
+            map(operator, operand(columns, size))
+        )
+    if isinstance(node, ast.Call):
+        func = _allowed_funcs[node.func.id]  # type: ignore
+        func_args = [_compile_batch_node(arg) for arg in node.args]
+        return lambda columns, size: list(
+            map(func, *[func_arg(columns, size) for func_arg in func_args])
+        )
+    raise TypeError(node)
@@ -1,6 +1,14 @@
+from .client import YandexClientManager, close_yandex_client, get_yandex_client
+from .governor import GovernorStats, RateGovernor, get_governor
 from .service import make_request_to_yandex_contest_api
 
 
 __all__ = [
     'make_request_to_yandex_contest_api',
+    'YandexClientManager',
+    'get_yandex_client',
+    'close_yandex_client',
+    'RateGovernor',
+    'GovernorStats',
+    'get_governor',
 ]
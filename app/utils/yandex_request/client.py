@@ -0,0 +1,75 @@
+import asyncio
+
+import httpx
+import loguru
+
+from app.config import get_settings
+
+
+class YandexClientManager:
+    """
+    A class that holds the process-wide HTTP client
+    for Yandex Contest API requests.
+
+    The client keeps a pool of keep-alive connections, so TCP and TLS
+    handshakes are paid once per connection, not once per request.
+    httpx clients are bound to the event loop they are used in,
+    so the client is recreated if the running loop has changed.
+    """
+
+    def __new__(cls) -> 'YandexClientManager':
+        if not hasattr(cls, 'instance'):
+            cls.instance = super(YandexClientManager, cls).__new__(cls)
+            cls.instance.client = None  # type: ignore
+            cls.instance.loop = None  # type: ignore
+        return cls.instance  # noqa
+
+    def get_client(self) -> httpx.AsyncClient:
+        loop = asyncio.get_running_loop()
+        if (
+            self.client is None  # type: ignore
+            or self.client.is_closed  # type: ignore
+            or self.loop is not loop  # type: ignore
+        ):
+            self.client = self._create_client()
+            self.loop = loop
+        return self.client  # type: ignore
+
+    async def close(self) -> None:
+        client, loop = self.client, self.loop  # type: ignore
+        self.client = None
+        self.loop = None
+        if client is None or client.is_closed:
+            return
+        if loop is not asyncio.get_running_loop():
+            # connections of the old loop can not be closed from this one
+            return
+        await client.aclose()
+
+    @staticmethod
+    def _create_client() -> httpx.AsyncClient:
+        settings = get_settings()
+        limits = httpx.Limits(
+            max_connections=settings.YANDEX_API_MAX_CONNECTIONS,
+            max_keepalive_connections=(
+                settings.YANDEX_API_MAX_KEEPALIVE_CONNECTIONS
+            ),
+            keepalive_expiry=settings.YANDEX_API_KEEPALIVE_EXPIRY,
+        )
+        try:
+            return httpx.AsyncClient(
+                limits=limits, http2=settings.YANDEX_API_HTTP2
+            )
+        except ImportError as exc:
+            loguru.logger.warning(
+                'HTTP/2 for Yandex Contest API is not available: {}', exc
+            )
+            return httpx.AsyncClient(limits=limits)
+
+
+def get_yandex_client() -> httpx.AsyncClient:
+    return YandexClientManager().get_client()
+
+
+async def close_yandex_client() -> None:
+    await YandexClientManager().close()
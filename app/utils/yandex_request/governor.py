@@ -0,0 +1,154 @@
+import asyncio
+import contextlib
+import dataclasses
+import email.utils
+import random
+import time
+import typing as tp
+
+from app.config import get_settings
+
+
+@dataclasses.dataclass
+class GovernorStats:
+    queue_depth: int = 0
+    in_flight: int = 0
+    acquired_count: int = 0
+    throttled_count: int = 0
+    total_wait_time: float = 0.0
+    max_wait_time: float = 0.0
+
+    def record_wait(self, wait_time: float) -> None:
+        self.acquired_count += 1
+        self.total_wait_time += wait_time
+        self.max_wait_time = max(self.max_wait_time, wait_time)
+
+
+class RateGovernor:
+    """
+    Client-side limiter for requests made with one API token.
+
+    Combines a token bucket (``rate`` requests per second with ``burst``
+    capacity) with a limit on concurrent requests. When the API asks to
+    slow down, ``pause`` blocks every request of the token until
+    the given delay is over.
+    """
+
+    def __init__(self, rate: float, burst: int, max_concurrency: int) -> None:
+        self.rate = rate
+        self.burst = max(burst, 1)
+        self.max_concurrency = max(max_concurrency, 1)
+        self.stats = GovernorStats()
+        self._tokens = float(self.burst)
+        self._updated_at = time.monotonic()
+        self._blocked_until = 0.0
+        self._loop: asyncio.AbstractEventLoop | None = None
+        self._semaphore: asyncio.Semaphore | None = None
+        self._lock: asyncio.Lock | None = None
+
+    @contextlib.asynccontextmanager
+    async def slot(self) -> tp.AsyncIterator[float]:
+        """
+        Waits for a free slot and yields the time spent in the queue.
+        """
+        semaphore, lock = self._bind_loop()
+        start = time.monotonic()
+        self.stats.queue_depth += 1
+        try:
+            await semaphore.acquire()
+            try:
+                async with lock:
+                    await self._take_token()
+            except BaseException:
+                semaphore.release()
+                raise
+        finally:
+            self.stats.queue_depth -= 1
+        wait_time = time.monotonic() - start
+        self.stats.record_wait(wait_time)
+        self.stats.in_flight += 1
+        try:
+            yield wait_time
+        finally:
+            self.stats.in_flight -= 1
+            semaphore.release()
+
+    def pause(self, delay: float) -> None:
+        self.stats.throttled_count += 1
+        self._blocked_until = max(
+            self._blocked_until, time.monotonic() + delay
+        )
+
+    async def _take_token(self) -> None:
+        while True:
+            now = time.monotonic()
+            if self._blocked_until > now:
+                await asyncio.sleep(self._blocked_until - now)
+                continue
+            if self.rate <= 0:
+                return
+            self._tokens = min(
+                float(self.burst),
+                self._tokens + (now - self._updated_at) * self.rate,
+            )
+            self._updated_at = now
+            if self._tokens >= 1:
+                self._tokens -= 1
+                return
+            await asyncio.sleep((1 - self._tokens) / self.rate)
+
+    def _bind_loop(self) -> tuple[asyncio.Semaphore, asyncio.Lock]:
+        # asyncio primitives can not be shared between event loops
+        loop = asyncio.get_running_loop()
+        if self._loop is not loop or self._semaphore is None:
+            self._loop = loop
+            self._semaphore = asyncio.Semaphore(self.max_concurrency)
+            self._lock = asyncio.Lock()
+            self.stats.in_flight = 0
+            self.stats.queue_depth = 0
+        return self._semaphore, self._lock  # type: ignore
+
+
+_governors: dict[str, RateGovernor] = {}
+
+
+def get_governor(token: str) -> RateGovernor:
+    if token not in _governors:
+        settings = get_settings()
+        _governors[token] = RateGovernor(
+            rate=settings.YANDEX_API_RATE_LIMIT,
+            burst=settings.YANDEX_API_RATE_BURST,
+            max_concurrency=settings.YANDEX_API_MAX_CONCURRENCY,
+        )
+    return _governors[token]
+
+
+def get_backoff_delay(attempt: int) -> float:
+    """
+    Exponential backoff with full jitter for the given attempt (from 0).
+    """
+    settings = get_settings()
+    return random.uniform(  # nosec
+        0,
+        min(
+            settings.YANDEX_API_BACKOFF_MAX,
+            settings.YANDEX_API_BACKOFF_BASE * 2**attempt,
+        ),
+    )
+
+
+def parse_retry_after(value: str | None) -> float | None:
+    """
+    Parses Retry-After header given either in seconds or as HTTP date.
+    """
+    if not value:
+        return None
+    try:
+        return max(float(value), 0.0)
+    except ValueError:
+        pass
+    try:
+        retry_at = email.utils.parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    return max(retry_at.timestamp() - time.time(), 0.0)
@@ -1,13 +1,23 @@
 # pylint: disable=duplicate-code,too-many-statements
 
+import asyncio
 import typing
 
 import httpx
 import loguru
-from httpx import AsyncClient, Response
+from httpx import Response
 
 from app.config import get_settings
 
+from .client import get_yandex_client
+from .governor import get_backoff_delay, get_governor, parse_retry_after
+
+
+# errors raised before the request is sent, so it can be retried
+# even if it is not idempotent
+NOT_SENT_ERRORS = (httpx.ConnectError, httpx.ConnectTimeout, httpx.PoolTimeout)
+RETRY_ERRORS = (httpx.TimeoutException, httpx.ReadError, httpx.ConnectError)
+
 
 async def make_request_to_yandex_contest_api(  # pylint: disable=too-many-arguments  # noqa: C901
     endpoint: str,
@@ -16,50 +26,94 @@ async def make_request_to_yandex_contest_api(  # pylint: disable=too-many-argume
     data: dict[str, typing.Any] | None = None,
     timeout: int | None = None,
     retry_count: int = 1,
+    status_retry_count: int | None = None,
+    idempotent: bool | None = None,
 ) -> Response:
+    """
+    :param retry_count: Attempts of request on timeouts and
+        connection errors.
+    :param status_retry_count: Retries on 429 and 5xx responses,
+        YANDEX_API_RETRY_COUNT by default.
+    :param idempotent: Request may be repeated if it was sent but
+        failed, True for GET by default. Otherwise the request is
+        retried only on 429 and on errors raised before it was sent.
+    """
     settings = get_settings()
-    while retry_count > 0:
-        async with AsyncClient() as client:
-            logger.info(
-                'Making request to Yandex Contest API: '
-                '{} {} (timeout: {}, data: {})',
-                method,
-                f'{settings.YANDEX_CONTEST_API_URL}{endpoint}',
-                timeout,
-                data,
+    client = get_yandex_client()
+    headers = {
+        'Authorization': f'OAuth {settings.YANDEX_API_KEY}',
+        'Content-Type': 'application/json',
+    }
+    if method not in ('GET', 'POST'):
+        raise ValueError('Invalid method')
+    # GET endpoints are passed without the leading slash
+    url = (
+        f'{settings.YANDEX_CONTEST_API_URL}/{endpoint}'
+        if method == 'GET'
+        else f'{settings.YANDEX_CONTEST_API_URL}{endpoint}'
+    )
+    governor = get_governor(settings.YANDEX_API_KEY)
+    if status_retry_count is None:
+        status_retry_count = settings.YANDEX_API_RETRY_COUNT
+    if idempotent is None:
+        idempotent = method == 'GET'
+    retry_errors = RETRY_ERRORS if idempotent else NOT_SENT_ERRORS
+    attempt = 0
+    response: Response | None
+    while True:
+        logger.info(
+            'Making request to Yandex Contest API: '
+            '{} {} (timeout: {}, data: {})',
+            method,
+            f'{settings.YANDEX_CONTEST_API_URL}{endpoint}',
+            timeout,
+            data,
+        )
+        async with governor.slot() as wait_time:
+            try:
+                response = await client.request(
+                    method,
+                    url,
+                    json=data,
+                    headers=headers,
+                    timeout=timeout,
+                )
+            except retry_errors as exc:
+                logger.warning(
+                    'Request to Yandex Contest API failed: {}', repr(exc)
+                )
+                retry_count -= 1
+                if retry_count <= 0:
+                    if isinstance(exc, httpx.ConnectError):
+                        raise
+                    raise httpx.ReadTimeout(
+                        'Request to Yandex Contest API timed out'
+                    ) from exc
+                response = None
+        if response is None:
+            delay = get_backoff_delay(attempt)
+        elif (
+            response.status_code == 429
+            or response.status_code >= 500
+            and idempotent
+        ) and status_retry_count > 0:
+            status_retry_count -= 1
+            retry_after = parse_retry_after(
+                response.headers.get('Retry-After')
             )
-            client.headers.update(
-                {
-                    'Authorization': f'OAuth {settings.YANDEX_API_KEY}',
-                    'Content-Type': 'application/json',
-                }
+            delay = max(get_backoff_delay(attempt), retry_after or 0.0)
+            if response.status_code == 429 or retry_after is not None:
+                # the limit is shared by all requests made with the token
+                governor.pause(delay)
+            logger.warning(
+                'Yandex Contest API responded with {}, retrying in {:.2f}s',
+                response.status_code,
+                delay,
             )
-            if method == 'GET':
-                try:
-                    response = await client.get(
-                        f'{settings.YANDEX_CONTEST_API_URL}/{endpoint}',
-                        timeout=timeout,
-                    )
-                except (httpx.ReadTimeout, httpx.ReadError):
-                    logger.warning('Request to Yandex Contest API timed out')
-                    retry_count -= 1
-                    continue
-            elif method == 'POST':
-                try:
-                    response = await client.post(
-                        f'{settings.YANDEX_CONTEST_API_URL}{endpoint}',
-                        json=data,
-                        timeout=timeout,
-                    )
-                except (httpx.ReadTimeout, httpx.ReadError):
-                    logger.warning('Request to Yandex Contest API timed out')
-                    retry_count -= 1
-                    continue
-            else:
-                raise ValueError('Invalid method')
+        else:
             break
-    if retry_count == 0:
-        raise httpx.ReadTimeout('Request to Yandex Contest API timed out')
+        attempt += 1
+        await asyncio.sleep(delay)
     response_data = '*failed to parse response data*'
     try:
         response_data = response.json()
@@ -87,6 +141,8 @@ async def make_request_to_yandex_contest_api(  # pylint: disable=too-many-argume
         method,
         f'{settings.YANDEX_CONTEST_API_URL}{endpoint}',
         body=response_data,
+        queue_wait_time=wait_time,
+        queue_depth=governor.stats.queue_depth,
     )
 
     return response
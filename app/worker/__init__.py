@@ -1,8 +1,11 @@
 # Code generated automatically.
 
 from ._creator import async_to_sync, get_celery, task_wrapper
+from .dump_course_results import task as dump_course_results
 from .get_assistant_answer import task as get_assistant_answer
 from .get_results_by_course import task as get_results_by_course
+from .send_results_report import task as send_results_report
+from .sync_contest import task as sync_contest
 
 
 celery_broker = get_celery()
@@ -16,9 +19,24 @@ get_results_by_course_task = celery_broker.task(
     name='get_results_by_course', bind=True
 )(async_to_sync(task_wrapper(get_results_by_course)))
 
+sync_contest_task = celery_broker.task(name='sync_contest', bind=True)(
+    async_to_sync(task_wrapper(sync_contest))
+)
+
+dump_course_results_task = celery_broker.task(
+    name='dump_course_results', bind=True
+)(async_to_sync(task_wrapper(dump_course_results)))
+
+send_results_report_task = celery_broker.task(
+    name='send_results_report', bind=True
+)(async_to_sync(task_wrapper(send_results_report)))
+
 
 __all__ = [
     'celery_broker',
     'get_assistant_answer_task',
     'get_results_by_course_task',
+    'sync_contest_task',
+    'dump_course_results_task',
+    'send_results_report_task',
 ]
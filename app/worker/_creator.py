@@ -6,11 +6,13 @@ import traceback
 
 import celery
 import loguru
+from celery import signals
 
 from app import config, logger_config
 from app.bot_helper import send
 from app.database.connection import SessionManager
 from app.logger_config import custom_loki_logger_handler
+from app.utils import yandex_request
 
 
 def get_celery() -> celery.Celery:
@@ -27,6 +29,13 @@ def get_celery() -> celery.Celery:
     return _celery
 
 
+@signals.worker_process_shutdown.connect
+def close_clients(*_, **__):  # type: ignore
+    event_loop = asyncio.get_event_loop()
+    event_loop.run_until_complete(yandex_request.close_yandex_client())
+    event_loop.run_until_complete(SessionManager().dispose())
+
+
 def async_to_sync(func):  # type: ignore
     @functools.wraps(func)
     def wrapped(*args, **kwargs):  # type: ignore
@@ -38,7 +47,7 @@ def async_to_sync(func):  # type: ignore
 
 def task_wrapper(func):  # type: ignore
     @functools.wraps(func)
-    async def _wrapped(task, parent_id: str, *args, **kwargs):  # type: ignore
+    async def _wrapped(task, *args, parent_id: str, **kwargs):  # type: ignore
         # settings = config.get_settings()
         # log_file_name = (
         #         settings.LOGGING_FILE_DIR
@@ -73,7 +82,7 @@ def task_wrapper(func):  # type: ignore
 
         kwargs.update(base_logger=base_logger)
         try:
-            result = await func(self=task, *args, **kwargs)
+            result = await func(task, *args, **kwargs)
         except Exception as exc:  # pylint: disable=broad-except
             base_logger.exception(
                 'Task finished. Error in task: {}',
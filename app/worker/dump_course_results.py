@@ -0,0 +1,51 @@
+from uuid import UUID
+
+import celery
+import loguru
+
+from app.database.connection import SessionManager
+from app.utils import course as course_utils
+
+
+async def task(
+    self: celery.Task,  # pylint: disable=unused-argument
+    course_id: str,
+    full_recompute: bool,
+    base_logger: 'loguru.Logger',
+) -> dict[str, str] | None:
+    """
+    Update results of course after its contests are synced.
+
+    Errors are not raised, so the report of other courses
+    is sent anyway.
+
+    :return: Name and content of results csv file
+    """
+    # scheduler jobs import endpoints, which import worker
+    # pylint: disable-next=import-outside-toplevel
+    from app.scheduler.update_results import (
+        get_csv,
+        get_results_filename,
+        update_and_get_course_results,
+    )
+
+    async with SessionManager().create_async_session() as session:
+        course = await course_utils.get_course_by_id(session, UUID(course_id))
+        course_levels = await course_utils.get_course_levels(
+            session, course.id
+        )
+    course_results = await update_and_get_course_results(
+        course,
+        course_levels,
+        base_logger=base_logger.bind(
+            course={'id': course.id, 'short_name': course.short_name}
+        ),
+        full_recompute=full_recompute,
+        sync_contests=False,
+    )
+    if course_results is None:
+        return None
+    return {
+        'filename': get_results_filename(course),
+        'content': get_csv(course_results),
+    }
@@ -1,6 +1,13 @@
+import asyncio
+import uuid
+
 import celery
 import loguru
+from celery import states
+from celery.backends.base import Backend
+from starlette.concurrency import run_in_threadpool
 
+from app.config import get_settings
 from app.database.connection import SessionManager
 from app.schemas import StudentResults
 from app.utils import course as course_utils
@@ -15,9 +22,21 @@ async def task(
     student_login: str,
     base_logger: 'loguru.Logger',
 ) -> list[str]:
-    logger = base_logger
+    return await get_results_messages(
+        course_short_name, student_login, logger=base_logger
+    )
+
+
+async def get_results_messages(
+    course_short_name: str,
+    student_login: str,
+    logger: 'loguru.Logger',
+) -> list[str]:
+    """
+    Get messages with results of student on course for the bot.
+    """
     headers = {'log-contest-login': student_login}
-    async with SessionManager().create_async_session() as session:
+    async with SessionManager().create_read_only_async_session() as session:
         student = await student_utils.get_student_or_raise(
             session, student_login, headers=headers
         )
@@ -33,7 +52,7 @@ async def task(
                 detail='Course not found',
             )
             return [text]
-        student_course = await course_utils.get_student_course(
+        student_course = await results_utils.get_student_course_with_snapshot(
             session, student.id, course.id
         )
         if student_course is None:
@@ -42,34 +61,13 @@ async def task(
                 detail='Student not registered on course',
             )
             return [text]
-        levels_by_course = await course_utils.get_course_levels(
-            session, course.id
-        )
-        student_course_levels = [
-            await course_utils.get_or_create_student_course_level(
-                session, student.id, course.id, course_level.id
-            )
-            for course_level in levels_by_course
-        ]
-        student_course_contest_data = (
-            await course_utils.get_student_course_contests_data(
-                session, course.id, student.id
-            )
+        course_results = await results_utils.load_student_course_results(
+            session, student, course, student_course, logger=logger
         )
 
     result = _get_student_results_messages(
         results=StudentResults(
-            courses=[
-                await results_utils.get_student_course_results(
-                    student,
-                    course,
-                    levels_by_course,
-                    student_course,
-                    student_course_levels,
-                    student_course_contest_data,
-                    logger=logger,
-                )
-            ],
+            courses=[course_results],
             fio=student.fio,
             department=department.name,
         ),
@@ -78,6 +76,51 @@ async def task(
     return result
 
 
+async def get_results_messages_inline(
+    course_short_name: str,
+    student_login: str,
+    backend: Backend,
+    logger: 'loguru.Logger',
+) -> tuple[str, list[str]] | None:
+    """
+    Get messages with results in RESULTS_BY_COURSE_TIME_BUDGET.
+
+    Messages are stored as result of a new task, so they can be polled
+    by /task/result like results got by celery task.
+
+    :return: Id of the task and messages, None if messages
+        are not got in time or on error
+    """
+    time_budget = get_settings().RESULTS_BY_COURSE_TIME_BUDGET
+    if time_budget <= 0:
+        return None
+    try:
+        messages = await asyncio.wait_for(
+            get_results_messages(
+                course_short_name, student_login, logger=logger
+            ),
+            timeout=time_budget,
+        )
+    except asyncio.TimeoutError:
+        logger.info(
+            'Results are not got in {}s, sending task to celery',
+            time_budget,
+        )
+        return None
+    except Exception as exc:  # pylint: disable=broad-except
+        logger.warning(
+            'Error while getting results, sending task to celery: {}',
+            exc,
+        )
+        return None
+    task_id = str(uuid.uuid4())
+    # redis client of celery backend is blocking
+    await run_in_threadpool(
+        backend.store_result, task_id, messages, states.SUCCESS
+    )
+    return task_id, messages
+
+
 def _get_error_message_404(
     student_login: str,
     detail: str,
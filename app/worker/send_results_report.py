@@ -0,0 +1,26 @@
+import celery
+import loguru
+
+
+async def task(
+    self: celery.Task,  # pylint: disable=unused-argument
+    results_files: list[dict[str, str] | None],
+    base_logger: 'loguru.Logger',
+) -> list[str]:
+    """
+    Send results csv files of courses, dumped by workers.
+    """
+    # scheduler jobs import endpoints, which import worker
+    # pylint: disable-next=import-outside-toplevel
+    from app.scheduler.update_results import send_results_report
+
+    filenames = []
+    for results_file in results_files:
+        if results_file is None:
+            continue
+        with open(results_file['filename'], 'w', encoding='utf-8') as f:
+            f.write(results_file['content'])
+        filenames.append(results_file['filename'])
+    base_logger.info('Sending {} results files', len(filenames))
+    await send_results_report(filenames, base_logger)
+    return filenames
@@ -0,0 +1,84 @@
+import asyncio
+import contextlib
+import traceback
+from uuid import UUID
+
+import celery
+import loguru
+
+from app.bot_helper import send
+from app.database.connection import SessionManager
+from app.utils import contest as contest_utils
+from app.utils import course as course_utils
+from app.utils import student as student_utils
+
+
+async def task(
+    self: celery.Task,
+    course_id: str,
+    contest_id: str,
+    base_logger: 'loguru.Logger',
+) -> bool:
+    """
+    Sync new submissions of contest, claimed by the scheduler.
+
+    The sync is skipped if the claim has expired while the task was
+    queued, and the claim is extended while the sync is running.
+    Errors are not raised, so results of the course
+    are dumped after the sync anyway.
+    """
+    # scheduler jobs import endpoints, which import worker
+    # pylint: disable-next=import-outside-toplevel
+    from app.scheduler.update_results import sync_contest
+
+    keep_claim: asyncio.Task[None] | None = None
+    try:
+        if not await contest_utils.extend_contest_sync(
+            UUID(contest_id), self.request.id
+        ):
+            base_logger.warning(
+                'Contest {} sync is not claimed by the task, skipping',
+                contest_id,
+            )
+            return False
+        keep_claim = asyncio.create_task(
+            contest_utils.keep_contest_sync(
+                UUID(contest_id), self.request.id, logger=base_logger
+            )
+        )
+        async with SessionManager().create_async_session() as session:
+            course = await course_utils.get_course_by_id(
+                session, UUID(course_id)
+            )
+            contest = await contest_utils.get_contest_by_id(
+                session, UUID(contest_id)
+            )
+            students_sc_departments = (
+                await student_utils.get_students_by_course_with_department(
+                    session, course.id
+                )
+            )
+        logger = base_logger.bind(
+            course={'id': course.id, 'short_name': course.short_name}
+        )
+        return await sync_contest(
+            course, contest, students_sc_departments, base_logger=logger
+        )
+    except Exception as exc:  # pylint: disable=broad-except
+        base_logger.exception(
+            'Error while syncing contest {}: {}', contest_id, exc
+        )
+        await send.send_traceback_message_safe(
+            logger=base_logger,
+            message=f'Error while syncing contest {contest_id}: {exc}',
+            code=traceback.format_exc(),
+        )
+        return False
+    finally:
+        if keep_claim is not None:
+            keep_claim.cancel()
+            with contextlib.suppress(asyncio.CancelledError):
+                await keep_claim
+        await contest_utils.release_contest_sync(
+            UUID(contest_id), self.request.id
+        )
@@ -41,3 +41,40 @@ class TestPingAuthHandler:
         assert response.status_code == status.HTTP_200_OK, response.json()
         assert response.json().get('detail')
         assert response.json()['detail'] == created_user.username
+
+
+class TestDatabasePoolHandler:
+    @staticmethod
+    def get_url() -> str:
+        settings = get_settings()
+        return f'{settings.PATH_PREFIX}{prefix}/health_check/database_pool'
+
+    async def test_unauthorized(self, client):
+        response = await client.get(url=self.get_url())
+        assert response.status_code == status.HTTP_401_UNAUTHORIZED
+
+    async def test_database_pool(self, client, user_headers):
+        response = await client.get(url=self.get_url(), headers=user_headers)
+        assert response.status_code == status.HTTP_200_OK, response.json()
+        # one engine is shared by all sessions of the loop
+        assert response.json()['engines'] == 1
+        assert response.json()['checked_out'] >= 1
+
+
+class TestYandexApiGovernorHandler:
+    @staticmethod
+    def get_url() -> str:
+        settings = get_settings()
+        return (
+            f'{settings.PATH_PREFIX}{prefix}/health_check/yandex_api_governor'
+        )
+
+    async def test_unauthorized(self, client):
+        response = await client.get(url=self.get_url())
+        assert response.status_code == status.HTTP_401_UNAUTHORIZED
+
+    async def test_yandex_api_governor(self, client, user_headers):
+        response = await client.get(url=self.get_url(), headers=user_headers)
+        assert response.status_code == status.HTTP_200_OK, response.json()
+        assert response.json()['queue_depth'] == 0
+        assert response.json()['in_flight'] == 0
@@ -0,0 +1,194 @@
+import json
+
+import pytest
+from celery import states
+from fastapi import status
+
+from app import worker
+from app.config import get_settings, reload_settings
+from app.endpoints.v1 import prefix
+from app.schemas.results.batch import BATCH_MAX_SIZE
+
+
+pytestmark = pytest.mark.asyncio
+
+
+@pytest.mark.usefixtures('student_department', 'student_course')
+class TestGetAllResultsHandler:
+    @staticmethod
+    def get_url(student_login: str) -> str:
+        settings = get_settings()
+        return f'{settings.PATH_PREFIX}{prefix}/results/all/{student_login}'
+
+    async def test_unauthorized(self, client, created_student):
+        response = await client.get(
+            url=self.get_url(created_student.contest_login)
+        )
+        assert response.status_code == status.HTTP_401_UNAUTHORIZED
+
+    async def test_get_all_results(
+        self, client, user_headers, created_student, created_course
+    ):
+        response = await client.get(
+            url=self.get_url(created_student.contest_login),
+            headers=user_headers,
+        )
+        assert response.status_code == status.HTTP_200_OK, response.json()
+        assert response.json()['fio'] == created_student.fio
+        assert [course['name'] for course in response.json()['courses']] == [
+            created_course.name
+        ]
+
+
+@pytest.mark.usefixtures('student_department', 'student_course')
+class TestGetResultsByCourseHandler:
+    @staticmethod
+    def get_url(course_short_name: str) -> str:
+        settings = get_settings()
+        return (
+            f'{settings.PATH_PREFIX}{prefix}/results/by-course/'
+            f'{course_short_name}'
+        )
+
+    async def test_inline(  # pylint: disable=too-many-arguments
+        self, client, user_headers, created_student, created_course, mocker
+    ):
+        store_mock = mocker.patch.object(
+            worker.celery_broker.backend, 'store_result'
+        )
+        delay_mock = mocker.patch.object(
+            worker.get_results_by_course_task, 'delay'
+        )
+
+        response = await client.get(
+            url=self.get_url(created_course.short_name),
+            headers=user_headers
+            | {'log-contest-login': created_student.contest_login},
+        )
+
+        assert response.status_code == status.HTTP_200_OK, response.json()
+        assert response.json()['ready']
+        assert f'Курс: {created_course.name}' in response.json()['messages'][1]
+        delay_mock.assert_not_called()
+        # result of inline path can be polled like result of task
+        store_mock.assert_called_once_with(
+            response.json()['task_id'],
+            response.json()['messages'],
+            states.SUCCESS,
+        )
+
+    async def test_celery(  # pylint: disable=too-many-arguments
+        self,
+        client,
+        user_headers,
+        created_student,
+        created_course,
+        mocker,
+        monkeypatch,
+    ):
+        monkeypatch.setenv('RESULTS_BY_COURSE_TIME_BUDGET', '0')
+        reload_settings()
+        delay_mock = mocker.patch.object(
+            worker.get_results_by_course_task, 'delay'
+        )
+        delay_mock.return_value.id = 'task_id'
+
+        response = await client.get(
+            url=self.get_url(created_course.short_name),
+            headers=user_headers
+            | {'log-contest-login': created_student.contest_login},
+        )
+
+        assert response.status_code == status.HTTP_200_OK, response.json()
+        assert response.json() == {
+            'task_id': 'task_id',
+            'ready': False,
+            'messages': None,
+        }
+        assert delay_mock.call_args.kwargs['student_login'] == (
+            created_student.contest_login
+        )
+
+
+@pytest.mark.usefixtures('student_department', 'student_course')
+class TestGetBatchResultsHandler:
+    @staticmethod
+    def get_url() -> str:
+        settings = get_settings()
+        return f'{settings.PATH_PREFIX}{prefix}/results/batch'
+
+    async def test_unauthorized(self, client):
+        response = await client.post(
+            url=self.get_url(), json={'contest_logins': ['login']}
+        )
+        assert response.status_code == status.HTTP_401_UNAUTHORIZED
+
+    @pytest.mark.parametrize(
+        'headers, threshold, stream',
+        [
+            ({}, 100, False),
+            ({'Accept': 'application/x-ndjson'}, 100, True),
+            ({}, 1, True),
+        ],
+    )
+    async def test_batch(  # pylint: disable=too-many-arguments
+        self,
+        client,
+        user_headers,
+        created_student,
+        created_course,
+        monkeypatch,
+        headers,
+        threshold,
+        stream,
+    ):
+        monkeypatch.setenv('RESULTS_BATCH_STREAM_THRESHOLD', str(threshold))
+        reload_settings()
+        response = await client.post(
+            url=self.get_url(),
+            json={
+                'contest_logins': [
+                    created_student.contest_login,
+                    'unknown',
+                    created_student.contest_login,
+                ],
+                'course_short_name': created_course.short_name,
+            },
+            headers=user_headers | headers,
+        )
+
+        assert response.status_code == status.HTTP_200_OK, response.text
+        if stream:
+            assert response.headers['content-type'] == 'application/x-ndjson'
+            items = [json.loads(line) for line in response.text.splitlines()]
+        else:
+            assert response.headers['content-type'] == 'application/json'
+            items = response.json()
+        assert [item['contest_login'] for item in items] == [
+            created_student.contest_login,
+            'unknown',
+        ]
+        assert [
+            course['name'] for course in items[0]['results']['courses']
+        ] == [created_course.name]
+        assert items[1]['results'] is None
+
+    async def test_too_many_students(self, client, user_headers):
+        response = await client.post(
+            url=self.get_url(),
+            json={
+                'contest_logins': [
+                    f'login{i}' for i in range(BATCH_MAX_SIZE + 1)
+                ]
+            },
+            headers=user_headers,
+        )
+        assert response.status_code == status.HTTP_422_UNPROCESSABLE_ENTITY
+
+    async def test_course_not_found(self, client, user_headers):
+        response = await client.post(
+            url=self.get_url(),
+            json={'contest_logins': ['login'], 'course_short_name': 'none'},
+            headers=user_headers,
+        )
+        assert response.status_code == status.HTTP_404_NOT_FOUND
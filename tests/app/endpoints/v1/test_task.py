@@ -0,0 +1,89 @@
+import itertools
+
+import pytest
+from fastapi import status
+
+from app.config import get_settings, reload_settings
+from app.endpoints.v1 import prefix
+
+
+pytestmark = pytest.mark.asyncio
+
+
+@pytest.fixture
+def mock_wait_task_result(mocker):
+    result = mocker.Mock(result=['message'])
+    return mocker.patch(
+        'app.utils.celery_task.wait_task_result',
+        return_value=(result, 'SUCCESS'),
+    )
+
+
+class TestGetTaskResultHandler:
+    @staticmethod
+    def get_url() -> str:
+        settings = get_settings()
+        return f'{settings.PATH_PREFIX}{prefix}/task/result'
+
+    async def test_unauthorized(self, client):
+        response = await client.get(
+            url=self.get_url(), params={'task_id': 'task_id'}
+        )
+        assert response.status_code == status.HTTP_401_UNAUTHORIZED
+
+    @pytest.mark.parametrize(
+        'params, timeout',
+        [
+            ({}, 0),
+            ({'wait': 10}, 10),
+            ({'wait': 1000}, 60),
+        ],
+    )
+    async def test_wait(  # pylint: disable=too-many-arguments
+        self, client, user_headers, mock_wait_task_result, params, timeout
+    ):
+        response = await client.get(
+            url=self.get_url(),
+            params={'task_id': 'task_id'} | params,
+            headers=user_headers,
+        )
+
+        assert response.status_code == status.HTTP_200_OK, response.json()
+        assert response.json() == {'ready': True, 'messages': ['message']}
+        mock_wait_task_result.assert_called_once_with('task_id', timeout)
+
+
+class TestStreamTaskResultHandler:
+    @staticmethod
+    def get_url() -> str:
+        settings = get_settings()
+        return f'{settings.PATH_PREFIX}{prefix}/task/result/stream'
+
+    async def test_stream(
+        self, client, user_headers, mock_wait_task_result, monkeypatch
+    ):
+        monkeypatch.setenv('TASK_RESULT_MAX_WAIT', '40')
+        reload_settings()
+        result, _ = mock_wait_task_result.return_value
+        mock_wait_task_result.side_effect = itertools.chain(
+            [(result, 'PENDING'), (result, 'STARTED')],
+            itertools.repeat((result, 'SUCCESS')),
+        )
+
+        response = await client.get(
+            url=self.get_url(),
+            params={'task_id': 'task_id'},
+            headers=user_headers,
+        )
+
+        assert response.status_code == status.HTTP_200_OK
+        assert response.headers['content-type'].startswith('text/event-stream')
+        assert response.text == (
+            ': keep-alive\n\n'
+            ': keep-alive\n\n'
+            'event: result\n'
+            'data: {"ready": true, "messages": ["message"]}\n\n'
+        )
+        assert [
+            call.args[1] for call in mock_wait_task_result.call_args_list
+        ] == [15, 15, 10]
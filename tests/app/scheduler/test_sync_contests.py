@@ -0,0 +1,57 @@
+import celery
+import loguru
+import pytest
+
+from app.config import reload_settings
+from app.scheduler.sync_contests import job
+from app.utils import contest as contest_utils
+
+
+pytestmark = pytest.mark.asyncio
+
+
+@pytest.mark.usefixtures('migrated_postgres', 'mock_send_or_edit')
+class TestJob:
+    async def test_run(self, mock_bot):
+        # arrange
+
+        # act
+        await job(base_logger=loguru.logger)
+
+        # assert
+        mock_bot.send_message.assert_not_called()
+
+    @pytest.mark.usefixtures('student_course')
+    async def test_contest_is_locked(self, created_contest, mock_bot, mocker):
+        # arrange
+        sync_mock = mocker.patch(
+            'app.utils.contest.get_new_submissions',
+            side_effect=AssertionError,
+        )
+
+        # act
+        async with contest_utils.get_sync_lock(created_contest.id):
+            await job(base_logger=loguru.logger)
+
+        # assert
+        sync_mock.assert_not_called()
+        mock_bot.send_message.assert_not_called()
+
+    @pytest.mark.usefixtures('created_contest')
+    async def test_fan_out(self, mock_bot, monkeypatch, mocker):
+        # arrange
+        monkeypatch.setenv('UPDATE_RESULTS_FAN_OUT', 'true')
+        reload_settings()
+        mocker.patch('app.utils.contest.claim_contest_sync', return_value=True)
+        apply_mock = mocker.patch.object(
+            celery.Signature, 'apply_async', autospec=True
+        )
+
+        # act
+        await job(base_logger=loguru.logger)
+
+        # assert
+        mock_bot.send_message.assert_not_called()
+        [signature] = [call.args[0] for call in apply_mock.call_args_list]
+        assert signature.task == 'sync_contest'
+        assert signature.options['task_id']
@@ -1,13 +1,27 @@
 # pylint: disable=too-many-lines,duplicate-code
 import datetime
+import random
+import typing as tp
 
+import celery
 import loguru
 import pytest
+from sqlalchemy import delete, select, update
 
-from app.scheduler.update_results import job
+from app.config import reload_settings
+from app.database import models
+from app.scheduler.update_results import (
+    check_and_update_no_verdict_submissions,
+    get_course_results,
+    get_last_updated_run_id,
+    job,
+    process_submissions,
+    update_course_results,
+)
 from app.schemas import contest as contest_schemas
 from app.utils import contest as contest_utils
 from app.utils import course as course_utils
+from app.utils import results as results_utils
 from app.utils import submission as submission_utils
 from app.utils import task as task_utils
 from tests import factory_lib, utils
@@ -27,6 +41,79 @@ class TestJob:
         # assert
         mock_bot.send_message.assert_not_called()
 
+    @pytest.mark.usefixtures('student_department', 'student_contest')
+    async def test_concurrency(  # pylint: disable=too-many-arguments
+        self,
+        created_contest,
+        mock_make_request_to_yandex_contest_v2,
+        mock_bot,
+        monkeypatch,
+        mocker,
+    ):
+        # arrange
+        monkeypatch.setenv('UPDATE_RESULTS_CONCURRENCY', '4')
+        reload_settings()
+        mock_make_request_to_yandex_contest_v2(
+            {
+                rf'^contests\/{created_contest.yandex_contest_id}\/'
+                r'submissions\?page=1&pageSize=100$': {
+                    'json': {'count': 0, 'submissions': []},
+                },
+            }
+        )
+        send_results_mock = mocker.patch('app.bot_helper.send.send_results')
+
+        # act
+        await job(base_logger=loguru.logger)
+
+        # assert
+        mock_bot.send_message.assert_not_called()
+        [filenames] = send_results_mock.call_args.args
+        assert len(filenames) == 1
+
+    @pytest.mark.usefixtures('created_contest')
+    @pytest.mark.parametrize(
+        'claimed,header',
+        [
+            pytest.param(
+                True, ['sync_contest', 'dump_course_results'], id='claimed'
+            ),
+            pytest.param(False, ['dump_course_results'], id='not_claimed'),
+        ],
+    )
+    async def test_fan_out(  # pylint: disable=too-many-arguments
+        self, mock_bot, monkeypatch, mocker, claimed, header
+    ):
+        # arrange
+        monkeypatch.setenv('UPDATE_RESULTS_FAN_OUT', 'true')
+        reload_settings()
+        claim_mock = mocker.patch(
+            'app.utils.contest.claim_contest_sync', return_value=claimed
+        )
+        chord_mock = mocker.patch.object(
+            celery.canvas._chord,  # pylint: disable=protected-access
+            'apply_async',
+            autospec=True,
+        )
+
+        # act
+        await job(base_logger=loguru.logger, full_recompute=False)
+
+        # assert
+        mock_bot.send_message.assert_not_called()
+        claim_mock.assert_called_once()
+        chord_mock.assert_called_once()
+        sent_chord, _, chord_kwargs = chord_mock.call_args.args
+        [course_signature] = sent_chord.tasks
+        assert [
+            signature.task
+            for signature in getattr(
+                course_signature, 'tasks', [course_signature]
+            )
+        ] == header
+        assert not course_signature.kwargs.get('full_recompute')
+        assert chord_kwargs['body'].task == 'send_results_report'
+
     @pytest.mark.usefixtures('student_department')
     async def test_ok(  # pylint: disable=too-many-arguments,unused-argument,too-many-statements  # TODO
         self,
@@ -104,6 +191,15 @@ class TestJob:
                     ],
                 },
                 rf'^contests\/{created_contest.yandex_contest_id}\/'
+                rf'participants$': {
+                    'json': [
+                        {
+                            'id': '12345',
+                            'login': created_student.contest_login,
+                        }
+                    ]
+                },
+                rf'^contests\/{created_contest.yandex_contest_id}\/'
                 rf'participants\?login={created_student.contest_login}$': {
                     'json': [
                         {
@@ -577,8 +673,9 @@ class TestJob:
                         },
                     },
                     rf'^contests\/{contest_base.yandex_contest_id}\/'
-                    rf'submissions\/multiple\?runIds='
-                    rf'{task_base_student_1_submission.run_id}$': {
+                    rf'submissions\/multiple\?'
+                    rf'runIds={task_base_student_1_submission.run_id}&'
+                    rf'runIds={task_base_student_1_submission_2.run_id}$': {
                         'json': [
                             {
                                 'runId': task_base_student_1_submission.run_id,
@@ -595,12 +692,6 @@ class TestJob:
                                 ).isoformat(),
                                 'finalScore': '',
                             },
-                        ],
-                    },
-                    rf'^contests\/{contest_base.yandex_contest_id}\/'
-                    rf'submissions\/multiple\?runIds='
-                    rf'{task_base_student_1_submission_2.run_id}$': {
-                        'json': [
                             {
                                 'runId': task_base_student_1_submission_2.run_id,  # pylint: disable=line-too-long
                                 'authorId': task_base_student_1_submission_2.author_id,  # pylint: disable=line-too-long
@@ -694,6 +785,43 @@ class TestJob:
                         ],
                     },
                     rf'^contests\/{contest_base.yandex_contest_id}\/'
+                    rf'participants$': {
+                        'json': [
+                            {
+                                'id': str(
+                                    task_base_student_1_submission.author_id
+                                ),
+                                'login': student_1.contest_login,
+                            },
+                            {
+                                'id': '12345',
+                                'login': student_2.contest_login,
+                            },
+                        ],
+                    },
+                    rf'^contests\/{contest_early_final.yandex_contest_id}\/'
+                    rf'participants$': {
+                        'json': [
+                            {
+                                'id': '64876',
+                                'login': student_1.contest_login,
+                            },
+                        ],
+                    },
+                    rf'^contests\/{contest_usual_final.yandex_contest_id}\/'
+                    rf'participants$': {
+                        'json': [
+                            {
+                                'id': '32332323',
+                                'login': student_1.contest_login,
+                            },
+                            {
+                                'id': '1234567',
+                                'login': student_2.contest_login,
+                            },
+                        ],
+                    },
+                    rf'^contests\/{contest_base.yandex_contest_id}\/'
                     rf'participants\?login={student_1.contest_login}$': {
                         'json': [
                             {
@@ -1088,3 +1216,658 @@ class TestJob:
                 == task_base.score_max + task_usual_final.score_max
             )
             assert student_2_course_model.is_ok
+
+
+@pytest.mark.usefixtures(
+    'migrated_postgres', 'mock_send_or_edit', 'student_department'
+)
+class TestUpdateCourseResults:
+    @pytest.mark.usefixtures('student_contest')
+    async def test_contest_error_isolated(
+        self, created_course, created_contest, mocker
+    ):
+        # arrange
+        sync_mock = mocker.patch(
+            'app.scheduler.update_results.sync_contest',
+            side_effect=RuntimeError('sync failed'),
+        )
+        send_mock = mocker.patch(
+            'app.bot_helper.send.send_traceback_message_safe'
+        )
+
+        # act
+        await update_course_results(created_course, loguru.logger)
+
+        # assert
+        sync_mock.assert_called_once()
+        send_mock.assert_called_once()
+        assert str(created_contest.yandex_contest_id) in (
+            send_mock.call_args.kwargs['message']
+        )
+
+    async def test_sync_state(  # pylint: disable=too-many-arguments
+        self,
+        created_course,
+        created_student,
+        student_course,
+        created_contest,
+        created_task,
+        mock_make_request_to_yandex_contest_v2,
+        mock_bot,
+        create_async_session,
+        mocker,
+    ):
+        # arrange
+        contest_url = rf'^contests\/{created_contest.yandex_contest_id}\/'
+        mock_make_request_to_yandex_contest_v2(
+            {
+                contest_url
+                + r'submissions\?page=1&pageSize=100$': {
+                    'json': {
+                        'count': 1,
+                        'submissions': [
+                            {
+                                'id': 1,
+                                'authorId': 12345,
+                                'problemId': created_task.yandex_task_id,
+                                'problemAlias': created_task.alias,
+                                'verdict': 'OK',
+                            },
+                        ],
+                    },
+                },
+                contest_url
+                + r'submissions\/multiple\?runIds=1$': {
+                    'json': [
+                        {
+                            'runId': 1,
+                            'authorId': 12345,
+                            'problemId': created_task.yandex_task_id,
+                            'problemAlias': created_task.alias,
+                            'verdict': 'OK',
+                            'participantInfo': {
+                                'login': created_student.contest_login,
+                            },
+                            'submissionTime': created_contest.deadline.isoformat(),
+                            'finalScore': '1',
+                        },
+                    ],
+                },
+                contest_url
+                + r'participants': {
+                    'json': [
+                        {
+                            'id': '12345',
+                            'login': created_student.contest_login,
+                        }
+                    ]
+                },
+            }
+        )
+        make_full_spy = mocker.spy(
+            contest_utils.service, 'make_full_submissions'
+        )
+
+        # act
+        await update_course_results(created_course, loguru.logger)
+        async with create_async_session() as session:
+            first_state = await contest_utils.get_contest_sync_state(
+                session, created_contest.id
+            )
+        # not due yet
+        await update_course_results(created_course, loguru.logger)
+        requests_count = (
+            contest_utils.service.make_request_to_yandex_contest_api.call_count
+        )
+        async with create_async_session() as session:
+            await session.execute(
+                update(models.ContestSyncState).values(next_sync_at=None)
+            )
+        await update_course_results(created_course, loguru.logger)
+        async with create_async_session() as session:
+            second_state = await contest_utils.get_contest_sync_state(
+                session, created_contest.id
+            )
+
+        # assert
+        mock_bot.send_message.assert_not_called()
+        assert make_full_spy.call_count == 1
+        assert (
+            contest_utils.service.make_request_to_yandex_contest_api.call_count
+            == requests_count + 1
+        )
+        assert first_state.next_sync_at > first_state.synced_at
+        assert (first_state.last_run_id, first_state.remote_count) == (1, 1)
+        assert (second_state.last_run_id, second_state.remote_count) == (1, 1)
+        assert second_state.synced_at >= first_state.synced_at
+        assert second_state.sync_duration is not None
+
+
+class TestGetLastUpdatedRunId:
+    @pytest.mark.parametrize(
+        'bulk_ingestion, state_run_id, db_run_id, run_id',
+        [
+            ('true', 5, 10, 5),
+            ('false', 5, 10, 10),
+            ('false', 10, 5, 10),
+            ('false', None, 5, 5),
+            ('false', None, None, -1),
+        ],
+    )
+    async def test_run_id(  # pylint: disable=too-many-arguments
+        self,
+        mocker,
+        monkeypatch,
+        bulk_ingestion,
+        state_run_id,
+        db_run_id,
+        run_id,
+    ):
+        monkeypatch.setenv('UPDATE_RESULTS_BULK_INGESTION', bulk_ingestion)
+        reload_settings()
+        mocker.patch.object(
+            submission_utils,
+            'get_last_updated_submission',
+            return_value=(
+                mocker.Mock(run_id=db_run_id)
+                if db_run_id is not None
+                else None
+            ),
+        )
+        sync_state = (
+            mocker.Mock(last_run_id=state_run_id)
+            if state_run_id is not None
+            else None
+        )
+
+        assert (
+            await get_last_updated_run_id(
+                mocker.Mock(), mocker.Mock(), sync_state
+            )
+            == run_id
+        )
+
+
+@pytest.mark.usefixtures('migrated_postgres', 'mock_send_or_edit')
+class TestCheckAndUpdateNoVerdictSubmissions:
+    async def test_batched_with_backoff(  # pylint: disable=too-many-arguments,too-many-locals
+        self,
+        created_course,
+        created_contest,
+        created_task,
+        created_student,
+        student_course,
+        mock_make_request_to_yandex_contest_v2,
+        student_contest,
+        mock_bot,
+        session,
+        create_async_session,
+    ):
+        # arrange
+        student_task = await utils.create_model(
+            session,
+            factory_lib.StudentTaskFactory.build(
+                course_id=created_course.id,
+                contest_id=created_contest.id,
+                task_id=created_task.id,
+                student_id=created_student.id,
+                final_score=0,
+                best_score_before_finish=0,
+                best_score_no_deadline=0,
+                is_done=False,
+                best_score_before_finish_submission_id=None,
+                best_score_no_deadline_submission_id=None,
+            ),
+        )
+        for run_id in (1, 2):
+            await utils.create_model(
+                session,
+                factory_lib.SubmissionFactory.build(
+                    course_id=created_course.id,
+                    contest_id=created_contest.id,
+                    task_id=created_task.id,
+                    student_id=created_student.id,
+                    student_task_id=student_task.id,
+                    verdict='No report',
+                    final_score=0,
+                    score_no_deadline=0,
+                    score_before_finish=0,
+                    author_id=student_contest.author_id,
+                    run_id=run_id,
+                    verdict_checks_count=0,
+                    next_verdict_check_at=None,
+                ),
+            )
+        mock_make_request_to_yandex_contest_v2(
+            {
+                rf'^contests\/{created_contest.yandex_contest_id}\/'
+                r'submissions\/multiple\?runIds=1&runIds=2$': {
+                    'json': [
+                        {
+                            'runId': run_id,
+                            'authorId': student_contest.author_id,
+                            'problemId': created_task.yandex_task_id,
+                            'problemAlias': created_task.alias,
+                            'verdict': verdict,
+                            'participantInfo': {
+                                'login': created_student.contest_login,
+                            },
+                            'submissionTime': created_contest.deadline.isoformat(),
+                            'finalScore': '1',
+                        }
+                        for run_id, verdict in ((1, 'OK'), (2, 'No report'))
+                    ],
+                },
+            }
+        )
+
+        # act
+        await check_and_update_no_verdict_submissions(loguru.logger)
+        # the pending submission is not due yet
+        await check_and_update_no_verdict_submissions(loguru.logger)
+
+        # assert
+        mock_bot.send_message.assert_not_called()
+        assert (
+            contest_utils.service.make_request_to_yandex_contest_api.call_count
+            == 1
+        )
+        async with create_async_session() as new_session:
+            submissions = {
+                submission.run_id: submission
+                for submission in (
+                    await new_session.execute(select(models.Submission))
+                ).scalars()
+            }
+            student_task = await new_session.get(
+                models.StudentTask, student_task.id
+            )
+        assert submissions[1].verdict == 'OK'
+        assert submissions[1].final_score == 1
+        assert submissions[1].verdict_checks_count == 0
+        assert submissions[2].verdict == 'No report'
+        assert submissions[2].verdict_checks_count == 1
+        assert submissions[2].next_verdict_check_at > datetime.datetime.now(
+            datetime.timezone.utc
+        ) + datetime.timedelta(minutes=15)
+        assert student_task.final_score == 1
+
+
+@pytest.mark.usefixtures('migrated_postgres', 'mock_send_or_edit')
+class TestProcessSubmissionsBulk:
+    @staticmethod
+    async def _snapshot(session, contest_id):  # type: ignore
+        submission_models = (
+            (
+                await session.execute(
+                    select(models.Submission).where(
+                        models.Submission.contest_id == contest_id
+                    )
+                )
+            )
+            .scalars()
+            .all()
+        )
+        run_ids = {
+            submission.id: submission.run_id
+            for submission in submission_models
+        }
+        submissions = sorted(
+            (
+                submission.run_id,
+                str(submission.student_id),
+                str(submission.task_id),
+                submission.verdict,
+                submission.final_score,
+                submission.score_no_deadline,
+                submission.score_before_finish,
+            )
+            for submission in submission_models
+        )
+        student_tasks = sorted(
+            (
+                str(student_task.student_id),
+                str(student_task.task_id),
+                student_task.final_score,
+                student_task.best_score_before_finish,
+                student_task.best_score_no_deadline,
+                student_task.is_done,
+                run_ids.get(
+                    student_task.best_score_before_finish_submission_id
+                ),
+                run_ids.get(student_task.best_score_no_deadline_submission_id),
+            )
+            for student_task in (
+                await session.execute(
+                    select(models.StudentTask).where(
+                        models.StudentTask.contest_id == contest_id
+                    )
+                )
+            ).scalars()
+        )
+        student_contests = sorted(
+            (
+                str(student_contest.student_id),
+                student_contest.score,
+                student_contest.score_no_deadline,
+                student_contest.tasks_done,
+            )
+            for student_contest in (
+                await session.execute(
+                    select(models.StudentContest).where(
+                        models.StudentContest.contest_id == contest_id
+                    )
+                )
+            ).scalars()
+        )
+        student_courses = sorted(
+            (
+                str(student_course.student_id),
+                student_course.score,
+                student_course.score_no_deadline,
+            )
+            for student_course in (
+                await session.execute(select(models.StudentCourse))
+            ).scalars()
+        )
+        return submissions, student_tasks, student_contests, student_courses
+
+    @staticmethod
+    async def _reset(session, contest_id):  # type: ignore
+        await session.execute(
+            delete(models.Submission).where(
+                models.Submission.contest_id == contest_id
+            )
+        )
+        await session.execute(
+            delete(models.StudentTask).where(
+                models.StudentTask.contest_id == contest_id
+            )
+        )
+        await session.execute(
+            update(models.StudentContest).values(
+                score=0, score_no_deadline=0, tasks_done=0
+            )
+        )
+        await session.execute(
+            update(models.StudentCourse).values(score=0, score_no_deadline=0)
+        )
+
+    async def test_same_results_as_per_submission(  # pylint: disable=too-many-arguments,too-many-locals
+        self,
+        created_course,
+        created_contest,
+        created_task,
+        session,
+        create_async_session,
+        mock_bot,
+        monkeypatch,
+    ):
+        # arrange
+        deadline = datetime.datetime(2023, 1, 1)
+        created_contest.deadline = deadline
+        formula = (
+            'max({best_score_before_finish}, '
+            '{best_score_no_deadline} * 0.5)'
+        )
+        created_task.final_score_evaluation_formula = formula
+        second_task = factory_lib.TaskFactory.build(
+            contest_id=created_contest.id,
+            score_max=2,
+            is_zero_ok=False,
+            final_score_evaluation_formula=formula,
+        )
+        session.add(second_task)
+        students = factory_lib.StudentFactory.build_batch(3)
+        session.add_all(students)
+        await session.flush()
+        for author_id, student in enumerate(students, start=100):
+            session.add(
+                factory_lib.StudentCourseFactory.build(
+                    student_id=student.id,
+                    course_id=created_course.id,
+                    score=0,
+                    score_no_deadline=0,
+                )
+            )
+            session.add(
+                factory_lib.StudentContestFactory.build(
+                    student_id=student.id,
+                    contest_id=created_contest.id,
+                    course_id=created_course.id,
+                    author_id=author_id,
+                    tasks_done=0,
+                    score=0,
+                    score_no_deadline=0,
+                )
+            )
+        await session.commit()
+        tasks = [created_task, second_task]
+
+        rnd = random.Random(42)
+        submissions = []
+        for run_id in range(1, 81):
+            task = rnd.choice(tasks)
+            verdict = rnd.choice(['OK', 'WA'])
+            submissions.append(
+                contest_schemas.ContestSubmissionFull(
+                    id=run_id,
+                    # 103 is not registered in contest
+                    authorId=rnd.choice([100, 101, 102, 103]),
+                    problemId=task.yandex_task_id,
+                    problemAlias=task.alias,
+                    verdict=verdict,
+                    finalScore=rnd.choice([0, task.score_max / 2])
+                    if verdict == 'WA'
+                    else rnd.choice([0, task.score_max]),
+                    login='login',
+                    submissionTime=deadline
+                    + datetime.timedelta(days=rnd.randint(-5, 5)),
+                )
+            )
+        # the same run twice
+        submissions.append(submissions[10].copy())
+
+        async def _process() -> tuple[tp.Any, ...]:
+            await process_submissions(
+                created_course,
+                created_contest,
+                [],
+                submissions,
+                base_logger=loguru.logger,
+            )
+            async with create_async_session() as new_session:
+                return await self._snapshot(new_session, created_contest.id)
+
+        # act
+        monkeypatch.setenv('UPDATE_RESULTS_BULK_INGESTION', 'false')
+        reload_settings()
+        per_submission_result = await _process()
+        per_submission_messages = mock_bot.send_message.call_count
+        async with create_async_session() as new_session:
+            await self._reset(new_session, created_contest.id)
+        mock_bot.send_message.reset_mock()
+        monkeypatch.setenv('UPDATE_RESULTS_BULK_INGESTION', 'true')
+        reload_settings()
+        bulk_result = await _process()
+
+        # assert
+        assert bulk_result == per_submission_result
+        assert mock_bot.send_message.call_count == per_submission_messages
+        assert len(per_submission_result[0]) == len(
+            [
+                submission
+                for submission in submissions[:-1]
+                if submission.authorId != 103
+            ]
+        )
+        assert any(score for _, score, _, _ in per_submission_result[2])
+
+
+@pytest.mark.usefixtures('migrated_postgres', 'student_department')
+class TestGetCourseResults:
+    async def test_only_dirty_students(
+        self,
+        created_course,
+        student_course,
+        create_async_session,
+        mocker,
+    ):
+        # arrange
+        apply_spy = mocker.spy(results_utils.CourseLevelsData, 'apply_changes')
+        assert student_course.is_results_dirty
+
+        # act
+        await get_course_results(
+            created_course, [], loguru.logger, full_recompute=False
+        )
+        await get_course_results(
+            created_course, [], loguru.logger, full_recompute=False
+        )
+
+        # assert
+        assert [call.args[2] for call in apply_spy.call_args_list] == [
+            {student_course.student_id},
+            set(),
+        ]
+        async with create_async_session() as session:
+            student_course_model = await course_utils.get_student_course(
+                session, student_course.student_id, created_course.id
+            )
+        assert not student_course_model.is_results_dirty
+
+    async def test_dirty_during_evaluation_kept(
+        self,
+        created_course,
+        student_course,
+        create_async_session,
+        mocker,
+    ):
+        # arrange
+        clear_dirty = course_utils.clear_student_courses_results_dirty
+
+        async def _clear_dirty(*args, **kwargs):
+            # contest is synced after levels data is loaded
+            async with create_async_session() as session:
+                await course_utils.mark_student_courses_results_dirty(
+                    session, created_course.id, [student_course.student_id]
+                )
+            await clear_dirty(*args, **kwargs)
+
+        mocker.patch.object(
+            course_utils,
+            'clear_student_courses_results_dirty',
+            side_effect=_clear_dirty,
+        )
+
+        # act
+        await get_course_results(
+            created_course, [], loguru.logger, full_recompute=False
+        )
+
+        # assert
+        async with create_async_session() as session:
+            student_course_model = await course_utils.get_student_course(
+                session, student_course.student_id, created_course.id
+            )
+        assert student_course_model.is_results_dirty
+
+    async def test_full_recompute(
+        self,
+        created_course,
+        student_course,
+        create_async_session,
+        mocker,
+    ):
+        # arrange
+        apply_spy = mocker.spy(results_utils.CourseLevelsData, 'apply_changes')
+        async with create_async_session() as session:
+            await session.execute(
+                update(models.StudentCourse).values(is_results_dirty=False)
+            )
+
+        # act
+        await get_course_results(
+            created_course, [], loguru.logger, full_recompute=True
+        )
+
+        # assert
+        assert apply_spy.call_args.args[2] == {student_course.student_id}
+
+    async def test_results_snapshots(
+        self,
+        created_course,
+        student_course,
+        create_async_session,
+        mocker,
+    ):
+        # arrange
+        save_spy = mocker.spy(results_utils, 'save_course_results_snapshots')
+
+        # act
+        await get_course_results(
+            created_course, [], loguru.logger, full_recompute=True
+        )
+        await get_course_results(
+            created_course, [], loguru.logger, full_recompute=True
+        )
+
+        # assert
+        assert [len(call.args[2]) for call in save_spy.call_args_list] == [
+            1,
+            0,
+        ]
+        async with create_async_session() as session:
+            snapshots = await results_utils.get_course_results_snapshots(
+                session, created_course.id
+            )
+        assert (
+            snapshots[student_course.student_id]['name'] == created_course.name
+        )
+
+    async def test_submission_marks_dirty(
+        self,
+        created_course,
+        created_contest,
+        created_task,
+        student_course,
+        student_contest,
+        session,
+        create_async_session,
+        mock_bot,
+    ):
+        # arrange
+        created_task.final_score_evaluation_formula = (
+            '{best_score_before_finish}'
+        )
+        await session.execute(
+            update(models.StudentCourse).values(is_results_dirty=False)
+        )
+        await session.commit()
+        submission = contest_schemas.ContestSubmissionFull(
+            id=1,
+            authorId=student_contest.author_id,
+            problemId=created_task.yandex_task_id,
+            problemAlias=created_task.alias,
+            verdict='OK',
+            finalScore=created_task.score_max,
+            login='login',
+            submissionTime=created_contest.deadline,
+        )
+
+        # act
+        await process_submissions(
+            created_course,
+            created_contest,
+            [],
+            [submission],
+            base_logger=loguru.logger,
+        )
+
+        # assert
+        mock_bot.send_message.assert_not_called()
+        async with create_async_session() as new_session:
+            student_course_model = await course_utils.get_student_course(
+                new_session, student_course.student_id, created_course.id
+            )
+        assert student_course_model.is_results_dirty
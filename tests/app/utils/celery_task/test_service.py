@@ -0,0 +1,107 @@
+import asyncio
+
+import pytest
+
+from app.utils import celery_task as celery_task_utils
+from app.utils.celery_task import service
+
+
+@pytest.fixture(autouse=True)
+def reset_redis_client(monkeypatch):
+    monkeypatch.setattr(service, '_redis_client', None)
+
+
+@pytest.mark.asyncio
+class TestWaitTaskResult:
+    @staticmethod
+    def mock_result(mocker, statuses):  # type: ignore
+        result = mocker.Mock()
+        status = mocker.PropertyMock(side_effect=statuses)
+        type(result).status = status
+        result.backend.get_key_for_task.return_value = b'celery-task-meta-id'
+        mocker.patch.object(
+            service.celery_result, 'AsyncResult', return_value=result
+        )
+        return status
+
+    @staticmethod
+    def mock_pubsub(mocker):  # type: ignore
+        client = mocker.MagicMock()
+        mocker.patch.object(service.aioredis, 'from_url', return_value=client)
+        pubsub = mocker.MagicMock(
+            subscribe=mocker.AsyncMock(), get_message=mocker.AsyncMock()
+        )
+        client.pubsub.return_value.__aenter__.return_value = pubsub
+        return pubsub
+
+    async def test_ready(self, mocker):
+        task_status = self.mock_result(mocker, ['SUCCESS'])
+        pubsub = self.mock_pubsub(mocker)
+
+        _, status = await celery_task_utils.wait_task_result('id', 10)
+
+        assert status == 'SUCCESS'
+        assert task_status.call_count == 1
+        pubsub.subscribe.assert_not_called()
+
+    async def test_wait_for_update(self, mocker):
+        self.mock_result(mocker, ['PENDING', 'PENDING', 'STARTED', 'SUCCESS'])
+        pubsub = self.mock_pubsub(mocker)
+
+        _, status = await celery_task_utils.wait_task_result('id', 10)
+
+        assert status == 'SUCCESS'
+        pubsub.subscribe.assert_awaited_once_with(b'celery-task-meta-id')
+        # checked again only after updates of task
+        assert pubsub.get_message.await_count == 2
+
+    async def test_timeout(self, mocker):
+        self.mock_result(mocker, lambda: 'PENDING')
+        pubsub = self.mock_pubsub(mocker)
+
+        async def _get_message(**kwargs):  # type: ignore
+            await asyncio.sleep(kwargs['timeout'])
+
+        pubsub.get_message.side_effect = _get_message
+
+        _, status = await celery_task_utils.wait_task_result('id', 0.5)
+
+        assert status == 'PENDING'
+        assert pubsub.get_message.await_count >= 1
+        for call in pubsub.get_message.await_args_list:
+            assert 0 < call.kwargs['timeout'] <= 0.5
+
+    async def test_shared_client(self, mocker):
+        self.mock_result(mocker, lambda: 'PENDING')
+        pubsub = self.mock_pubsub(mocker)
+        pubsub.get_message.return_value = None
+
+        for _ in range(3):
+            await celery_task_utils.wait_task_result('id', 0.01)
+
+        assert service.aioredis.from_url.call_count == 1
+
+
+class TestGetTaskResultContent:
+    @pytest.mark.parametrize(
+        'ready, status, messages',
+        [
+            (False, 'PENDING', None),
+            (True, 'SUCCESS', ['message']),
+            (
+                True,
+                'FAILURE',
+                [
+                    'Произошла ошибка. Попробуйте еще раз '
+                    'или напишите администратору.'
+                ],
+            ),
+        ],
+    )
+    def test_content(self, mocker, ready, status, messages):
+        result = mocker.Mock(result=['message'])
+
+        assert celery_task_utils.get_task_result_content(result, status) == {
+            'ready': ready,
+            'messages': messages,
+        }
@@ -0,0 +1,130 @@
+import asyncio
+
+import pytest
+from sqlalchemy import func, select
+
+from app.database import models
+from app.utils import common
+from tests import factory_lib
+
+
+pytestmark = pytest.mark.asyncio
+
+
+class TestGetOrCreateModels:
+    @staticmethod
+    def _rows(course, contest, student, tasks):
+        return [
+            {
+                'course_id': course.id,
+                'contest_id': contest.id,
+                'student_id': student.id,
+                'task_id': task.id,
+            }
+            for task in tasks
+        ]
+
+    async def test_get_or_create(
+        self,
+        session,
+        created_course,
+        created_contest,
+        created_student,
+        created_task,
+    ):
+        rows = self._rows(
+            created_course, created_contest, created_student, [created_task]
+        )
+        (created,) = await common.get_or_create_models(
+            session, models.StudentTask, rows, ['student_id', 'task_id']
+        )
+        created.final_score = 1
+        await session.commit()
+
+        # duplicated rows are merged into one
+        existing = await common.get_or_create_models(
+            session,
+            models.StudentTask,
+            rows + rows,
+            ['student_id', 'task_id'],
+        )
+
+        assert [student_task.id for student_task in existing] == [created.id]
+        assert existing[0].final_score == 1
+
+    async def test_existing_and_new(
+        self,
+        session,
+        created_course,
+        created_contest,
+        created_student,
+        created_task,
+    ):
+        new_task = factory_lib.TaskFactory.build(contest_id=created_contest.id)
+        session.add(new_task)
+        await session.commit()
+        (created,) = await common.get_or_create_models(
+            session,
+            models.StudentTask,
+            self._rows(
+                created_course,
+                created_contest,
+                created_student,
+                [created_task],
+            ),
+            ['student_id', 'task_id'],
+        )
+        await session.commit()
+
+        result = await common.get_or_create_models(
+            session,
+            models.StudentTask,
+            self._rows(
+                created_course,
+                created_contest,
+                created_student,
+                [new_task, created_task],
+            ),
+            ['student_id', 'task_id'],
+        )
+
+        # objects are returned in order of rows
+        assert [student_task.task_id for student_task in result] == [
+            new_task.id,
+            created_task.id,
+        ]
+        assert result[1].id == created.id
+
+    async def test_concurrent(
+        self,
+        create_async_session,
+        created_course,
+        created_contest,
+        created_student,
+        created_task,
+    ):
+        rows = self._rows(
+            created_course, created_contest, created_student, [created_task]
+        )
+
+        async def _get_or_create():
+            async with create_async_session() as session:
+                (student_task,) = await common.get_or_create_models(
+                    session,
+                    models.StudentTask,
+                    rows,
+                    ['student_id', 'task_id'],
+                )
+                await session.commit()
+                return student_task.id
+
+        ids = await asyncio.gather(*[_get_or_create() for _ in range(5)])
+
+        assert len(set(ids)) == 1
+        async with create_async_session() as session:
+            assert (
+                await session.scalar(
+                    select(func.count()).select_from(models.StudentTask)
+                )
+                == 1
+            )
@@ -0,0 +1,33 @@
+import asyncio
+
+import pytest
+
+from app.utils import common
+
+
+pytestmark = pytest.mark.asyncio
+
+
+class TestGatherBounded:
+    @pytest.mark.parametrize('concurrency', [1, 3])
+    async def test_limit(self, concurrency):
+        running = 0
+        max_running = 0
+        started = []
+
+        async def _work(i: int) -> int:
+            nonlocal running, max_running
+            started.append(i)
+            running += 1
+            max_running = max(max_running, running)
+            await asyncio.sleep(0.01)
+            running -= 1
+            return i
+
+        results = await common.gather_bounded(
+            [_work(i) for i in range(10)], asyncio.Semaphore(concurrency)
+        )
+
+        assert results == list(range(10))
+        assert started == list(range(10))
+        assert max_running == concurrency
@@ -7,6 +7,7 @@ from sqlalchemy import select
 
 from app.database.models import StudentContest
 from app.utils import contest
+from tests import factory_lib
 
 
 pytestmark = pytest.mark.asyncio
@@ -188,6 +189,56 @@ class TestGetStudentContestRelationHandler:
         )
 
 
+class TestStudentContestRelationsHandler:
+    async def test_get_student_contest_relations(
+        self, session, created_contest, student_contest
+    ):
+        assert await contest.get_student_contest_relations(
+            session, created_contest.id
+        ) == {student_contest.student_id: student_contest}
+
+    async def test_add_student_contest_relations(
+        self, session, created_contest, student_contest
+    ):
+        new_student = factory_lib.StudentFactory.build()
+        session.add(new_student)
+        await session.commit()
+        await contest.add_student_contest_relations(
+            session,
+            created_contest.id,
+            created_contest.course_id,
+            {
+                student_contest.student_id: student_contest.author_id,
+                new_student.id: student_contest.author_id + 1,
+            },
+        )
+        await session.commit()
+        relations = await contest.get_student_contest_relations(
+            session, created_contest.id
+        )
+        assert relations.keys() == {
+            student_contest.student_id,
+            new_student.id,
+        }
+        assert (
+            relations[new_student.id].author_id
+            == student_contest.author_id + 1
+        )
+
+    async def test_update_student_contest_author_ids(
+        self, session, created_contest, student_contest
+    ):
+        author_id = student_contest.author_id + 1
+        await contest.update_student_contest_author_ids(
+            session,
+            created_contest.id,
+            {student_contest.student_id: author_id},
+        )
+        await session.commit()
+        await session.refresh(student_contest)
+        assert student_contest.author_id == author_id
+
+
 class TestGetOkAuthorIdsHandler:
     async def test_get_ok_author_ids(self, session, student_contest):
         assert (
@@ -0,0 +1,166 @@
+# pylint: disable=redefined-outer-name
+# pylint: disable=protected-access
+import re
+
+import httpx
+import loguru
+import pytest
+
+from app.config import reload_settings
+from app.utils import contest
+from app.utils.contest import participants as participants_module
+
+
+@pytest.fixture
+def mock_participants(mocker):
+    def _mock(participants, registered=()):
+        requests = []
+
+        async def _request(endpoint, *args, method='GET', **kwargs):
+            requests.append((method, endpoint))
+            match = re.search(r'participants\?login=(.+)$', endpoint)
+            if match and method == 'POST':
+                request = httpx.Request(method, endpoint)
+                if match.group(1) in registered:
+                    raise httpx.HTTPStatusError(
+                        'conflict',
+                        request=request,
+                        response=httpx.Response(409, request=request),
+                    )
+                return httpx.Response(201, text='888')
+            if match:
+                login = match.group(1)
+                return httpx.Response(
+                    200, json=[{'id': '777', 'login': login}]
+                )
+            return httpx.Response(
+                200,
+                json=[
+                    {'id': str(author_id), 'login': login}
+                    for login, author_id in participants.items()
+                ],
+            )
+
+        mocker.patch(
+            'app.utils.contest.service.make_request_to_yandex_contest_api',
+            side_effect=_request,
+        )
+        return requests
+
+    return _mock
+
+
+class TestGetParticipantsIndex:
+    async def test_cached(self, session, created_contest, mock_participants):
+        requests = mock_participants({'a': 1, 'b': 2})
+        for _ in range(3):
+            assert await contest.get_participants_index(
+                session, created_contest, logger=loguru.logger
+            ) == {'a': 1, 'b': 2}
+        assert len(requests) == 1
+
+        participants_module._participants_cache.clear()
+        assert await contest.get_participants_index(
+            session, created_contest, logger=loguru.logger
+        ) == {'a': 1, 'b': 2}
+        assert len(requests) == 1
+
+    async def test_refresh_after_ttl(
+        self, session, created_contest, mock_participants, monkeypatch
+    ):
+        mock_participants({'a': 1, 'b': 2})
+        await contest.get_participants_index(
+            session, created_contest, logger=loguru.logger
+        )
+        monkeypatch.setenv('CONTEST_PARTICIPANTS_TTL', '0')
+        reload_settings()
+        requests = mock_participants({'a': 1, 'b': 3, 'c': 4})
+        assert await contest.get_participants_index(
+            session, created_contest, logger=loguru.logger
+        ) == {'a': 1, 'b': 3, 'c': 4}
+        assert len(requests) == 1
+        saved, _ = await contest.get_contest_participants(
+            session, created_contest.id
+        )
+        assert saved == {'a': 1, 'b': 3, 'c': 4}
+
+        mock_participants({'c': 4})
+        await contest.get_participants_index(
+            session, created_contest, logger=loguru.logger
+        )
+        saved, _ = await contest.get_contest_participants(
+            session, created_contest.id
+        )
+        assert saved == {'c': 4}
+
+    async def test_refresh_failed(self, session, created_contest, mocker):
+        request = httpx.Request('GET', 'participants')
+        request_mock = mocker.patch(
+            'app.utils.contest.service.make_request_to_yandex_contest_api',
+            side_effect=httpx.HTTPStatusError(
+                'error',
+                request=request,
+                response=httpx.Response(500, request=request),
+            ),
+        )
+        for _ in range(3):
+            assert (
+                await contest.get_participants_index(
+                    session, created_contest, logger=loguru.logger
+                )
+                == {}
+            )
+        # the list is not requested again until TTL
+        assert request_mock.call_count == 1
+
+
+class TestResolveAuthorId:
+    async def test_ok(self, session, created_contest, mock_participants):
+        requests = mock_participants({'a': 1, 'b': 2})
+        assert (
+            await contest.resolve_author_id(
+                session, created_contest, 'b', logger=loguru.logger
+            )
+            == 2
+        )
+        assert (
+            await contest.resolve_author_id(
+                session, created_contest, 'c', logger=loguru.logger
+            )
+            == 888
+        )
+        assert [method for method, _ in requests] == ['GET', 'POST']
+        saved, _ = await contest.get_contest_participants(
+            session, created_contest.id
+        )
+        assert saved == {'a': 1, 'b': 2, 'c': 888}
+
+    async def test_registered_after_refresh(
+        self, session, created_contest, mock_participants
+    ):
+        requests = mock_participants({'a': 1}, registered=['c'])
+        for _ in range(2):
+            assert (
+                await contest.resolve_author_id(
+                    session, created_contest, 'c', logger=loguru.logger
+                )
+                == 777
+            )
+        # the list of participants is downloaded only once
+        assert requests == [
+            (
+                'GET',
+                f'contests/{created_contest.yandex_contest_id}'
+                '/participants',
+            ),
+            (
+                'POST',
+                f'contests/{created_contest.yandex_contest_id}'
+                '/participants?login=c',
+            ),
+            (
+                'GET',
+                f'contests/{created_contest.yandex_contest_id}'
+                '/participants?login=c',
+            ),
+        ]
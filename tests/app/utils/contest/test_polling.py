@@ -0,0 +1,100 @@
+from datetime import datetime, timedelta, timezone
+from types import SimpleNamespace
+from uuid import uuid4
+
+import loguru
+import pytest
+
+from app.config import reload_settings
+from app.utils import contest
+from app.utils.contest import polling
+
+
+NOW = datetime(2026, 10, 18, 12, tzinfo=timezone.utc)
+
+
+def _contest(deadline_delta: timedelta | None) -> SimpleNamespace:
+    return SimpleNamespace(
+        deadline=(
+            NOW.replace(tzinfo=None) + deadline_delta
+            if deadline_delta is not None
+            else None
+        )
+    )
+
+
+def _state(
+    next_sync_delta: timedelta | None, rate: float = 0.0
+) -> SimpleNamespace:
+    return SimpleNamespace(
+        next_sync_at=(
+            NOW + next_sync_delta if next_sync_delta is not None else None
+        ),
+        submissions_rate=rate,
+        synced_at=NOW - timedelta(hours=1),
+    )
+
+
+class TestGetPollInterval:
+    @pytest.mark.parametrize(
+        'deadline_delta,rate,interval',
+        [
+            pytest.param(timedelta(hours=3), 0, 60, id='before_deadline'),
+            pytest.param(-timedelta(hours=3), 0, 60, id='after_deadline'),
+            pytest.param(timedelta(days=5), 0, 3600, id='idle'),
+            pytest.param(timedelta(days=5), 30, 120, id='by_rate'),
+            pytest.param(timedelta(days=5), 1000, 60, id='max_rate'),
+            pytest.param(-timedelta(days=60), 0, 86400, id='dormant'),
+            pytest.param(-timedelta(days=60), 2, 1800, id='dormant_active'),
+            pytest.param(None, 0, 3600, id='no_deadline'),
+        ],
+    )
+    def test_interval(self, deadline_delta, rate, interval):
+        assert (
+            contest.get_poll_interval(_contest(deadline_delta), rate, NOW)
+            == interval
+        )
+
+
+class TestGetSubmissionsRate:
+    def test_first_sync(self):
+        assert contest.get_submissions_rate(None, 100, NOW) == 0
+
+    def test_half_life(self):
+        # one hour since the last sync is one half-life
+        rate = contest.get_submissions_rate(_state(None, rate=10), 30, NOW)
+        assert rate == pytest.approx(10 * 0.5 + 30 * 0.5)
+
+
+class TestGetDueContests:
+    def test_order(self):
+        items = [
+            ('not_due', _contest(timedelta(hours=1)), _state(timedelta(1))),
+            ('idle', _contest(timedelta(days=5)), _state(-timedelta(hours=2))),
+            ('new', _contest(timedelta(days=5)), None),
+            ('hot', _contest(timedelta(hours=1)), _state(-timedelta(0))),
+            (
+                'hot_late',
+                _contest(timedelta(hours=1)),
+                _state(-timedelta(minutes=5)),
+            ),
+            ('dormant', _contest(-timedelta(days=60)), _state(None)),
+        ]
+        assert [
+            name for name, _, _ in contest.get_due_contests(items, NOW)
+        ] == ['hot_late', 'hot', 'new', 'idle', 'dormant']
+
+
+class TestKeepContestSync:
+    async def test_stop_on_lost_claim(self, mocker, monkeypatch):
+        monkeypatch.setenv('CONTEST_SYNC_CLAIM_TTL', '0')
+        reload_settings()
+        extend = mocker.patch.object(
+            polling,
+            'extend_contest_sync',
+            side_effect=[True, Exception('redis is down'), False],
+        )
+
+        await contest.keep_contest_sync(uuid4(), 'token', logger=loguru.logger)
+
+        assert extend.await_count == 3
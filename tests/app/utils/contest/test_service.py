@@ -1,10 +1,17 @@
 # pylint: disable=unused-argument
+import re
+from types import SimpleNamespace
+
+import httpx
 import loguru
 import pytest
 from sqlalchemy import select
 
+from app.config import reload_settings
 from app.database.models import StudentContest
+from app.schemas import contest as contest_schemas
 from app.utils import contest
+from app.utils.contest import service as contest_service
 
 
 pytestmark = pytest.mark.asyncio
@@ -240,3 +247,309 @@ class Test_AddResults:
 
 class TestGetOkSubmissions:
     pass
+
+
+class TestGetNewSubmissions:
+    @staticmethod
+    def mock_listing(mocker, ids, counts=None):
+        """
+        Mocks submissions list sorted from the newest, like Yandex does.
+        """
+        requested_pages = []
+
+        async def _request(endpoint, *args, **kwargs):
+            match = re.search(r'page=(\d+)&pageSize=(\d+)$', endpoint)
+            page, page_size = int(match.group(1)), int(match.group(2))
+            requested_pages.append(page)
+            page_ids = ids[(page - 1) * page_size : page * page_size]
+            return httpx.Response(
+                200,
+                json={
+                    'count': counts.pop(0) if counts else len(ids),
+                    'submissions': [
+                        {
+                            'id': run_id,
+                            'authorId': 1,
+                            'problemId': 'problem',
+                            'problemAlias': 'A',
+                            'verdict': 'OK',
+                        }
+                        for run_id in page_ids
+                    ],
+                },
+            )
+
+        mocker.patch(
+            'app.utils.contest.service.make_request_to_yandex_contest_api',
+            side_effect=_request,
+        )
+
+        async def _make_full_submissions(submissions, *args, **kwargs):
+            return [
+                SimpleNamespace(id=run_id) for run_id in sorted(submissions)
+            ]
+
+        mocker.patch(
+            'app.utils.contest.service.make_full_submissions',
+            side_effect=_make_full_submissions,
+        )
+        return requested_pages
+
+    @pytest.mark.parametrize('fan_out', ['1', '4'])
+    async def test_cold_sync(self, mocker, monkeypatch, fan_out):
+        monkeypatch.setenv('YANDEX_SUBMISSIONS_PAGES_FAN_OUT', fan_out)
+        reload_settings()
+        ids = list(range(950, 0, -1))
+        requested_pages = self.mock_listing(mocker, ids)
+        result, count = await contest.get_new_submissions(
+            SimpleNamespace(yandex_contest_id=1), 0, logger=loguru.logger
+        )
+        assert [submission.id for submission in result] == sorted(ids)
+        assert count == len(ids)
+        assert sorted(requested_pages) == list(range(1, 11))
+
+    @pytest.mark.parametrize('fan_out', ['1', '4'])
+    async def test_stop_at_watermark(self, mocker, monkeypatch, fan_out):
+        monkeypatch.setenv('YANDEX_SUBMISSIONS_PAGES_FAN_OUT', fan_out)
+        reload_settings()
+        ids = list(range(950, 0, -1))
+        requested_pages = self.mock_listing(mocker, ids)
+        result, _ = await contest.get_new_submissions(
+            SimpleNamespace(yandex_contest_id=1), 780, logger=loguru.logger
+        )
+        assert [submission.id for submission in result] == list(
+            range(781, 951)
+        )
+        assert max(requested_pages) <= 1 + int(fan_out)
+
+    async def test_count_decreased_fallback(self, mocker, monkeypatch):
+        monkeypatch.setenv('YANDEX_SUBMISSIONS_PAGES_FAN_OUT', '4')
+        reload_settings()
+        ids = list(range(350, 0, -1))
+        self.mock_listing(mocker, ids, counts=[352, 350, 350, 350])
+        result, _ = await contest.get_new_submissions(
+            SimpleNamespace(yandex_contest_id=1), 0, logger=loguru.logger
+        )
+        assert [submission.id for submission in result] == sorted(ids)
+
+    async def test_count_changed_in_wave_fallback(self, mocker, monkeypatch):
+        monkeypatch.setenv('YANDEX_SUBMISSIONS_PAGES_FAN_OUT', '4')
+        reload_settings()
+        ids = list(range(350, 0, -1))
+        requested_pages = self.mock_listing(
+            mocker, ids, counts=[350, 350, 353, 350]
+        )
+        result, count = await contest.get_new_submissions(
+            SimpleNamespace(yandex_contest_id=1), 0, logger=loguru.logger
+        )
+        assert [submission.id for submission in result] == sorted(ids)
+        assert count == len(ids)
+        # pages are fetched again one by one from the first
+        assert requested_pages == [1, 2, 3, 4, 1, 2, 3, 4]
+
+    async def test_count_grew_serial_no_count(self, mocker, monkeypatch):
+        monkeypatch.setenv('YANDEX_SUBMISSIONS_PAGES_FAN_OUT', '1')
+        reload_settings()
+        ids = list(range(350, 0, -1))
+        self.mock_listing(mocker, ids, counts=[350, 355])
+        result, count = await contest.get_new_submissions(
+            SimpleNamespace(yandex_contest_id=1), 0, logger=loguru.logger
+        )
+        assert [submission.id for submission in result] == sorted(ids)
+        assert count is None
+
+    async def test_count_decreased_serial_no_submissions(
+        self, mocker, monkeypatch
+    ):
+        monkeypatch.setenv('YANDEX_SUBMISSIONS_PAGES_FAN_OUT', '1')
+        reload_settings()
+        ids = list(range(350, 0, -1))
+        self.mock_listing(mocker, ids, counts=[350, 340])
+        result, count = await contest.get_new_submissions(
+            SimpleNamespace(yandex_contest_id=1), 0, logger=loguru.logger
+        )
+        assert result == []
+        assert count is None
+
+    async def test_pages_budget(self, mocker, monkeypatch):
+        monkeypatch.setenv('YANDEX_SUBMISSIONS_PAGES_FAN_OUT', '8')
+        reload_settings()
+        ids = list(range(950, 0, -1))
+        requested_pages = self.mock_listing(mocker, ids)
+        result, count = await contest.get_new_submissions(
+            SimpleNamespace(yandex_contest_id=1),
+            700,
+            logger=loguru.logger,
+            known_count=700,
+        )
+        assert [submission.id for submission in result] == list(
+            range(701, 951)
+        )
+        assert count == len(ids)
+        assert requested_pages == [1, 2, 3]
+
+    async def test_count_not_changed(self, mocker):
+        ids = list(range(350, 0, -1))
+        requested_pages = self.mock_listing(mocker, ids)
+        result, count = await contest.get_new_submissions(
+            SimpleNamespace(yandex_contest_id=1),
+            300,
+            logger=loguru.logger,
+            known_count=len(ids),
+        )
+        assert result == []
+        assert count == len(ids)
+        assert requested_pages == [1]
+
+    async def test_not_complete_no_count(self, mocker):
+        ids = list(range(350, 0, -1))
+        self.mock_listing(mocker, ids)
+
+        async def _make_full_submissions(submissions, *args, **kwargs):
+            return [
+                SimpleNamespace(id=run_id)
+                for run_id in sorted(submissions)[:-10]
+            ]
+
+        mocker.patch(
+            'app.utils.contest.service.make_full_submissions',
+            side_effect=_make_full_submissions,
+        )
+        result, count = await contest.get_new_submissions(
+            SimpleNamespace(yandex_contest_id=1), 300, logger=loguru.logger
+        )
+        assert [submission.id for submission in result] == list(
+            range(301, 341)
+        )
+        assert count is None
+
+
+class TestMakeFullSubmissions:
+    @staticmethod
+    def mock_multiple(
+        mocker, bad_ids=(), missing_ids=(), requested_kwargs=None
+    ):
+        requested_batches = []
+        if requested_kwargs is None:
+            requested_kwargs = []
+
+        async def _request(endpoint, *args, **kwargs):
+            run_ids = list(map(int, re.findall(r'runIds=(\d+)', endpoint)))
+            requested_batches.append(run_ids)
+            requested_kwargs.append(kwargs)
+            request = httpx.Request('GET', endpoint)
+            if set(run_ids) & set(bad_ids):
+                raise httpx.ReadTimeout('timeout', request=request)
+            if set(run_ids) & set(missing_ids):
+                raise httpx.HTTPStatusError(
+                    'not found',
+                    request=request,
+                    response=httpx.Response(404, request=request),
+                )
+            return httpx.Response(
+                200,
+                json=[
+                    {
+                        'runId': run_id,
+                        'problemId': 'problem',
+                        'problemAlias': 'A',
+                        'verdict': 'OK',
+                        'participantInfo': {'login': 'login'},
+                        'submissionTime': '2023-01-01T00:00:00.000Z',
+                        'finalScore': '1',
+                    }
+                    for run_id in run_ids
+                ],
+            )
+
+        mocker.patch(
+            'app.utils.contest.service.make_request_to_yandex_contest_api',
+            side_effect=_request,
+        )
+        return requested_batches
+
+    @staticmethod
+    def make_submissions(ids):
+        return {
+            run_id: contest_schemas.ContestSubmission(
+                id=run_id,
+                authorId=1,
+                problemId='problem',
+                problemAlias='A',
+                verdict='OK',
+            )
+            for run_id in ids
+        }
+
+    async def test_ok(self, mocker):
+        requested_batches = self.mock_multiple(mocker)
+        result = await contest_service.make_full_submissions(
+            self.make_submissions(range(1, 351)),
+            SimpleNamespace(yandex_contest_id=1),
+            logger=loguru.logger,
+        )
+        assert [submission.id for submission in result] == list(range(1, 351))
+        assert len(requested_batches) == 4
+
+    async def test_failed_batch_split(self, mocker):
+        requested_batches = self.mock_multiple(mocker, bad_ids=[120])
+        result = await contest_service.make_full_submissions(
+            self.make_submissions(range(1, 351)),
+            SimpleNamespace(yandex_contest_id=1),
+            logger=loguru.logger,
+        )
+        # submissions after the failed one are left for the next sync
+        assert [submission.id for submission in result] == list(range(1, 120))
+        assert [120] in requested_batches
+
+    async def test_split_batch_requested_once(self, mocker):
+        requested_kwargs = []
+        requested_batches = self.mock_multiple(
+            mocker, bad_ids=[120], requested_kwargs=requested_kwargs
+        )
+        await contest_service.make_full_submissions(
+            self.make_submissions(range(101, 201)),
+            SimpleNamespace(yandex_contest_id=1),
+            logger=loguru.logger,
+        )
+        # the only batch is failed, all other requests are its halves
+        assert len(requested_batches) > 1
+        for run_ids, kwargs in zip(requested_batches, requested_kwargs):
+            if len(run_ids) == 100:
+                assert kwargs['retry_count'] == 5
+                assert kwargs['status_retry_count'] is None
+            else:
+                assert kwargs['retry_count'] == 1
+                assert kwargs['status_retry_count'] == 0
+
+    async def test_fetch_budget_exceeded(self, mocker, monkeypatch):
+        requested_batches = self.mock_multiple(mocker)
+        monkeypatch.setenv('YANDEX_SUBMISSIONS_FETCH_BUDGET', '0')
+        reload_settings()
+        result = await contest_service.make_full_submissions(
+            self.make_submissions(range(1, 351)),
+            SimpleNamespace(yandex_contest_id=1),
+            logger=loguru.logger,
+        )
+        # submissions are left for the next sync
+        assert result == []
+        assert requested_batches == []
+
+    async def test_missing_submission_skipped(self, mocker):
+        self.mock_multiple(mocker, missing_ids=[7])
+        result = await contest_service.make_full_submissions(
+            self.make_submissions(range(1, 11)),
+            SimpleNamespace(yandex_contest_id=1),
+            logger=loguru.logger,
+        )
+        assert [submission.id for submission in result] == [
+            1,
+            2,
+            3,
+            4,
+            5,
+            6,
+            8,
+            9,
+            10,
+        ]
@@ -0,0 +1,107 @@
+import loguru
+import pytest
+
+from app.database import models
+from app.schemas import CourseResults
+from app.utils import results as results_utils
+from app.utils.results import batch
+from tests import factory_lib, utils
+
+
+@pytest.fixture
+def snapshot():  # type: ignore
+    return CourseResults(
+        name='snapshot',
+        contests=[],
+        score_sum=1,
+        score_sum_no_deadline=2,
+        score_max=3,
+        is_ok=True,
+        is_ok_final=False,
+        early_exam=False,
+        perc_ok=0,
+        str_need='',
+        course_levels=[],
+    )
+
+
+@pytest.mark.usefixtures('migrated_postgres', 'student_department')
+class TestGetStudentsResults:
+    @pytest.mark.parametrize('chunk_size', [1, 500])
+    async def test_results(  # pylint: disable=too-many-arguments
+        self,
+        created_course,
+        created_student,
+        student_course,
+        session,
+        snapshot,
+        chunk_size,
+        monkeypatch,
+    ):
+        # arrange
+        monkeypatch.setattr(batch, 'BATCH_CHUNK_SIZE', chunk_size)
+        other_student = await utils.create_model(
+            session, factory_lib.StudentFactory.build()
+        )
+        await utils.create_model(
+            session,
+            models.StudentCourse(
+                student_id=other_student.id,
+                course_id=created_course.id,
+                results_snapshot=snapshot.dict(),
+            ),
+        )
+
+        # act
+        results = [
+            (contest_login, student_results)
+            async for (
+                contest_login,
+                student_results,
+            ) in results_utils.get_students_results(
+                session,
+                [
+                    other_student.contest_login,
+                    'unknown',
+                    created_student.contest_login,
+                ],
+                loguru.logger,
+            )
+        ]
+
+        # assert
+        assert [contest_login for contest_login, _ in results] == [
+            other_student.contest_login,
+            'unknown',
+            created_student.contest_login,
+        ]
+        other_results, unknown_results, student_results = [
+            student_results for _, student_results in results
+        ]
+        assert other_results.courses == [snapshot]
+        assert other_results.department == ''
+        assert unknown_results is None
+        # no snapshot, computed from relations
+        assert [course.name for course in student_results.courses] == [
+            created_course.name
+        ]
+        assert student_results.fio == created_student.fio
+
+    async def test_course_filter(
+        self, created_student, student_course, session
+    ):
+        other_course = await utils.create_model(
+            session, factory_lib.CourseFactory.build()
+        )
+
+        results = [
+            student_results
+            async for _, student_results in results_utils.get_students_results(
+                session,
+                [created_student.contest_login],
+                loguru.logger,
+                course_id=other_course.id,
+            )
+        ]
+
+        assert [student_results.courses for student_results in results] == [[]]
@@ -0,0 +1,381 @@
+import datetime
+import random
+import uuid
+
+import loguru
+import pytest
+
+from app.database import models
+from app.schemas import contest as contest_schemas
+from app.schemas import course as course_schemas
+from app.utils.results import evaluator
+from app.utils.results import matrix as results_matrix
+from app.utils.results import service as results_service
+
+
+CONTEST_LEVEL_NAMES = ['Зачет автоматом', 'Зачет', 'Допуск к зачету', 'Other']
+COURSE_LEVEL_NAMES = ['Зачет автоматом', 'Зачет', 'Досрочный зачет', 'Other']
+
+
+def _make_contest_level(
+    rnd: random.Random, course_id: uuid.UUID, contest: models.Contest
+) -> models.ContestLevels:
+    level_ok_method = rnd.choice(list(contest_schemas.LevelOkMethod))
+    count_method = rnd.choice(list(contest_schemas.LevelCountMethod))
+    if count_method == contest_schemas.LevelCountMethod.PERCENT:
+        ok_threshold = rnd.choice([0, 25, 50, 75, 100])
+    elif level_ok_method == contest_schemas.LevelOkMethod.TASKS_COUNT:
+        ok_threshold = rnd.randint(0, contest.tasks_count)
+    else:
+        ok_threshold = round(rnd.uniform(0, contest.score_max), 1)
+    return models.ContestLevels(
+        id=uuid.uuid4(),
+        course_id=course_id,
+        contest_id=contest.id,
+        level_name=rnd.choice(CONTEST_LEVEL_NAMES),
+        level_ok_method=level_ok_method,
+        count_method=count_method,
+        ok_threshold=ok_threshold,
+        include_after_deadline=level_ok_method
+        == contest_schemas.LevelOkMethod.SCORE_SUM
+        and rnd.random() < 0.5,
+    )
+
+
+def _make_course_level(
+    rnd: random.Random, course_id: uuid.UUID
+) -> models.CourseLevels:
+    data = []
+    for _ in range(rnd.randint(0, 2)):
+        count_method = rnd.choice(list(course_schemas.LevelCountMethod))
+        level_ok_method = rnd.choice(list(course_schemas.LevelOkMethod))
+        data.append(
+            {
+                'level_ok_method': level_ok_method,
+                'count_method': count_method,
+                'ok_threshold': rnd.choice([0, 25, 50, 75, 100])
+                if count_method == course_schemas.LevelCountMethod.PERCENT
+                else rnd.randint(0, 10),
+                'contest_ok_level_name': rnd.choice(CONTEST_LEVEL_NAMES),
+                # every student has a contest with no tags filter,
+                # so percents are never divided by zero
+                'tags': []
+                if count_method == course_schemas.LevelCountMethod.PERCENT
+                else rnd.sample(list(contest_schemas.ContestTag), 1),
+            }
+        )
+    return models.CourseLevels(
+        id=uuid.uuid4(),
+        course_id=course_id,
+        level_name=rnd.choice(COURSE_LEVEL_NAMES),
+        result_update_end=datetime.datetime(2000, 1, 1)
+        if rnd.random() < 0.2
+        else None,
+        level_info={'data': data} if rnd.random() < 0.9 else {},
+    )
+
+
+def _make_course(seed: int):  # type: ignore  # pylint: disable=too-many-locals
+    rnd = random.Random(seed)
+    course_id = uuid.uuid4()
+    students = [
+        models.Student(id=uuid.uuid4(), contest_login=f'login_{i}')
+        for i in range(rnd.randint(1, 8))
+    ]
+    student_courses = [
+        models.StudentCourse(
+            id=uuid.uuid4(),
+            course_id=course_id,
+            student_id=student.id,
+            is_ok=rnd.random() < 0.2,
+            contests_ok=rnd.randint(0, 2),
+            score=0.0,
+        )
+        for student in students
+    ]
+    contests = []
+    for _ in range(rnd.randint(1, 5)):
+        contest = models.Contest(
+            id=uuid.uuid4(),
+            course_id=course_id,
+            score_max=rnd.choice([2, 3, 5, 10]),
+            tasks_count=rnd.randint(1, 5),
+            tags=rnd.sample(
+                list(contest_schemas.ContestTag),
+                rnd.randint(0, len(contest_schemas.ContestTag)),
+            ),
+        )
+        levels = [
+            _make_contest_level(rnd, course_id, contest)
+            for _ in range(rnd.randint(0, 3))
+        ]
+        contests.append((contest, levels))
+    student_contests = []
+    student_contest_levels = []
+    for student in students:
+        related = [
+            index for index in range(len(contests)) if rnd.random() < 0.7
+        ] or [rnd.randrange(len(contests))]
+        for index in related:
+            contest, levels = contests[index]
+            score = round(rnd.uniform(0, contest.score_max), 2)
+            student_contests.append(
+                models.StudentContest(
+                    id=uuid.uuid4(),
+                    course_id=course_id,
+                    contest_id=contest.id,
+                    student_id=student.id,
+                    score=score,
+                    score_no_deadline=round(
+                        rnd.uniform(score, contest.score_max), 2
+                    ),
+                    tasks_done=rnd.randint(0, contest.tasks_count),
+                    is_ok=rnd.random() < 0.2,
+                    is_ok_no_deadline=rnd.random() < 0.2,
+                )
+            )
+            student_contest_levels.extend(
+                models.StudentContestLevels(
+                    id=uuid.uuid4(),
+                    course_id=course_id,
+                    contest_id=contest.id,
+                    student_id=student.id,
+                    contest_level_id=level.id,
+                    is_ok=rnd.random() < 0.3,
+                )
+                for level in levels
+                if rnd.random() < 0.6
+            )
+    # a contest with no tags for percent course levels
+    contests[0][0].tags = []
+    for student in students:
+        if not any(
+            student_contest.contest_id == contests[0][0].id
+            and student_contest.student_id == student.id
+            for student_contest in student_contests
+        ):
+            student_contests.append(
+                models.StudentContest(
+                    id=uuid.uuid4(),
+                    course_id=course_id,
+                    contest_id=contests[0][0].id,
+                    student_id=student.id,
+                    score=0.0,
+                    score_no_deadline=0.0,
+                    tasks_done=0,
+                    is_ok=False,
+                    is_ok_no_deadline=False,
+                )
+            )
+    course_levels = [
+        _make_course_level(rnd, course_id) for _ in range(rnd.randint(1, 3))
+    ]
+    student_course_levels = [
+        models.StudentCourseLevels(
+            id=uuid.uuid4(),
+            course_id=course_id,
+            student_id=student.id,
+            course_level_id=level.id,
+            is_ok=rnd.random() < 0.3,
+        )
+        for student in students
+        for level in course_levels
+        if rnd.random() < 0.6
+    ]
+    return (
+        course_id,
+        students,
+        student_courses,
+        contests,
+        student_contests,
+        student_contest_levels,
+        course_levels,
+        student_course_levels,
+    )
+
+
+async def _evaluate_scalar(  # pylint: disable=too-many-arguments,too-many-locals
+    mocker,
+    students,
+    student_courses,
+    contests,
+    student_contests,
+    student_contest_levels,
+    course_levels,
+    student_course_levels,
+) -> results_matrix.CourseLevelsChanges:
+    session = mocker.MagicMock()
+    changes = results_matrix.CourseLevelsChanges()
+    old_values = {
+        id(level): level.is_ok
+        for level in [*student_contest_levels, *student_course_levels]
+    }
+    for student, student_course in zip(students, student_courses):
+        old_course = (student_course.is_ok, student_course.contests_ok)
+        contests_data_all = []
+        for contest, levels in contests:
+            student_contest = next(
+                (
+                    relation
+                    for relation in student_contests
+                    if relation.contest_id == contest.id
+                    and relation.student_id == student.id
+                ),
+                None,
+            )
+            if student_contest is None:
+                continue
+            levels = sorted(
+                levels, key=lambda x: (x.count_method, x.ok_threshold)
+            )
+            contests_data_all.append(
+                (
+                    contest,
+                    student_contest,
+                    levels,
+                    [
+                        next(
+                            (
+                                level_model
+                                for level_model in student_contest_levels
+                                if level_model.contest_level_id == level.id
+                                and level_model.student_id == student.id
+                            ),
+                            None,
+                        )
+                        or models.StudentContestLevels(
+                            contest_level_id=level.id, is_ok=False
+                        )
+                        for level in levels
+                    ],
+                )
+            )
+        old_contests = {
+            contest.id: (
+                student_contest.is_ok,
+                student_contest.is_ok_no_deadline,
+            )
+            for contest, student_contest, _, _ in contests_data_all
+        }
+        for (
+            contest,
+            student_contest,
+            levels,
+            levels_models,
+        ) in contests_data_all:
+            await results_service.update_student_contest_levels_results(
+                student,
+                student_course,
+                contest,
+                student_contest,
+                levels,
+                levels_models,
+                logger=loguru.logger,
+                session=session,
+            )
+        course_levels_models = [
+            next(
+                (
+                    level_model
+                    for level_model in student_course_levels
+                    if level_model.course_level_id == level.id
+                    and level_model.student_id == student.id
+                ),
+                None,
+            )
+            or models.StudentCourseLevels(
+                course_level_id=level.id, is_ok=False
+            )
+            for level in course_levels
+        ]
+        await results_service.update_student_course_levels_results(
+            student,
+            student_course,
+            course_levels,
+            course_levels_models,
+            contests_data_all,
+            logger=loguru.logger,
+            session=session,
+        )
+
+        for contest, student_contest, _, levels_models in contests_data_all:
+            for level_model in levels_models:
+                if old_values.get(id(level_model)) != level_model.is_ok:
+                    changes.student_contest_levels[
+                        (student.id, contest.id, level_model.contest_level_id)
+                    ] = level_model.is_ok
+            new_contest = (
+                student_contest.is_ok,
+                student_contest.is_ok_no_deadline,
+            )
+            if new_contest != old_contests[contest.id]:
+                changes.student_contests[
+                    (student.id, contest.id)
+                ] = new_contest
+        for level_model in course_levels_models:
+            if old_values.get(id(level_model)) != level_model.is_ok:
+                changes.student_course_levels[
+                    (student.id, level_model.course_level_id)
+                ] = level_model.is_ok
+        new_course = (student_course.is_ok, student_course.contests_ok)
+        if new_course != old_course:
+            changes.student_courses[student.id] = new_course
+    return changes
+
+
+@pytest.mark.parametrize('seed', range(100))
+async def test_same_as_scalar_evaluation(seed, mocker):
+    # arrange
+    (
+        course_id,
+        students,
+        student_courses,
+        contests,
+        student_contests,
+        student_contest_levels,
+        course_levels,
+        student_course_levels,
+    ) = _make_course(seed)
+    matrix = results_matrix.make_course_matrix(
+        course_id,
+        student_courses,
+        contests,
+        student_contests,
+        student_contest_levels,
+        course_levels,
+        student_course_levels,
+    )
+
+    # act
+    changes = evaluator.evaluate_course_levels(matrix)
+    expected = await _evaluate_scalar(
+        mocker,
+        students,
+        student_courses,
+        contests,
+        student_contests,
+        student_contest_levels,
+        course_levels,
+        student_course_levels,
+    )
+
+    # assert
+    assert changes == expected
+
+
+def test_matrix_is_not_changed():
+    # arrange
+    (
+        course_id,
+        _,
+        *models_lists,
+    ) = _make_course(0)
+    matrix = results_matrix.make_course_matrix(course_id, *models_lists)
+
+    # act
+    first_changes = evaluator.evaluate_course_levels(matrix)
+    second_changes = evaluator.evaluate_course_levels(matrix)
+
+    # assert
+    assert first_changes == second_changes
+    assert first_changes.student_contest_levels
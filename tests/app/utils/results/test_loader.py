@@ -0,0 +1,90 @@
+import pytest
+import sqlalchemy as sa
+
+from app.database import models
+from app.schemas import contest as contest_schemas
+from app.utils import results as results_utils
+from tests import factory_lib, utils
+
+
+@pytest.mark.usefixtures('migrated_postgres', 'student_department')
+class TestGetCourseLevelsData:
+    async def test_missing_levels_created(  # pylint: disable=too-many-arguments
+        self,
+        created_course,
+        created_contest,
+        student_course,
+        student_contest,
+        session,
+        create_async_session,
+    ):
+        # arrange
+        contest_levels = [
+            await utils.create_model(
+                session,
+                factory_lib.ContestLevelsFactory.build(
+                    course_id=created_course.id,
+                    contest_id=created_contest.id,
+                    level_name=level_name,
+                    level_ok_method=contest_schemas.LevelOkMethod.SCORE_SUM,
+                    count_method=contest_schemas.LevelCountMethod.PERCENT,
+                    ok_threshold=ok_threshold,
+                    include_after_deadline=False,
+                ),
+            )
+            for level_name, ok_threshold in (('Зачет', 100), ('Допуск', 50))
+        ]
+        course_level = await utils.create_model(
+            session,
+            factory_lib.CourseLevelsFactory.build(
+                course_id=created_course.id, level_info={'data': []}
+            ),
+        )
+        existing_level = await utils.create_model(
+            session,
+            factory_lib.StudentContestLevelsFactory.build(
+                course_id=created_course.id,
+                contest_id=created_contest.id,
+                student_id=student_course.student_id,
+                contest_level_id=contest_levels[0].id,
+                is_ok=True,
+            ),
+        )
+        student_id = student_course.student_id
+
+        # act
+        async with create_async_session() as new_session:
+            first_data = await results_utils.get_course_levels_data(
+                new_session, created_course, [course_level]
+            )
+        async with create_async_session() as new_session:
+            second_data = await results_utils.get_course_levels_data(
+                new_session, created_course, [course_level]
+            )
+            levels_count = await new_session.scalar(
+                sa.select(sa.func.count()).select_from(
+                    models.StudentContestLevels
+                )
+            )
+
+        # assert
+        assert levels_count == 2
+        assert [
+            level.id
+            for level in first_data.get_student_course_levels(student_id)
+        ] == [
+            level.id
+            for level in second_data.get_student_course_levels(student_id)
+        ]
+        [
+            (contest, relation, levels, student_levels)
+        ] = second_data.get_student_course_contests_data(student_id)
+        assert contest.id == created_contest.id
+        assert relation.id == student_contest.id
+        assert [level.id for level in levels] == [
+            contest_levels[1].id,
+            contest_levels[0].id,
+        ]
+        assert student_levels[1].id == existing_level.id
+        assert student_levels[1].is_ok
+        assert not student_levels[0].is_ok
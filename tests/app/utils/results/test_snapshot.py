@@ -0,0 +1,133 @@
+import loguru
+import pytest
+import sqlalchemy as sa
+
+from app.database import models
+from app.database.connection import SessionManager
+from app.schemas import CourseResults
+from app.schemas import contest as contest_schemas
+from app.utils import course as course_utils
+from app.utils import results as results_utils
+from tests import factory_lib, utils
+
+
+@pytest.mark.usefixtures('migrated_postgres', 'student_department')
+class TestLoadStudentCourseResults:
+    async def test_no_snapshot(  # pylint: disable=too-many-arguments
+        self,
+        created_course,
+        created_contest,
+        created_student,
+        student_course,
+        student_contest,
+        session,
+        create_async_session,
+    ):
+        # arrange
+        await utils.create_model(
+            session,
+            factory_lib.ContestLevelsFactory.build(
+                course_id=created_course.id,
+                contest_id=created_contest.id,
+                level_name='Зачет',
+                level_ok_method=contest_schemas.LevelOkMethod.SCORE_SUM,
+                count_method=contest_schemas.LevelCountMethod.PERCENT,
+                ok_threshold=50,
+                include_after_deadline=False,
+            ),
+        )
+        await utils.create_model(
+            session,
+            factory_lib.CourseLevelsFactory.build(
+                course_id=created_course.id,
+                level_name='Зачет',
+                level_info={'data': []},
+            ),
+        )
+
+        # act
+        async with SessionManager().create_read_only_async_session() as (
+            read_only_session
+        ):
+            student_course_model = (
+                await results_utils.get_student_course_with_snapshot(
+                    read_only_session, created_student.id, created_course.id
+                )
+            )
+            course_results = await results_utils.load_student_course_results(
+                read_only_session,
+                created_student,
+                created_course,
+                student_course_model,
+                logger=loguru.logger,
+            )
+
+        # assert
+        assert student_course_model.results_snapshot is None
+        assert course_results.name == created_course.name
+        ((contest_level,),) = [
+            contest.levels for contest in course_results.contests
+        ]
+        assert not contest_level.is_ok
+        assert [level.is_ok for level in course_results.course_levels] == [
+            False
+        ]
+        # missing levels are not created
+        async with create_async_session() as new_session:
+            for model in (
+                models.StudentContestLevels,
+                models.StudentCourseLevels,
+            ):
+                assert not (await new_session.execute(sa.select(model))).all()
+
+    async def test_read_only_session(self, created_course, created_student):
+        with pytest.raises(sa.exc.DBAPIError, match='read-only'):
+            async with SessionManager().create_read_only_async_session() as (
+                session
+            ):
+                await course_utils.add_student_to_course(
+                    session, created_student.id, created_course.id
+                )
+
+    async def test_snapshot(
+        self,
+        created_course,
+        created_student,
+        student_course,
+        session,
+    ):
+        # arrange
+        snapshot = CourseResults(
+            name='snapshot',
+            contests=[],
+            score_sum=1,
+            score_sum_no_deadline=2,
+            score_max=3,
+            is_ok=True,
+            is_ok_final=False,
+            early_exam=False,
+            perc_ok=0,
+            str_need='',
+            course_levels=[],
+        )
+        await results_utils.save_course_results_snapshots(
+            session, created_course.id, {created_student.id: snapshot.dict()}
+        )
+        await session.commit()
+
+        # act
+        (
+            (course, student_course_model),
+        ) = await results_utils.get_student_courses_with_snapshots(
+            session, created_student.id
+        )
+        course_results = await results_utils.load_student_course_results(
+            session,
+            created_student,
+            course,
+            student_course_model,
+            logger=loguru.logger,
+        )
+
+        # assert
+        assert course_results == snapshot
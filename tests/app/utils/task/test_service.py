@@ -1,3 +1,5 @@
+import random
+
 import pytest
 
 from app.utils import task as task_utils
@@ -15,3 +17,66 @@ class TestEvalExpr:
     )
     def test_ok(self, expr, value):
         assert task_utils.eval_expr(expr) == value
+
+
+FORMULAS = [
+    '{best_score_before_finish}',
+    '{best_score_no_deadline}',
+    'max({best_score_before_finish}, {best_score_no_deadline} * 0.5)',
+    'min({best_score_before_finish} + 1, 2 ** {best_score_no_deadline})',
+    '{best_score_before_finish} - -{best_score_no_deadline} / 4',
+    '({best_score_no_deadline} - {best_score_before_finish}) / 3',
+    '1{best_score_before_finish}',
+    '{best_score_before_finish}0',
+    '{best_score_no_deadline:.1f} + 1',
+]
+
+
+class TestEvaluateFormula:
+    @pytest.mark.parametrize('formula', FORMULAS)
+    def test_same_as_eval_expr(self, formula):
+        rnd = random.Random(formula)
+        values = [0, 1, 2.5, 3, -1, -0.0, 0.0, 10**6]
+        values += [rnd.choice([rnd.randint(0, 100), rnd.random() * 10])]
+        before = [rnd.choice(values) for _ in range(50)]
+        no_deadline = [rnd.choice(values) for _ in range(50)]
+        expected = [
+            task_utils.eval_expr(
+                formula.format(
+                    best_score_before_finish=before_finish,
+                    best_score_no_deadline=score_no_deadline,
+                )
+            )
+            for before_finish, score_no_deadline in zip(before, no_deadline)
+        ]
+        assert [
+            task_utils.evaluate_formula(
+                formula,
+                best_score_before_finish=before_finish,
+                best_score_no_deadline=score_no_deadline,
+            )
+            for before_finish, score_no_deadline in zip(before, no_deadline)
+        ] == expected
+        assert (
+            task_utils.evaluate_formula_batch(formula, before, no_deadline)
+            == expected
+        )
+
+    @pytest.mark.parametrize(
+        'formula',
+        [
+            '{best_score}',
+            '{best_score_before_finish} +',
+            'abs({best_score_before_finish})',
+            '{best_score_before_finish}.real',
+            '"{best_score_before_finish}"',
+            '{best_score_before_finish} % 3',
+        ],
+    )
+    def test_validate_bad_formula(self, formula):
+        with pytest.raises(ValueError):
+            task_utils.validate_formula(formula)
+
+    @pytest.mark.parametrize('formula', FORMULAS)
+    def test_validate_ok(self, formula):
+        task_utils.validate_formula(formula)
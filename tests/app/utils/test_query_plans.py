@@ -0,0 +1,266 @@
+# pylint: disable=too-many-locals
+
+import contextlib
+import typing as tp
+from datetime import datetime, timezone
+from types import SimpleNamespace
+
+import pytest
+from sqlalchemy import event, text
+
+from app.schemas import contest as contest_schemas
+from app.utils import contest as contest_utils
+from app.utils import course as course_utils
+from app.utils import results as results_utils
+from app.utils import student as student_utils
+from app.utils import submission as submission_utils
+from app.utils import task as task_utils
+from tests import factory_lib
+
+
+pytestmark = pytest.mark.asyncio
+
+STUDENTS_COUNT = 50
+CONTESTS_COUNT = 2
+TASKS_COUNT = 4
+
+
+@contextlib.contextmanager
+def capture_statements(engine) -> tp.Iterator[list[tuple[str, tp.Any]]]:
+    statements = []
+
+    def _before_cursor_execute(  # pylint: disable=too-many-arguments
+        conn, cursor, statement, parameters, context, executemany
+    ):
+        statements.append((statement, parameters))
+
+    event.listen(engine, 'before_cursor_execute', _before_cursor_execute)
+    try:
+        yield statements
+    finally:
+        event.remove(engine, 'before_cursor_execute', _before_cursor_execute)
+
+
+@pytest.fixture
+async def seeded_data(session):  # type: ignore
+    course = factory_lib.CourseFactory.build()
+    students = factory_lib.StudentFactory.build_batch(STUDENTS_COUNT)
+    session.add_all([course, *students])
+    await session.flush()
+    course_level = factory_lib.CourseLevelsFactory.build(course_id=course.id)
+    session.add(course_level)
+    await session.flush()
+    session.add_all(
+        [
+            factory_lib.StudentCourseFactory.build(
+                student_id=student.id, course_id=course.id
+            )
+            for student in students
+        ]
+        + [
+            factory_lib.StudentCourseLevelsFactory.build(
+                student_id=student.id,
+                course_id=course.id,
+                course_level_id=course_level.id,
+            )
+            for student in students
+        ]
+    )
+    contests, tasks, contest_levels = [], [], []
+    for i in range(CONTESTS_COUNT):
+        contest = factory_lib.ContestFactory.build(course_id=course.id)
+        session.add(contest)
+        await session.flush()
+        contests.append(contest)
+        contest_levels.append(
+            factory_lib.ContestLevelsFactory.build(
+                course_id=course.id,
+                contest_id=contest.id,
+                level_ok_method=contest_schemas.LevelOkMethod.SCORE_SUM,
+                count_method=contest_schemas.LevelCountMethod.ABSOLUTE,
+            )
+        )
+        tasks.extend(
+            factory_lib.TaskFactory.build_batch(
+                TASKS_COUNT, contest_id=contest.id
+            )
+        )
+    session.add_all(contests + contest_levels + tasks)
+    await session.flush()
+    models = []
+    for i, contest in enumerate(contests):
+        for j, student in enumerate(students):
+            models.append(
+                factory_lib.StudentContestFactory.build(
+                    course_id=course.id,
+                    contest_id=contest.id,
+                    student_id=student.id,
+                    author_id=i * STUDENTS_COUNT + j,
+                )
+            )
+            models.append(
+                factory_lib.StudentContestLevelsFactory.build(
+                    course_id=course.id,
+                    contest_id=contest.id,
+                    student_id=student.id,
+                    contest_level_id=contest_levels[i].id,
+                )
+            )
+    session.add_all(models)
+    student_tasks = [
+        factory_lib.StudentTaskFactory.build(
+            course_id=course.id,
+            contest_id=task.contest_id,
+            task_id=task.id,
+            student_id=student.id,
+        )
+        for task in tasks
+        for student in students
+    ]
+    session.add_all(student_tasks)
+    await session.flush()
+    session.add_all(
+        [
+            factory_lib.SubmissionFactory.build(
+                course_id=course.id,
+                contest_id=student_task.contest_id,
+                task_id=student_task.task_id,
+                student_id=student_task.student_id,
+                student_task_id=student_task.id,
+                run_id=i,
+                verdict='No report' if i % 10 == 0 else 'OK',
+                next_verdict_check_at=None,
+            )
+            for i, student_task in enumerate(student_tasks)
+        ]
+    )
+    await session.commit()
+    await session.execute(text('ANALYZE'))
+    yield SimpleNamespace(
+        course=course,
+        course_level=course_level,
+        contest=contests[0],
+        contest_level=contest_levels[0],
+        task=tasks[0],
+        student=students[0],
+    )
+
+
+HOT_QUERIES: dict[
+    str, tp.Callable[[tp.Any, SimpleNamespace], tp.Awaitable]
+] = {
+    'get_last_updated_submission': lambda session, data: (
+        submission_utils.get_last_updated_submission(session, data.contest.id)
+    ),
+    'get_submission': lambda session, data: (
+        submission_utils.get_submission(session, 1)
+    ),
+    'get_submission_ids_by_run_ids': lambda session, data: (
+        submission_utils.get_submission_ids_by_run_ids(session, [1, 2, 3])
+    ),
+    'get_no_verdict_submissions': lambda session, data: (
+        submission_utils.get_no_verdict_submissions(
+            session, datetime.now(timezone.utc)
+        )
+    ),
+    'get_student_task_relation': lambda session, data: (
+        task_utils.get_student_task_relation(
+            session, data.student.id, data.task.id
+        )
+    ),
+    'get_student_tasks': lambda session, data: (
+        task_utils.get_student_tasks(
+            session, data.contest.id, [data.student.id]
+        )
+    ),
+    'get_or_create_student_tasks': lambda session, data: (
+        task_utils.get_or_create_student_tasks(
+            session,
+            data.course.id,
+            data.contest.id,
+            [(data.student.id, data.task.id)],
+        )
+    ),
+    'get_student_contest_relation': lambda session, data: (
+        contest_utils.get_student_contest_relation(
+            session, data.student.id, data.contest.id
+        )
+    ),
+    'get_student_contest_relations': lambda session, data: (
+        contest_utils.get_student_contest_relations(session, data.contest.id)
+    ),
+    'get_or_create_student_contest_level': lambda session, data: (
+        contest_utils.get_or_create_student_contest_level(
+            session,
+            data.student.id,
+            data.course.id,
+            data.contest.id,
+            data.contest_level.id,
+        )
+    ),
+    'get_contests_sync_states': lambda session, data: (
+        contest_utils.get_contests_sync_states(session, [data.contest.id])
+    ),
+    'get_student_course': lambda session, data: (
+        course_utils.get_student_course(
+            session, data.student.id, data.course.id
+        )
+    ),
+    'get_or_create_student_course_level': lambda session, data: (
+        course_utils.get_or_create_student_course_level(
+            session, data.student.id, data.course.id, data.course_level.id
+        )
+    ),
+    'get_or_create_all_student_models': lambda session, data: (
+        student_utils.get_or_create_all_student_models(
+            session, data.course.id, data.contest.id, 0
+        )
+    ),
+    'get_students_by_contest_logins_with_department': lambda session, data: (
+        student_utils.get_students_by_contest_logins_with_department(
+            session, [data.student.contest_login]
+        )
+    ),
+    'get_students_courses_with_snapshots': lambda session, data: (
+        results_utils.get_students_courses_with_snapshots(
+            session, [data.student.id], data.course.id
+        )
+    ),
+    'get_student_course_levels_data': lambda session, data: (
+        results_utils.get_student_course_levels_data(
+            session, data.course, [data.course_level], [data.student.id]
+        )
+    ),
+    'get_all_student_models_by_author_ids': lambda session, data: (
+        student_utils.get_all_student_models_by_author_ids(
+            session, data.course.id, data.contest.id, [0, 1, 2]
+        )
+    ),
+}
+
+
+class TestQueryPlans:
+    async def test_no_seq_scan(self, session, seeded_data):
+        """
+        Hot queries must be served by indexes.
+
+        Sequential scans are disabled for the planner, so a plan still
+        has one only if no index fits the query.
+        """
+        seq_scans = {}
+        for name, query in HOT_QUERIES.items():
+            with capture_statements(session.bind.sync_engine) as statements:
+                await query(session, seeded_data)
+            assert statements, name
+            await session.execute(text('SET enable_seqscan = off'))
+            connection = await session.connection()
+            for statement, parameters in statements:
+                plan = '\n'.join(
+                    row[0]
+                    for row in await connection.exec_driver_sql(
+                        f'EXPLAIN {statement}', parameters
+                    )
+                )
+                if 'Seq Scan' in plan:
+                    seq_scans[name] = plan
+        assert not seq_scans, seq_scans
@@ -0,0 +1,23 @@
+import pytest
+
+from app.utils import yandex_request
+
+
+pytestmark = pytest.mark.asyncio
+
+
+class TestYandexClientManager:
+    async def test_client_is_shared(self):
+        client = yandex_request.get_yandex_client()
+        assert yandex_request.get_yandex_client() is client
+        assert yandex_request.YandexClientManager().client is client
+        await yandex_request.close_yandex_client()
+
+    async def test_client_recreated_after_close(self):
+        client = yandex_request.get_yandex_client()
+        await yandex_request.close_yandex_client()
+        assert client.is_closed
+        new_client = yandex_request.get_yandex_client()
+        assert new_client is not client
+        assert not new_client.is_closed
+        await yandex_request.close_yandex_client()
@@ -0,0 +1,233 @@
+import asyncio
+import email.utils
+import time
+
+import httpx
+import loguru
+import pytest
+
+from app.utils import yandex_request
+from app.utils.yandex_request import governor as governor_module
+
+
+@pytest.fixture
+def no_backoff(mocker):
+    mocker.patch(
+        'app.utils.yandex_request.service.get_backoff_delay',
+        return_value=0.0,
+    )
+
+
+@pytest.fixture
+def mock_yandex_client(mocker):
+    def _mock(handler):
+        client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+        mocker.patch(
+            'app.utils.yandex_request.service.get_yandex_client',
+            return_value=client,
+        )
+        return client
+
+    return _mock
+
+
+class TestRateGovernor:
+    async def test_concurrency_limited(self):
+        governor = yandex_request.RateGovernor(
+            rate=0, burst=1, max_concurrency=2
+        )
+        max_in_flight = 0
+
+        async def _request():
+            nonlocal max_in_flight
+            async with governor.slot():
+                max_in_flight = max(max_in_flight, governor.stats.in_flight)
+                await asyncio.sleep(0.01)
+
+        await asyncio.gather(*[_request() for _ in range(6)])
+        assert max_in_flight == 2
+        assert governor.stats.acquired_count == 6
+        assert governor.stats.queue_depth == 0
+        assert governor.stats.max_wait_time > 0
+
+    async def test_rate_limited(self):
+        governor = yandex_request.RateGovernor(
+            rate=50, burst=1, max_concurrency=10
+        )
+        start = time.monotonic()
+        for _ in range(6):
+            async with governor.slot():
+                pass
+        assert time.monotonic() - start >= 0.09
+
+    async def test_pause(self):
+        governor = yandex_request.RateGovernor(
+            rate=0, burst=1, max_concurrency=10
+        )
+        governor.pause(0.05)
+        async with governor.slot() as wait_time:
+            assert wait_time >= 0.04
+        assert governor.stats.throttled_count == 1
+
+
+class TestParseRetryAfter:
+    @pytest.mark.parametrize(
+        'value,expected',
+        [
+            pytest.param(None, None),
+            pytest.param('', None),
+            pytest.param('3', 3.0),
+            pytest.param('-1', 0.0),
+            pytest.param('not a date', None),
+        ],
+    )
+    def test_ok(self, value, expected):
+        assert governor_module.parse_retry_after(value) == expected
+
+    def test_http_date(self):
+        value = email.utils.formatdate(time.time() + 60, usegmt=True)
+        assert 55 < governor_module.parse_retry_after(value) <= 60
+
+
+class TestMakeRequestRetries:
+    async def test_retry_after_on_429(self, no_backoff, mock_yandex_client):
+        calls = []
+
+        def handler(request):
+            calls.append(request)
+            if len(calls) == 1:
+                return httpx.Response(429, headers={'Retry-After': '0'})
+            return httpx.Response(200, json={'ok': True})
+
+        mock_yandex_client(handler)
+        response = await yandex_request.make_request_to_yandex_contest_api(
+            'contests/1', logger=loguru.logger
+        )
+        assert response.status_code == 200
+        assert len(calls) == 2
+
+    async def test_server_error_retries_exhausted(
+        self, no_backoff, mock_yandex_client
+    ):
+        calls = []
+
+        def handler(request):
+            calls.append(request)
+            return httpx.Response(503)
+
+        mock_yandex_client(handler)
+        with pytest.raises(httpx.HTTPStatusError):
+            await yandex_request.make_request_to_yandex_contest_api(
+                'contests/1', logger=loguru.logger
+            )
+        assert len(calls) == 4
+
+    async def test_client_error_not_retried(
+        self, no_backoff, mock_yandex_client
+    ):
+        calls = []
+
+        def handler(request):
+            calls.append(request)
+            return httpx.Response(404)
+
+        mock_yandex_client(handler)
+        with pytest.raises(httpx.HTTPStatusError):
+            await yandex_request.make_request_to_yandex_contest_api(
+                'contests/1', logger=loguru.logger
+            )
+        assert len(calls) == 1
+
+    async def test_timeout_retries(self, no_backoff, mock_yandex_client):
+        calls = []
+
+        def handler(request):
+            calls.append(request)
+            if len(calls) < 3:
+                raise httpx.ReadTimeout('timeout', request=request)
+            return httpx.Response(200, json={'ok': True})
+
+        mock_yandex_client(handler)
+        with pytest.raises(httpx.ReadTimeout):
+            await yandex_request.make_request_to_yandex_contest_api(
+                'contests/1', logger=loguru.logger, retry_count=2
+            )
+        calls.clear()
+        response = await yandex_request.make_request_to_yandex_contest_api(
+            'contests/1', logger=loguru.logger, retry_count=3
+        )
+        assert response.status_code == 200
+
+    async def test_post_server_error_not_retried(
+        self, no_backoff, mock_yandex_client
+    ):
+        calls = []
+
+        def handler(request):
+            calls.append(request)
+            return httpx.Response(503)
+
+        mock_yandex_client(handler)
+        with pytest.raises(httpx.HTTPStatusError):
+            await yandex_request.make_request_to_yandex_contest_api(
+                'contests/1/participants', logger=loguru.logger, method='POST'
+            )
+        assert len(calls) == 1
+
+    async def test_post_retry_after_on_429(
+        self, no_backoff, mock_yandex_client
+    ):
+        calls = []
+
+        def handler(request):
+            calls.append(request)
+            if len(calls) == 1:
+                return httpx.Response(429, headers={'Retry-After': '0'})
+            return httpx.Response(201)
+
+        mock_yandex_client(handler)
+        response = await yandex_request.make_request_to_yandex_contest_api(
+            'contests/1/participants', logger=loguru.logger, method='POST'
+        )
+        assert response.status_code == 201
+        assert len(calls) == 2
+
+    async def test_post_timeout_not_retried(
+        self, no_backoff, mock_yandex_client
+    ):
+        calls = []
+
+        def handler(request):
+            calls.append(request)
+            raise httpx.ReadTimeout('timeout', request=request)
+
+        mock_yandex_client(handler)
+        with pytest.raises(httpx.ReadTimeout):
+            await yandex_request.make_request_to_yandex_contest_api(
+                'contests/1/participants',
+                logger=loguru.logger,
+                method='POST',
+                retry_count=3,
+            )
+        assert len(calls) == 1
+
+    async def test_post_connect_error_retries(
+        self, no_backoff, mock_yandex_client
+    ):
+        calls = []
+
+        def handler(request):
+            calls.append(request)
+            if len(calls) == 1:
+                raise httpx.ConnectError('refused', request=request)
+            return httpx.Response(201)
+
+        mock_yandex_client(handler)
+        response = await yandex_request.make_request_to_yandex_contest_api(
+            'contests/1/participants',
+            logger=loguru.logger,
+            method='POST',
+            retry_count=2,
+        )
+        assert response.status_code == 201
+        assert len(calls) == 2
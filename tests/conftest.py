@@ -21,7 +21,7 @@ from alembic.config import Config
 from httpx import AsyncClient
 from sqlalchemy_utils import create_database, database_exists, drop_database
 
-from app.config import get_settings
+from app.config import get_settings, reload_settings
 from app.creator import get_app
 from app.database.connection import SessionManager
 from app.schemas import contest as contest_schemas
@@ -42,6 +42,14 @@ def event_loop():
     loop.close()
 
 
+@pytest.fixture(autouse=True)
+def fresh_settings():  # type: ignore
+    """
+    Reads settings from environment for every test.
+    """
+    yield reload_settings()
+
+
 @pytest.fixture()
 def postgres() -> str:  # type: ignore
     """
@@ -87,7 +95,7 @@ def migrated_postgres(alembic_config: Config):
 
 
 @pytest.fixture
-def create_async_session(  # type: ignore
+async def create_async_session(  # type: ignore
     migrated_postgres, manager: SessionManager = SessionManager()
 ) -> tp.Callable:  # type: ignore
     """
@@ -96,6 +104,7 @@ def create_async_session(  # type: ignore
     """
     manager.refresh()  # Very important! Use this in `client` function.
     yield manager.create_async_session
+    await manager.dispose()
 
 
 @pytest.fixture
@@ -3,6 +3,8 @@
 from .contest import ContestFactory
 from .contest_group import ContestGroupFactory
 from .contest_levels import ContestLevelsFactory
+from .contest_participant import ContestParticipantFactory
+from .contest_sync_state import ContestSyncStateFactory
 from .course import CourseFactory
 from .course_levels import CourseLevelsFactory
 from .department import DepartmentFactory
@@ -25,6 +27,8 @@ __all__ = [
     'ContestFactory',
     'ContestGroupFactory',
     'ContestLevelsFactory',
+    'ContestParticipantFactory',
+    'ContestSyncStateFactory',
     'CourseFactory',
     'CourseLevelsFactory',
     'DepartmentFactory',
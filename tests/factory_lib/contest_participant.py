@@ -0,0 +1,15 @@
+# Code generated automatically.
+# pylint: disable=duplicate-code
+
+from factory import Factory, Faker, fuzzy
+
+from app.database.models import ContestParticipant
+
+
+class ContestParticipantFactory(Factory):
+    class Meta:
+        model = ContestParticipant
+
+    contest_id = Faker('uuid4')
+    login = fuzzy.FuzzyText()
+    author_id = fuzzy.FuzzyInteger(1, 10000)
@@ -0,0 +1,19 @@
+# Code generated automatically.
+# pylint: disable=duplicate-code
+
+from factory import Factory, Faker, fuzzy
+
+from app.database.models import ContestSyncState
+
+
+class ContestSyncStateFactory(Factory):
+    class Meta:
+        model = ContestSyncState
+
+    contest_id = Faker('uuid4')
+    last_run_id = fuzzy.FuzzyInteger(1, 10000)
+    remote_count = fuzzy.FuzzyInteger(1, 10000)
+    synced_at = Faker('date_time')
+    sync_duration = fuzzy.FuzzyFloat(0, 100)
+    submissions_rate = fuzzy.FuzzyFloat(0, 100)
+    next_sync_at = Faker('date_time')
@@ -23,3 +23,5 @@ class SubmissionFactory(Factory):
     score_before_finish = fuzzy.FuzzyFloat(0, 1)
     submission_link = fuzzy.FuzzyText()
     submission_time = Faker('date_time')
+    verdict_checks_count = fuzzy.FuzzyInteger(1, 10000)
+    next_verdict_check_at = Faker('date_time')
@@ -1,6 +1,15 @@
 import argparse
 
-from tools import gen, hash_password, load_config, open_sqlalchemy, run_job
+from tools import (
+    bench_settings,
+    bench_update_results,
+    bench_yandex_client,
+    gen,
+    hash_password,
+    load_config,
+    open_sqlalchemy,
+    run_job,
+)
 
 
 if __name__ == '__main__':
@@ -21,6 +30,12 @@ if __name__ == '__main__':
     match args.tool_name:
         case 'runjob':
             run_job.main(*args.tool_args)
+        case 'bench-yandex-client':
+            bench_yandex_client.main(*args.tool_args)
+        case 'bench-update-results':
+            bench_update_results.main(*args.tool_args)
+        case 'bench-settings':
+            bench_settings.main(*args.tool_args)
         case 'gen':
             gen.main(*args.tool_args)
         case 'sqlalchemy':
@@ -0,0 +1,30 @@
+import timeit
+
+from loguru import logger
+
+from app.config import DefaultSettings, get_settings, reload_settings
+
+
+def _per_call(func, calls_count: int) -> float:  # type: ignore
+    # the best of repeats is the least disturbed by other processes
+    return min(timeit.repeat(func, number=calls_count, repeat=5)) / calls_count
+
+
+def main(calls_count: str = '1000', calls_per_request: str = '5') -> None:
+    """
+    Benchmark of getting settings, which is done several times on every
+    request: three times to authenticate user, once for every request
+    to Yandex Contest API and for every Telegram message.
+    """
+    reload_settings()
+    uncached = _per_call(DefaultSettings, int(calls_count))
+    cached = _per_call(get_settings, int(calls_count))
+    for name, per_call in (('Uncached', uncached), ('Cached', cached)):
+        logger.info(
+            '{}: {:.2f}us per call, {:.2f}us per request with {} calls',
+            name,
+            per_call * 1e6,
+            per_call * int(calls_per_request) * 1e6,
+            calls_per_request,
+        )
+    logger.info('Speedup {:.0f}x', uncached / cached)
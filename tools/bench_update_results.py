@@ -0,0 +1,144 @@
+import asyncio
+import os
+import sys
+import time
+import typing as tp
+from urllib import parse
+
+from loguru import logger
+
+from app.config import reload_settings
+from app.database import models
+from app.utils import common as common_utils
+from app.utils import contest as contest_utils
+from app.utils import yandex_request
+from tools.fake_yandex_server import FakeYandexServer
+
+
+def _make_handler(
+    submissions_count: int,
+) -> tp.Callable[[str, str], tp.Any]:
+    def _submission(run_id: int) -> dict[str, tp.Any]:
+        return {
+            'id': run_id,
+            'authorId': run_id % 50,
+            'problemId': f'problem-{run_id % 5}',
+            'problemAlias': 'ABCDE'[run_id % 5],
+            'verdict': 'OK',
+        }
+
+    def _full_submission(run_id: int) -> dict[str, tp.Any]:
+        return {
+            **_submission(run_id),
+            'runId': run_id,
+            'participantInfo': {'login': f'student-{run_id % 50}'},
+            'submissionTime': '2026-10-18T12:00:00.000Z',
+            'finalScore': '1',
+        }
+
+    def _handler(_: str, path: str) -> tp.Any:
+        url = parse.urlsplit(path)
+        query = parse.parse_qs(url.query)
+        if url.path.endswith('/submissions/multiple'):
+            return [
+                _full_submission(int(run_id)) for run_id in query['runIds']
+            ]
+        page, page_size = int(query['page'][0]), int(query['pageSize'][0])
+        # the newest submissions first
+        run_ids = range(submissions_count, 0, -1)[
+            (page - 1) * page_size : page * page_size
+        ]
+        return {
+            'count': submissions_count,
+            'submissions': [_submission(run_id) for run_id in run_ids],
+        }
+
+    return _handler
+
+
+async def _sync_contests(contests_count: int, concurrency: int) -> float:
+    contests = [
+        models.Contest(yandex_contest_id=i) for i in range(contests_count)
+    ]
+    start = time.perf_counter()
+    await common_utils.gather_bounded(
+        [
+            contest_utils.get_new_submissions(
+                contest, -1, logger=logger.bind(quiet=True)
+            )
+            for contest in contests
+        ],
+        asyncio.Semaphore(concurrency),
+    )
+    return time.perf_counter() - start
+
+
+async def bench(
+    contests_count: int,
+    submissions_count: int,
+    concurrency_levels: list[int],
+    latency: float,
+) -> None:
+    server = FakeYandexServer(
+        latency=latency, handler=_make_handler(submissions_count)
+    )
+    base_url = await server.start()
+    if server.cert_file is not None:
+        os.environ['SSL_CERT_FILE'] = str(server.cert_file)
+    os.environ['YANDEX_CONTEST_API_URL'] = base_url.rstrip('/')
+    os.environ.setdefault('YANDEX_API_KEY', 'bench-token')
+    # the rate limit of a real token would cap the speedup,
+    # set it explicitly to measure the sync under it
+    os.environ.setdefault('YANDEX_API_RATE_LIMIT', '10000')
+    os.environ.setdefault('YANDEX_API_RATE_BURST', '10000')
+    os.environ.setdefault('YANDEX_API_MAX_CONCURRENCY', '100')
+    reload_settings()
+    logger.info(
+        'Fake Yandex Contest API started on {} (latency {}s), '
+        '{} contests with {} submissions',
+        base_url,
+        latency,
+        contests_count,
+        submissions_count,
+    )
+    try:
+        sequential_time = None
+        for concurrency in concurrency_levels:
+            server.requests_count = 0
+            total = await _sync_contests(contests_count, concurrency)
+            sequential_time = sequential_time or total
+            logger.info(
+                'Concurrency {}: {} requests in {:.3f}s, speedup {:.2f}x',
+                concurrency,
+                server.requests_count,
+                total,
+                sequential_time / total,
+            )
+    finally:
+        await yandex_request.close_yandex_client()
+        await server.stop()
+
+
+def main(
+    contests_count: str = '16',
+    submissions_count: str = '250',
+    concurrency_levels: str = '1,2,4,8,16',
+    latency: str = '0.05',
+) -> None:
+    """
+    Benchmark of fetching new submissions of contests, which is
+    the network-bound part of update_results, by concurrency level.
+    """
+    # per-request logs of the API helper would dominate the output
+    logger.remove()
+    logger.add(
+        sys.stderr, filter=lambda record: 'quiet' not in record['extra']
+    )
+    asyncio.run(
+        bench(
+            int(contests_count),
+            int(submissions_count),
+            [int(level) for level in concurrency_levels.split(',')],
+            float(latency),
+        )
+    )
@@ -0,0 +1,111 @@
+import asyncio
+import os
+import statistics
+import sys
+import time
+import typing as tp
+
+import httpx
+from loguru import logger
+
+from app.config import reload_settings
+from app.utils import yandex_request
+from tools.fake_yandex_server import FakeYandexServer
+
+
+async def _legacy_request(url: str, timeout: int) -> None:
+    # previous behaviour: a new client (and connection) per request
+    async with httpx.AsyncClient() as client:
+        response = await client.get(url, timeout=timeout)
+        response.raise_for_status()
+
+
+async def _run(
+    request: tp.Callable[[], tp.Awaitable[tp.Any]],
+    requests_count: int,
+    concurrency: int,
+) -> tuple[float, list[float]]:
+    semaphore = asyncio.Semaphore(concurrency)
+    latencies: list[float] = []
+
+    async def _timed() -> None:
+        async with semaphore:
+            start = time.perf_counter()
+            await request()
+            latencies.append(time.perf_counter() - start)
+
+    start = time.perf_counter()
+    await asyncio.gather(*[_timed() for _ in range(requests_count)])
+    return time.perf_counter() - start, latencies
+
+
+def _report(
+    name: str,
+    total: float,
+    latencies: list[float],
+    server: FakeYandexServer,
+) -> None:
+    latencies = sorted(latencies)
+    logger.info(
+        '{}: {} requests in {:.3f}s, p50 {:.2f}ms, p95 {:.2f}ms, '
+        '{} connections opened',
+        name,
+        len(latencies),
+        total,
+        statistics.median(latencies) * 1000,
+        latencies[int(len(latencies) * 0.95) - 1] * 1000,
+        server.connections_count,
+    )
+
+
+async def bench(requests_count: int, concurrency: int, latency: float) -> None:
+    server = FakeYandexServer(latency=latency)
+    base_url = await server.start()
+    if server.cert_file is not None:
+        os.environ['SSL_CERT_FILE'] = str(server.cert_file)
+    os.environ['YANDEX_CONTEST_API_URL'] = base_url.rstrip('/')
+    os.environ.setdefault('YANDEX_API_KEY', 'bench-token')
+    # the shared client goes through the rate governor, which would
+    # throttle it below the client per request, so the governor is
+    # opened up to compare only connection handling
+    os.environ['YANDEX_API_RATE_LIMIT'] = '0'
+    os.environ['YANDEX_API_MAX_CONCURRENCY'] = str(concurrency)
+    reload_settings()
+    logger.info(
+        'Fake Yandex Contest API started on {} (latency {}s)',
+        base_url,
+        latency,
+    )
+    try:
+        total, latencies = await _run(
+            lambda: _legacy_request(f'{base_url}contests/1', timeout=10),
+            requests_count,
+            concurrency,
+        )
+        _report('Client per request', total, latencies, server)
+
+        server.connections_count = 0
+        total, latencies = await _run(
+            lambda: yandex_request.make_request_to_yandex_contest_api(
+                'contests/1', logger=logger.bind(quiet=True), timeout=10
+            ),
+            requests_count,
+            concurrency,
+        )
+        _report('Shared client', total, latencies, server)
+    finally:
+        await yandex_request.close_yandex_client()
+        await server.stop()
+
+
+def main(
+    requests_count: str = '500',
+    concurrency: str = '10',
+    latency: str = '0.005',
+) -> None:
+    # per-request logs of the API helper would dominate the output
+    logger.remove()
+    logger.add(
+        sys.stderr, filter=lambda record: 'quiet' not in record['extra']
+    )
+    asyncio.run(bench(int(requests_count), int(concurrency), float(latency)))
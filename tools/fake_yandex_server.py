@@ -0,0 +1,125 @@
+import asyncio
+import json
+import pathlib
+import shutil
+import ssl
+import subprocess
+import tempfile
+import typing as tp
+
+
+class FakeYandexServer:
+    """
+    Minimal HTTP/1.1 server with keep-alive imitating Yandex Contest API.
+
+    It is used by benchmarks to measure the client side of the
+    submissions sync without touching the real API.
+    """
+
+    def __init__(
+        self,
+        latency: float = 0.0,
+        use_tls: bool = True,
+        handler: tp.Callable[[str, str], tp.Any] | None = None,
+    ) -> None:
+        self.latency = latency
+        self.use_tls = use_tls
+        self.handler = handler or (lambda method, path: {'ok': True})
+        self.connections_count = 0
+        self.requests_count = 0
+        self.cert_file: pathlib.Path | None = None
+        self._server: asyncio.AbstractServer | None = None
+        self._tmp_dir: str | None = None
+
+    async def start(self) -> str:
+        ssl_context = self._make_ssl_context() if self.use_tls else None
+        self._server = await asyncio.start_server(
+            self._handle_connection, '127.0.0.1', 0, ssl=ssl_context
+        )
+        port = self._server.sockets[0].getsockname()[1]
+        scheme = 'https' if ssl_context else 'http'
+        return f'{scheme}://localhost:{port}/'
+
+    async def stop(self) -> None:
+        if self._server is not None:
+            self._server.close()
+            await self._server.wait_closed()
+        if self._tmp_dir is not None:
+            shutil.rmtree(self._tmp_dir, ignore_errors=True)
+
+    def _make_ssl_context(self) -> ssl.SSLContext | None:
+        if shutil.which('openssl') is None:
+            self.use_tls = False
+            return None
+        self._tmp_dir = tempfile.mkdtemp()
+        self.cert_file = pathlib.Path(self._tmp_dir) / 'cert.pem'
+        key_file = pathlib.Path(self._tmp_dir) / 'key.pem'
+        subprocess.run(
+            [
+                'openssl',
+                'req',
+                '-x509',
+                '-newkey',
+                'rsa:2048',
+                '-nodes',
+                '-days',
+                '1',
+                '-subj',
+                '/CN=localhost',
+                '-addext',
+                'subjectAltName=DNS:localhost,IP:127.0.0.1',
+                '-keyout',
+                str(key_file),
+                '-out',
+                str(self.cert_file),
+            ],
+            check=True,
+            capture_output=True,
+        )
+        context = ssl.create_default_context(ssl.Purpose.CLIENT_AUTH)
+        context.load_cert_chain(self.cert_file, key_file)
+        return context
+
+    async def _handle_connection(
+        self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter
+    ) -> None:
+        self.connections_count += 1
+        try:
+            while True:
+                request_line = await reader.readline()
+                if not request_line:
+                    break
+                method, path, _ = request_line.decode().split(' ', 2)
+                headers = {}
+                while (line := await reader.readline()) not in (
+                    b'\r\n',
+                    b'',
+                ):
+                    key, value = line.decode().split(':', 1)
+                    headers[key.strip().lower()] = value.strip()
+                if int(headers.get('content-length', 0)):
+                    await reader.readexactly(int(headers['content-length']))
+                self.requests_count += 1
+                if self.latency:
+                    await asyncio.sleep(self.latency)
+                status_code, body = self._make_response(method, path)
+                writer.write(
+                    f'HTTP/1.1 {status_code} OK\r\n'
+                    f'Content-Type: application/json\r\n'
+                    f'Content-Length: {len(body)}\r\n'
+                    f'Connection: keep-alive\r\n\r\n'.encode() + body
+                )
+                await writer.drain()
+                if headers.get('connection', '').lower() == 'close':
+                    break
+        except (ConnectionError, asyncio.IncompleteReadError, ssl.SSLError):
+            pass
+        finally:
+            writer.close()
+
+    def _make_response(self, method: str, path: str) -> tuple[int, bytes]:
+        result = self.handler(method, path.lstrip('/'))
+        status_code = 200
+        if isinstance(result, tuple):
+            status_code, result = result
+        return status_code, json.dumps(result).encode()